@@ -22,23 +22,43 @@ Notlar:
 from __future__ import annotations
 
 import argparse
+import bisect
+import bz2
 import csv
+import gzip
+import hashlib
+import heapq
+import importlib.util
+import io
+import itertools
 import json
 import logging
+import lzma
+import math
+import mmap
 import os
+import shutil
+import sys
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Sequence, Tuple
 import random
-import hashlib
+
+# faker yalnızca metin havuzu önbelleği yokken içe aktarılır (içe aktarma ve
+# Faker(locale) kurulumu başlangıcı belirgin yavaşlatır)
+_FAKER_AVAILABLE = importlib.util.find_spec('faker') is not None
 
 try:
-	from faker import Faker  # type: ignore
-	_FAKER_AVAILABLE = True
+	import numpy as np  # type: ignore
+	_NUMPY_AVAILABLE = True
 except Exception:  # pragma: no cover
-	_FAKER_AVAILABLE = False
-	Faker = None  # type: ignore
+	_NUMPY_AVAILABLE = False
+	np = None  # type: ignore
 
 
 LOGGER = logging.getLogger("datagen")
@@ -49,6 +69,23 @@ def setup_logging(verbose: bool):
 	logging.basicConfig(level=level, format='%(asctime)s %(levelname)s %(message)s')
 
 
+def write_json_atomic(path: Path, data, indent: Optional[int] = 2):
+	"""JSON dosyasını geçici dosya üzerinden atomik yazar"""
+	path.parent.mkdir(parents=True, exist_ok=True)
+	tmp = path.with_suffix('.tmp')
+	with tmp.open('w', encoding='utf-8') as f:
+		json.dump(data, f, ensure_ascii=False, indent=indent)
+	os.replace(tmp, path)
+
+
+def load_json(path: Path, default=None):
+	try:
+		with path.open('r', encoding='utf-8') as f:
+			return json.load(f)
+	except (OSError, ValueError):
+		return default
+
+
 @dataclass
 class EmailRecord:
 	id: str
@@ -87,6 +124,9 @@ EMAIL_CSV_COLUMNS = [
 
 OUTPUT_COLUMNS = EMAIL_CSV_COLUMNS + ['account', 'source_file', 'synthetic_flag']
 
+# Başlıkta olmayan kolonlar için kullanılan değerler (EMAIL_CSV_COLUMNS sırasıyla)
+_MISSING_COLUMN_DEFAULTS = ['', '', '', '', '', '', '0', '0']
+
 # Varsayılan klasör havuzu (karışık üretim için)
 DEFAULT_FOLDER_POOL = [
 	'Outlook veri dosyasının en üstü/Gelen Kutusu',
@@ -102,6 +142,423 @@ DEFAULT_FOLDER_POOL = [
 # Ağırlıklar (uzun vadede dağılım kontrolü)
 DEFAULT_FOLDER_WEIGHTS = [0.42, 0.18, 0.07, 0.06, 0.05, 0.08, 0.08, 0.06]
 
+# Kolon bazlı kayıt kümesinde (EmailBatch) satır sayısı
+BATCH_ROWS = 50_000
+
+# Paralel okumada işçi başına önden bekletilen görev (hesap veya aralık) sayısı
+INGEST_PREFETCH = 2
+
+# Bu boyuttan büyük CSV'ler paralel okumada kayıt sınırına hizalı bayt
+# aralıklarına bölünür (her aralık bir işçi görevi)
+CSV_RANGE_BYTES = 64 * 1024 * 1024
+MMAP_SCAN_BYTES = 4 * 1024 * 1024
+
+# delivery_time kolonu epoch saniyesi olarak saklanır ('YYYY-MM-DD HH:MM:SS')
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def _take(values: array, indices) -> array:
+	"""array kolonundan verilen satırları seçer"""
+	if _NUMPY_AVAILABLE and len(indices):
+		return array(values.typecode, np.frombuffer(values, dtype=values.typecode).take(indices).tobytes())
+	return array(values.typecode, [values[i] for i in indices])
+
+
+class DictColumn:
+	"""Sözlük kodlamalı metin kolonu: her farklı değer bir kez saklanır,
+	satırlarda yalnızca kodu tutulur (folder, account, source_file)"""
+
+	def __init__(self):
+		self.values: List[str] = []
+		self.codes = array('I')
+		self._index: Dict[str, int] = {}
+
+	@classmethod
+	def from_codes(cls, values: Sequence[str], codes: array) -> 'DictColumn':
+		column = cls()
+		column.values = list(values)
+		column._index = {value: code for code, value in enumerate(column.values)}
+		column.codes = codes
+		return column
+
+	@classmethod
+	def constant(cls, value: str, n: int) -> 'DictColumn':
+		return cls.from_codes([value], array('I', [0]) * n)
+
+	def map_values(self, fn) -> 'DictColumn':
+		"""Değerleri fn ile dönüştürülmüş kolon (fn birebir olmalı)"""
+		return DictColumn.from_codes([fn(value) for value in self.values], self.codes)
+
+	def take(self, indices) -> 'DictColumn':
+		return DictColumn.from_codes(self.values, _take(self.codes, indices))
+
+	def append(self, value: str):
+		code = self._index.get(value)
+		if code is None:
+			code = self._index[value] = len(self.values)
+			self.values.append(value)
+		self.codes.append(code)
+
+	def extend(self, values: Iterable[str]):
+		index = self._index
+		codes = []
+		for value in values:
+			code = index.get(value)
+			if code is None:
+				code = index[value] = len(self.values)
+				self.values.append(value)
+			codes.append(code)
+		self.codes.extend(codes)
+
+	def extend_constant(self, value: str, n: int):
+		code = self._index.get(value)
+		if code is None:
+			code = self._index[value] = len(self.values)
+			self.values.append(value)
+		self.codes.extend(array('I', [code]) * n)
+
+	def __len__(self):
+		return len(self.codes)
+
+	def __getitem__(self, i: int) -> str:
+		return self.values[self.codes[i]]
+
+	def __iter__(self) -> Iterator[str]:
+		return map(self.values.__getitem__, self.codes)
+
+	def counts(self) -> Dict[str, int]:
+		"""Değer başına satır sayısı (ilk görülme sırasıyla)"""
+		if _NUMPY_AVAILABLE and self.codes:
+			counts = np.bincount(np.frombuffer(self.codes, dtype=np.uint32), minlength=len(self.values)).tolist()
+		else:
+			counts = [0] * len(self.values)
+			for code in self.codes:
+				counts[code] += 1
+		return dict(zip(self.values, counts))
+
+
+class IntColumn:
+	"""Tam sayı kolonu. Metne birebir geri dönmeyen değerler (boş, '1.0',
+	'007', taşma) aynen saklanır ve yazarken geri verilir."""
+
+	def __init__(self, typecode: str = 'q'):
+		self.values = array(typecode)
+		self.raw: Dict[int, str] = {}
+
+	@classmethod
+	def from_values(cls, values: array) -> 'IntColumn':
+		column = cls()
+		column.values = values
+		return column
+
+	def take(self, indices) -> 'IntColumn':
+		column = type(self).from_values(_take(self.values, indices))
+		if self.raw:
+			for out, i in enumerate(indices):
+				if i in self.raw:
+					column.raw[out] = self.raw[i]
+		return column
+
+	def append(self, value: int):
+		self.values.append(value)
+
+	def append_text(self, text: str):
+		if text.isascii() and text.isdigit() and (text[0] != '0' or len(text) == 1):
+			try:
+				self.values.append(int(text))
+				return
+			except OverflowError:
+				pass
+		self.raw[len(self.values)] = text
+		self.values.append(0)
+
+	def extend_text(self, texts: Sequence[str]):
+		"""append_text'in toplu hali; önce hepsini tek seferde çevirmeyi dener"""
+		if all(text.isascii() and text.isdigit() and (text[0] != '0' or len(text) == 1) for text in texts):
+			start = len(self.values)
+			try:
+				self.values.extend(map(int, texts))
+				return
+			except OverflowError:
+				del self.values[start:]
+		for text in texts:
+			self.append_text(text)
+
+	def __len__(self):
+		return len(self.values)
+
+	def valid(self) -> array:
+		"""Metinden çevrilebilmiş (raw dışındaki) değerler"""
+		if not self.raw:
+			return self.values
+		return array(self.values.typecode, (v for i, v in enumerate(self.values) if i not in self.raw))
+
+	def text(self, i: int) -> str:
+		return self.raw[i] if i in self.raw else str(self.values[i])
+
+	def texts(self) -> List[str]:
+		texts = [str(v) for v in self.values]
+		for i, text in self.raw.items():
+			texts[i] = text
+		return texts
+
+
+class TimeColumn(IntColumn):
+	"""delivery_time kolonu: 'YYYY-MM-DD HH:MM:SS' değerleri epoch saniyesi
+	(numpy varsa datetime64[s] olarak yazılır), diğerleri aynen saklanır"""
+
+	def __init__(self):
+		super().__init__('q')
+
+	def append_text(self, text: str):
+		if len(text) == 19 and text[10] == ' ':
+			try:
+				dt = datetime.fromisoformat(text)
+			except ValueError:
+				dt = None
+			if dt is not None and dt.isoformat(' ') == text:
+				self.values.append((dt - _EPOCH) // _SECOND)
+				return
+		self.raw[len(self.values)] = text
+		self.values.append(0)
+
+	def extend_text(self, texts: Sequence[str]):
+		for text in texts:
+			self.append_text(text)
+
+	def text(self, i: int) -> str:
+		return self.raw[i] if i in self.raw else (_EPOCH + timedelta(seconds=self.values[i])).isoformat(' ')
+
+	def texts(self) -> List[str]:
+		if _NUMPY_AVAILABLE and self.values:
+			seconds = np.frombuffer(self.values, dtype=np.int64).astype('datetime64[s]')
+			texts = np.char.replace(np.datetime_as_string(seconds, unit='s'), 'T', ' ').tolist()
+		else:
+			texts = [(_EPOCH + timedelta(seconds=v)).isoformat(' ') for v in self.values]
+		for i, text in self.raw.items():
+			texts[i] = text
+		return texts
+
+
+class EmailBatch:
+	"""E-posta kayıtlarının kolon bazlı, sıkı temsili. Serbest metinler liste,
+	size/attachments_count tam sayı dizisi, delivery_time epoch saniyesi,
+	folder/account/source_file sözlük kodlamalı tutulur. Satır başına
+	EmailRecord nesnesi oluşturulmaz; yazıcı doğrudan kolonlardan serileştirir."""
+
+	def __init__(self):
+		self.id: List[str] = []
+		self.folder = DictColumn()
+		self.subject: List[str] = []
+		self.sender_name: List[str] = []
+		self.sender_email: List[str] = []
+		self.delivery_time = TimeColumn()
+		self.size = IntColumn('q')
+		self.attachments_count = IntColumn('i')
+		self.account = DictColumn()
+		self.source_file = DictColumn()
+		self.synthetic_flag = array('b')
+
+	def append(self, id: str, folder: str, subject: str, sender_name: str, sender_email: str,
+			delivery_time: str, size: str, attachments_count: str, account: str, source_file: str,
+			synthetic_flag: int = 0):
+		self.id.append(id)
+		self.folder.append(folder)
+		self.subject.append(subject)
+		self.sender_name.append(sender_name)
+		self.sender_email.append(sender_email)
+		self.delivery_time.append_text(delivery_time)
+		self.size.append_text(size)
+		self.attachments_count.append_text(attachments_count)
+		self.account.append(account)
+		self.source_file.append(source_file)
+		self.synthetic_flag.append(synthetic_flag)
+
+	def append_record(self, r: EmailRecord):
+		self.append(r.id, r.folder, r.subject, r.sender_name, r.sender_email, r.delivery_time,
+			r.size, r.attachments_count, r.account, r.source_file, r.synthetic_flag)
+
+	def extend_rows(self, rows: Sequence[Sequence[str]], positions: Sequence[Optional[int]],
+			account: str, source_file: str):
+		"""csv.reader satırlarını kolon kolon ekler. positions, OUTPUT_COLUMNS
+		sırasıyla her kolonun satırdaki indeksidir (None: başlıkta yok).
+		account/source_file/synthetic_flag kolonları varsa (geri beslenen
+		birleştirilmiş dosya) satırdan, yoksa verilen değerlerden alınır."""
+		n = len(rows)
+		width = max((p for p in positions if p is not None), default=-1) + 1
+		if any(len(row) < width for row in rows):
+			rows = [row if len(row) >= width else row + [''] * (width - len(row)) for row in rows]
+		columns = [
+			[row[p] for row in rows] if p is not None else None
+			for p in positions
+		]
+		for i, default in enumerate(_MISSING_COLUMN_DEFAULTS):
+			if columns[i] is None:
+				columns[i] = [default] * n
+		ids, folders, subjects, sender_names, sender_emails, times, sizes, attachments, accounts, sources, flags = columns
+		self.id.extend(ids)
+		self.folder.extend(folders)
+		self.subject.extend(subjects)
+		self.sender_name.extend(sender_names)
+		self.sender_email.extend(sender_emails)
+		self.delivery_time.extend_text(times)
+		self.size.extend_text(sizes)
+		self.attachments_count.extend_text(attachments)
+		if accounts is None:
+			self.account.extend_constant(account, n)
+		else:
+			self.account.extend(accounts)
+		if sources is None:
+			self.source_file.extend_constant(source_file, n)
+		else:
+			self.source_file.extend(sources)
+		if flags is None:
+			self.synthetic_flag.frombytes(bytes(n))
+		else:
+			self.synthetic_flag.extend([1 if flag == '1' else 0 for flag in flags])
+
+	@classmethod
+	def from_records(cls, records: Iterable[EmailRecord]) -> 'EmailBatch':
+		batch = cls()
+		for r in records:
+			batch.append_record(r)
+		return batch
+
+	def __len__(self):
+		return len(self.id)
+
+	def record(self, i: int) -> EmailRecord:
+		return EmailRecord(
+			id=self.id[i],
+			folder=self.folder[i],
+			subject=self.subject[i],
+			sender_name=self.sender_name[i],
+			sender_email=self.sender_email[i],
+			delivery_time=self.delivery_time.text(i),
+			size=self.size.text(i),
+			attachments_count=self.attachments_count.text(i),
+			account=self.account[i],
+			source_file=self.source_file[i],
+			synthetic_flag=self.synthetic_flag[i],
+		)
+
+	def __iter__(self) -> Iterator[EmailRecord]:
+		return (self.record(i) for i in range(len(self)))
+
+	def take(self, indices) -> 'EmailBatch':
+		"""Verilen satırlardan oluşan yeni EmailBatch (filtreleme, örnekleme)"""
+		batch = EmailBatch()
+		batch.id = [self.id[i] for i in indices]
+		batch.folder = self.folder.take(indices)
+		batch.subject = [self.subject[i] for i in indices]
+		batch.sender_name = [self.sender_name[i] for i in indices]
+		batch.sender_email = [self.sender_email[i] for i in indices]
+		batch.delivery_time = self.delivery_time.take(indices)
+		batch.size = self.size.take(indices)
+		batch.attachments_count = self.attachments_count.take(indices)
+		batch.account = self.account.take(indices)
+		batch.source_file = self.source_file.take(indices)
+		batch.synthetic_flag = _take(self.synthetic_flag, indices)
+		return batch
+
+	def rows(self, columns: Sequence[str] = OUTPUT_COLUMNS) -> Iterator[tuple]:
+		"""İstenen kolonların (varsayılan OUTPUT_COLUMNS) metin satırları"""
+		texts = {
+			'id': self.id,
+			'folder': self.folder,
+			'subject': self.subject,
+			'sender_name': self.sender_name,
+			'sender_email': self.sender_email,
+			'delivery_time': self.delivery_time.texts(),
+			'size': self.size.texts(),
+			'attachments_count': self.attachments_count.texts(),
+			'account': self.account,
+			'source_file': self.source_file,
+			'synthetic_flag': map(str, self.synthetic_flag),
+		}
+		return zip(*(texts[c] for c in columns))
+
+	def records(self) -> List[EmailRecord]:
+		"""Tüm satırlar EmailRecord listesi olarak (kolonlar toplu metne çevrilir)"""
+		return [EmailRecord(*row, synthetic_flag=flag) for row, flag in zip(self.rows(OUTPUT_COLUMNS[:-1]), self.synthetic_flag)]
+
+
+# generate_accounts --inbox-only klasörü
+INBOX_FOLDER = 'Outlook veri dosyasının en üstü/Gelen Kutusu'
+
+# Demo hesaplarda ek sayısı dağılımı (0, 1, 2, 3 ek)
+ATTACHMENT_COUNT_WEIGHTS = [0.7, 0.2, 0.08, 0.02]
+
+# Teslim zamanları referans zamandan en fazla bu kadar öncedir (dakika çözünürlüğünde)
+SYNTHETIC_MAX_AGE = timedelta(days=365, hours=23, minutes=59)
+ACCOUNT_MAX_AGE = timedelta(days=30)
+
+# Metin havuzu önbelleği dizini (locale başına text_pool_<locale>.json)
+TEXT_POOL_DIR = Path(os.environ.get('DATAGEN_CACHE_DIR', Path.home() / '.cache' / 'datagen'))
+
+# Havuz boyutları; konular kelime havuzundan, adresler kullanıcı adı x alan adı
+# birleşiminden örneklenir
+TEXT_POOL_NAMES = 5_000
+TEXT_POOL_USER_NAMES = 5_000
+
+# Birleştirilmiş çıktı sıkıştırma codec'leri: ad -> (dosya uzantısı, sıkıştırma)
+COMPRESSION_CODECS = {
+	'none': ('', None),
+	'gzip': ('.gz', partial(gzip.compress, compresslevel=6, mtime=0)),
+	'bz2': ('.bz2', bz2.compress),
+	'lzma': ('.xz', lzma.compress),
+}
+
+# --stdout akış biçimleri
+STREAM_FORMATS = ('ndjson', 'csv')
+_NDJSON_LINE = '{' + ', '.join(f'"{c}": %s' for c in OUTPUT_COLUMNS) + '}\n'
+
+# Parça dosyaları bu büyüklükteki bloklar halinde bağımsız sıkıştırılıp sırayla
+# yazılır (çok üyeli gzip/bz2/xz akışı; standart okuyucular tek akış gibi açar)
+SHARD_CHUNK_BYTES = 4 * 1024 * 1024
+# Bayt sınırlı parçalarda sınırın kontrol edildiği satır adımı
+SHARD_ROW_STEP = 1_000
+
+# Artımlı birleştirme (--incremental): out_dir altındaki durum dizini. Hesap
+# başına parçalar ve toplamlar (aggregates.json) accounts/<hesap>/g<nesil>/
+# altında, sentetik parçalar synthetic/g<nesil>/ altında tutulur; her çalıştırma
+# yeni bir nesle yazar, eski nesiller yeni manifest yazıldıktan sonra silinir.
+# merge_state.json hesapların kaynak dosya bilgilerini, satır sayılarını,
+# parçalarını ve son neslini saklar
+INCREMENTAL_DIR = 'incremental'
+INCREMENTAL_STATE_FILE = 'merge_state.json'
+# Hesap başına saklanan şablon örneği ve gönderen sayısı (sentetik üretim ve
+# istatistikler değişmeyen hesapları yeniden okumadan birleştirilir)
+ACCOUNT_TEMPLATE_SAMPLE = 50
+ACCOUNT_SENDER_CAPACITY = 200
+# Değişince tüm hesapların yeniden yazılmasını gerektiren çıktı seçenekleri
+_LAYOUT_OPTIONS = ('shard_rows', 'shard_bytes', 'compression')
+
+# --seed verilip --reference-time verilmezse teslim zamanlarının (ve dosya
+# adlarındaki zaman damgasının) referansı; çıktı çalıştırma anından bağımsız olur
+SEEDED_REFERENCE_TIME = datetime(2025, 1, 1)
+# iter_synthetic'in kayıtları ürettiği kolon batch'i (çıktı, istenen liste
+# boyutundan bağımsız olarak bu boyutta üretilir)
+SYNTHETIC_GENERATION_ROWS = 10_000
+
+# Sentetik üretimde şablon olarak kullanılmak üzere akıştan örneklenen kayıt sayısı
+TEMPLATE_SAMPLE_SIZE = 10_000
+
+# İstatistiklerde sayılan en fazla farklı gönderen (Space-Saving sayacı;
+# bu sayı aşılmadıkça sayımlar kesin, aşılınca üst sınırdır)
+SENDER_COUNTER_CAPACITY = 100_000
+TOP_SENDERS = 10
+
+# Dağılım profili (--write-profile / --from-profile): boyut histogramı
+# oktav başına PROFILE_SIZE_BINS_PER_OCTAVE logaritmik kutu kullanır
+PROFILE_VERSION = 1
+PROFILE_SIZE_BINS_PER_OCTAVE = 4
+PROFILE_SIZE_EDGES = sorted({0} | {round(2 ** (k / PROFILE_SIZE_BINS_PER_OCTAVE)) for k in range(48 * PROFILE_SIZE_BINS_PER_OCTAVE)})
+# Teslim zamanı şekli: haftanın günü (Pazartesi=0) x saat hücreleri
+_DAY = 86_400
+_WEEK = 7 * _DAY
+
 
 def find_latest_email_csv(account_dir: Path) -> Optional[Path]:
 	candidates = sorted(account_dir.glob('emails_*.csv'))
@@ -121,102 +578,1078 @@ def find_latest_email_csv(account_dir: Path) -> Optional[Path]:
 	return candidates[0]
 
 
-def load_emails(csv_path: Path, account: str) -> List[EmailRecord]:
-	records: List[EmailRecord] = []
+def _header_positions(header: Sequence[str], csv_path) -> List[Optional[int]]:
+	"""OUTPUT_COLUMNS sırasıyla kolonların başlıktaki indeksleri"""
+	missing = [c for c in EMAIL_CSV_COLUMNS if c not in header]
+	if missing:
+		LOGGER.warning("Eksik kolon(lar) %s (%s)", missing, csv_path)
+	return [header.index(c) if c in header else None for c in OUTPUT_COLUMNS]
+
+
+def _iter_row_batches(reader, positions: Sequence[Optional[int]], account: str, source_file: str,
+		batch_rows: int = BATCH_ROWS) -> Iterator[EmailBatch]:
+	while True:
+		chunk = list(itertools.islice(reader, batch_rows))
+		if not chunk:
+			break
+		# DictReader gibi boş satırlar atlanır
+		rows = [row for row in chunk if row]
+		if rows:
+			batch = EmailBatch()
+			batch.extend_rows(rows, positions, account, source_file)
+			yield batch
+
+
+def iter_email_batches(csv_path: Path, account: str, batch_rows: int = BATCH_ROWS) -> Iterator[EmailBatch]:
+	"""emails_*.csv satırlarını en fazla batch_rows satırlık EmailBatch'ler
+	halinde okur (dosya belleğe alınmaz). Kolon indeksleri başlıktan bir kez
+	çözülür; satırlar csv.reader ile konumsal okunup kolon kolon eklenir."""
 	try:
 		with csv_path.open('r', encoding='utf-8') as f:
-			reader = csv.DictReader(f)
-			missing = [c for c in EMAIL_CSV_COLUMNS if c not in reader.fieldnames]
-			if missing:
-				LOGGER.warning("Eksik kolon(lar) %s (%s)", missing, csv_path)
-			for row in reader:
-				try:
-					rec = EmailRecord(
-						id=row.get('id', ''),
-						folder=row.get('folder', ''),
-						subject=row.get('subject', ''),
-						sender_name=row.get('sender_name', ''),
-						sender_email=row.get('sender_email', ''),
-						delivery_time=row.get('delivery_time', ''),
-						size=str(row.get('size', '0')),
-						attachments_count=str(row.get('attachments_count', '0')),
-						account=account,
-						source_file=str(csv_path),
-					)
-					records.append(rec)
-				except Exception as e:  # pragma: no cover
-					LOGGER.debug("Satır atlandı (%s): %s", csv_path, e)
+			reader = csv.reader(f)
+			header = next(reader, None)
+			if header is None:
+				return
+			yield from _iter_row_batches(reader, _header_positions(header, csv_path), account, str(csv_path), batch_rows)
 	except FileNotFoundError:
 		LOGGER.error("Dosya bulunamadı: %s", csv_path)
-	return records
-
-
-def generate_synthetic(base_records: List[EmailRecord], count: int, locale: str = 'tr_TR') -> List[EmailRecord]:
-	if count <= 0 or not base_records:
-		return []
-	faker = Faker(locale) if _FAKER_AVAILABLE else None
-	synthetic: List[EmailRecord] = []
-	for _ in range(count):
-		template = random.choice(base_records)
-		# Yeni subject ve sender üret
-		if faker:
-			new_subject = faker.sentence(nb_words=random.randint(3, 9)).rstrip('.')
-			sender_name = faker.name()
-			sender_email = faker.email()
-		else:  # Basit degrade fallback
-			new_subject = template.subject + f" #{random.randint(1,999)}"
-			sender_name = template.sender_name or "Sender"
-			sender_email = template.sender_email or f"user{random.randint(1,999)}@example.com"
-		# Random tarih - son 365 gün
-		dt = datetime.now() - timedelta(days=random.randint(0, 365), hours=random.randint(0, 23), minutes=random.randint(0, 59))
-		delivery_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-		# ID üretimi
-		raw_id = f"{new_subject}{sender_email}{delivery_time}{random.random()}".encode()
-		rec_id = hashlib.md5(raw_id).hexdigest()[:16]
-		synth = EmailRecord(
-			id=rec_id,
-			folder=template.folder,
-			subject=new_subject,
-			sender_name=sender_name,
-			sender_email=sender_email,
-			delivery_time=delivery_time,
-			size=template.size,
-			attachments_count=template.attachments_count,
-			account=template.account + "_synthetic",
-			source_file='synthetic',
-			synthetic_flag=1,
+
+
+def _count_quotes(csv_path: Path, start: int, end: int) -> int:
+	"""[start, end) aralığındaki tırnak sayısı (işçi süreçte, dosyayı kendisi eşler)"""
+	count = 0
+	with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+		for pos in range(start, end, MMAP_SCAN_BYTES):
+			count += mm[pos:min(pos + MMAP_SCAN_BYTES, end)].count(b'"')
+	return count
+
+
+def _record_boundary(mm: mmap.mmap, pos: int, quoted: bool) -> int:
+	"""pos'tan sonra tırnak dışında kalan ilk satır sonunun bir sonrası (kayıt
+	başı). quoted: pos'a kadarki tırnak sayısı tek mi (alan içinde miyiz)."""
+	while True:
+		newline = mm.find(b'\n', pos)
+		if newline < 0:
+			return len(mm)
+		quoted ^= bool(mm[pos:newline].count(b'"') & 1)
+		if not quoted:
+			return newline + 1
+		pos = newline + 1
+
+
+def split_csv_ranges(csv_path: Path, range_bytes: int = CSV_RANGE_BYTES,
+		executor: ProcessPoolExecutor = None) -> Tuple[List[str], List[Tuple[int, int]]]:
+	"""Dosyayı kayıt sınırlarına hizalı bayt aralıklarına böler; (başlık,
+	aralıklar) döndürür. Tırnak içindeki satır sonları (çok satırlı konular)
+	sınır sayılmaz: her ham aralığın tırnak sayısı (executor varsa paralel)
+	sayılır, önek toplamının tekliği kesim noktasında alan içinde olup
+	olmadığımızı verir; kesim, oradan sonraki ilk tırnak dışı satır sonuna
+	kaydırılır. Tırnaklar CSV'de çift kaçışlandığından ("") teklik doğrudur."""
+	size = os.path.getsize(csv_path)
+	if not size:
+		return [], []
+	with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+		data_start = _record_boundary(mm, 0, False)
+		header = next(csv.reader(io.StringIO(mm[:data_start].decode('utf-8'))), [])
+		cuts = list(range(data_start, size, range_bytes))
+		ends = cuts[1:] + [size]
+		count = partial(_count_quotes, csv_path)
+		counts = list(executor.map(count, cuts, ends) if executor else map(count, cuts, ends))
+		bounds = [data_start]
+		quotes = 0
+		for cut, cut_quotes in zip(cuts[1:], counts):
+			quotes += cut_quotes
+			boundary = _record_boundary(mm, cut, bool(quotes & 1))
+			if boundary > bounds[-1]:
+				bounds.append(boundary)
+		if bounds[-1] < size:
+			bounds.append(size)
+	return header, list(zip(bounds, bounds[1:]))
+
+
+def read_csv_range(csv_path: Path, start: int, end: int, positions: Sequence[Optional[int]],
+		account: str, batch_rows: int = BATCH_ROWS) -> List[EmailBatch]:
+	"""Dosyanın [start, end) bayt aralığını (kayıt sınırlarına hizalı) işçi
+	süreçte mmap ile okuyup EmailBatch'lere çevirir; ebeveyne ham veri değil
+	yalnızca kolon dizileri döner"""
+	with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+		text = io.TextIOWrapper(io.BytesIO(mm[start:end]), encoding='utf-8')
+	return list(_iter_row_batches(csv.reader(text), positions, account, str(csv_path), batch_rows))
+
+
+def _csv_range_tasks(csv_path: Path, account: str, executor: ProcessPoolExecutor,
+		range_bytes: int = CSV_RANGE_BYTES, batch_rows: int = BATCH_ROWS) -> Iterator[Tuple]:
+	header, ranges = split_csv_ranges(csv_path, range_bytes, executor)
+	if not header:
+		return
+	positions = _header_positions(header, csv_path)
+	LOGGER.debug("%s: %d bayt aralığına bölündü", csv_path, len(ranges))
+	for start, end in ranges:
+		yield account, read_csv_range, (csv_path, start, end, positions, account, batch_rows)
+
+
+def _iter_ordered(executor: ProcessPoolExecutor, tasks: Iterable[Tuple], window: int) -> Iterator[Tuple]:
+	"""(anahtar, fonksiyon, argümanlar) görevlerini havuzda çalıştırır ve
+	sonuçları görev sırasıyla (anahtar, sonuç) verir; aynı anda en fazla
+	window görev bekler (bellek sınırı)"""
+	tasks = iter(tasks)
+	pending = deque()
+
+	def submit():
+		for key, fn, args in itertools.islice(tasks, 1):
+			pending.append((key, executor.submit(fn, *args)))
+
+	for _ in range(window):
+		submit()
+	while pending:
+		key, future = pending.popleft()
+		result = future.result()
+		submit()
+		yield key, result
+
+
+def iter_csv_batches(csv_path: Path, account: str, workers: int = 1, range_bytes: int = CSV_RANGE_BYTES,
+		batch_rows: int = BATCH_ROWS) -> Iterator[EmailBatch]:
+	"""Tek (büyük) CSV'yi bayt aralıklarına bölüp workers süreçte paralel
+	okur; batch'ler dosya sırasıyla döner. Hesap CSV'si ya da geri beslenen
+	merged_emails_*.csv olabilir (account/source_file kolonları korunur)."""
+	if workers <= 1 or not csv_path.exists() or csv_path.stat().st_size <= range_bytes:
+		yield from iter_email_batches(csv_path, account, batch_rows)
+		return
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		tasks = _csv_range_tasks(csv_path, account, executor, range_bytes, batch_rows)
+		for _, batches in _iter_ordered(executor, tasks, workers * INGEST_PREFETCH):
+			yield from batches
+
+
+def read_account_batches(csv_path: Path, account: str, batch_rows: int = BATCH_ROWS) -> List[EmailBatch]:
+	"""Hesap CSV'sinin tüm batch'leri (işçi süreçte çağrılır; kolon dizileri
+	satır başına nesneye göre çok daha küçük serileştirilir)"""
+	return list(iter_email_batches(csv_path, account, batch_rows))
+
+
+def iter_account_batches(sources: Sequence[Tuple[str, Path]], workers: int = 1,
+		batch_rows: int = BATCH_ROWS) -> Iterator[Tuple[str, Iterable[EmailBatch]]]:
+	"""(hesap, csv yolu) listesini verilen sırayla (hesap, batch'ler) olarak
+	döndürür. workers > 1 ise dosyalar süreç havuzunda paralel okunur;
+	CSV_RANGE_BYTES'tan büyük dosyalar ayrıca bayt aralıklarına bölünür. Sıra
+	korunur ve en fazla workers * INGEST_PREFETCH görev önden bekletilir."""
+	if workers <= 1:
+		for account, csv_path in sources:
+			yield account, iter_email_batches(csv_path, account, batch_rows)
+		return
+
+	def tasks(executor):
+		for account, csv_path in sources:
+			if csv_path.exists() and csv_path.stat().st_size > CSV_RANGE_BYTES:
+				yield from _csv_range_tasks(csv_path, account, executor, batch_rows=batch_rows)
+			else:
+				yield account, read_account_batches, (csv_path, account, batch_rows)
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		results = _iter_ordered(executor, tasks(executor), workers * INGEST_PREFETCH)
+		for account, group in itertools.groupby(results, key=lambda result: result[0]):
+			yield account, (batch for _, batches in group for batch in batches)
+
+
+def iter_emails(csv_path: Path, account: str) -> Iterator[EmailRecord]:
+	"""emails_*.csv satırlarını tek tek EmailRecord olarak okur"""
+	for batch in iter_email_batches(csv_path, account):
+		yield from batch
+
+
+def load_emails(csv_path: Path, account: str) -> List[EmailRecord]:
+	return list(iter_emails(csv_path, account))
+
+
+def iter_record_batches(records: Iterable[EmailRecord], batch_rows: int = BATCH_ROWS) -> Iterator[EmailBatch]:
+	"""EmailRecord akışını EmailBatch'lere toplar"""
+	batch = EmailBatch()
+	for r in records:
+		batch.append_record(r)
+		if len(batch) >= batch_rows:
+			yield batch
+			batch = EmailBatch()
+	if len(batch):
+		yield batch
+
+
+class ReservoirSample:
+	"""Akıştan sabit boyutlu, düzgün dağılımlı örnek. Örnek dolduktan sonra
+	atlanacak kayıt sayısı doğrudan çekilir (Algorithm L); böylece toplu
+	eklemede yalnızca seçilen satırlar EmailRecord'a dönüştürülür."""
+
+	def __init__(self, size: int = TEMPLATE_SAMPLE_SIZE, rng: Optional[random.Random] = None):
+		self.size = size
+		self.items: List[EmailRecord] = []
+		self.seen = 0
+		self._rng = rng or random
+		self._w = 1.0
+		self._next = 0  # Örneğe girecek sonraki kaydın sıra numarası (1'den başlar)
+
+	def _uniform(self) -> float:
+		u = self._rng.random()
+		while u == 0.0:
+			u = self._rng.random()
+		return u
+
+	def _schedule(self, position: int):
+		self._w *= math.exp(math.log(self._uniform()) / self.size)
+		self._next = position + int(math.log(self._uniform()) / math.log1p(-self._w)) + 1
+
+	def add(self, item: EmailRecord):
+		self.seen += 1
+		if len(self.items) < self.size:
+			self.items.append(item)
+			if len(self.items) == self.size:
+				self._schedule(self.seen)
+		elif self.seen == self._next:
+			self.items[self._rng.randrange(self.size)] = item
+			self._schedule(self.seen)
+
+	def add_batch(self, batch: EmailBatch):
+		n = len(batch)
+		start = 0
+		while start < n and len(self.items) < self.size:
+			self.add(batch.record(start))
+			start += 1
+		base = self.seen - start  # batch[0] kaydının sıra numarası base + 1
+		end = base + n
+		while start < n and self._next <= end:
+			self.items[self._rng.randrange(self.size)] = batch.record(self._next - base - 1)
+			self._schedule(self._next)
+		self.seen = end
+
+
+class SenderCounter:
+	"""Space-Saving algoritmasıyla en sık görülen gönderenleri sabit bellekte
+	sayar. En fazla capacity farklı gönderen tutulur; sayaç doluyken yeni bir
+	gönderen en küçük sayacı devralır (eski sayı + kendi sayısı). Farklı
+	gönderen sayısı capacity'yi aşmadıkça sayımlar kesindir; aştığında her
+	sayım gerçek değerin üst sınırıdır ve fazlalık toplam/capacity'yi geçmez,
+	sık görülen bir gönderen akışın neresinde olursa olsun düşürülmez."""
+
+	def __init__(self, capacity: int):
+		self.capacity = capacity
+		self.counts: Dict[str, int] = {}
+		# Hiç sayaç devredilmediyse sayımlar kesindir
+		self.exact = True
+		# (sayı, gönderen) min-heap; artışlar heap'e yazılmaz, eski girdiler
+		# yalnızca en küçük sayaç aranırken düzeltilir
+		self._heap: List[Tuple[int, str]] = []
+
+	def add(self, sender: str, count: int = 1):
+		counts = self.counts
+		if sender in counts:
+			counts[sender] += count
+			return
+		if len(counts) >= self.capacity:
+			count += self._pop_min()
+			self.exact = False
+		counts[sender] = count
+		heapq.heappush(self._heap, (count, sender))
+
+	def _pop_min(self) -> int:
+		"""En küçük sayacı çıkarır ve sayısını döndürür"""
+		while True:
+			count, sender = heapq.heappop(self._heap)
+			current = self.counts[sender]
+			if current == count:
+				del self.counts[sender]
+				return count
+			heapq.heappush(self._heap, (current, sender))
+
+	def most_common(self, n: int) -> List[Tuple[str, int]]:
+		return sorted(self.counts.items(), key=lambda x: x[1], reverse=True)[:n]
+
+
+class MergeStats:
+	"""Birleştirilen kayıtların istatistiklerini akış halinde, sabit bellekte
+	biriktirir (gönderen sayımları SenderCounter ile yaklaşık)"""
+
+	def __init__(self, sender_capacity: int = SENDER_COUNTER_CAPACITY):
+		self.total_records = 0
+		self.synthetic_records = 0
+		self.accounts: Dict[str, int] = {}
+		self.senders = SenderCounter(sender_capacity)
+
+	def add(self, r: EmailRecord):
+		self.total_records += 1
+		if r.synthetic_flag:
+			self.synthetic_records += 1
+		self.accounts[r.account] = self.accounts.get(r.account, 0) + 1
+		if r.sender_email:
+			self.senders.add(r.sender_email)
+
+	def add_batch(self, batch: EmailBatch):
+		"""Kolonlar üzerinden toplu sayım (hesaplar kod dizisinden, gönderenler
+		önce batch içinde sayılıp sayaca ağırlıklı eklenir)"""
+		self.total_records += len(batch)
+		self.synthetic_records += batch.synthetic_flag.count(1)
+		for account, count in batch.account.counts().items():
+			self.accounts[account] = self.accounts.get(account, 0) + count
+		counts: Dict[str, int] = {}
+		for sender in batch.sender_email:
+			if sender:
+				counts[sender] = counts.get(sender, 0) + 1
+		add = self.senders.add
+		for sender, count in counts.items():
+			add(sender, count)
+
+	def merge_account(self, account: str, rows: int, senders: Dict[str, int]):
+		"""Önceden hesaplanmış hesap toplamlarını ekler (artımlı birleştirme)"""
+		self.total_records += rows
+		self.accounts[account] = self.accounts.get(account, 0) + rows
+		for sender, count in senders.items():
+			self.senders.add(sender, count)
+
+	def top_senders(self, n: int = TOP_SENDERS):
+		return self.senders.most_common(n)
+
+	def top_sender_counts(self, n: int) -> Dict[str, int]:
+		return dict(self.top_senders(n))
+
+
+def epoch_seconds(dt: datetime) -> int:
+	return (dt - _EPOCH) // _SECOND
+
+
+class BatchRandom:
+	"""Toplu rastgele değer üretici: numpy varsa numpy.random.Generator ile
+	her kolonu tek çağrıda, yoksa random.Random ile üretir. Tüm metotlar n
+	değerlik array kolonu döndürür."""
+
+	def __init__(self, seed=None):
+		self._np = np.random.default_rng(seed) if _NUMPY_AVAILABLE else None
+		self._py = None if _NUMPY_AVAILABLE else random.Random(seed)
+
+	def integers(self, low: int, high: int, n: int) -> array:
+		"""[low, high] aralığında tam sayılar"""
+		if self._np is not None:
+			return array('q', self._np.integers(low, high, size=n, endpoint=True, dtype=np.int64).tobytes())
+		randint = self._py.randint
+		return array('q', [randint(low, high) for _ in range(n)])
+
+	def choices(self, k: int, n: int, weights: Sequence[float] = None) -> array:
+		"""range(k) içinden (ağırlıklı) seçilmiş indeksler"""
+		if self._np is not None:
+			p = None if weights is None else np.asarray(weights, dtype=np.float64) / sum(weights)
+			return array('I', self._np.choice(k, size=n, p=p).astype(np.uint32).tobytes())
+		return array('I', self._py.choices(range(k), weights=weights, k=n))
+
+	def below(self, highs: Sequence[int]) -> array:
+		"""Her eleman için [0, high) aralığında tam sayı (high >= 1)"""
+		if self._np is not None:
+			return array('q', self._np.integers(0, np.asarray(highs, dtype=np.int64)).astype(np.int64).tobytes())
+		randrange = self._py.randrange
+		return array('q', [randrange(high) for high in highs])
+
+	def times_before(self, reference: int, max_age: timedelta, n: int) -> array:
+		"""reference (epoch saniyesi) öncesinde, en fazla max_age geride,
+		dakika çözünürlüğünde zamanlar"""
+		max_minutes = int(max_age.total_seconds()) // 60
+		if self._np is not None:
+			minutes = self._np.integers(0, max_minutes, size=n, endpoint=True, dtype=np.int64)
+			return array('q', (reference - minutes * 60).tobytes())
+		randint = self._py.randint
+		return array('q', [reference - randint(0, max_minutes) * 60 for _ in range(n)])
+
+	def hex_ids(self, n: int) -> List[str]:
+		"""16 karakterlik rastgele onaltılık ID'ler"""
+		raw = (self._np.bytes(8 * n) if self._np is not None else self._py.randbytes(8 * n)).hex()
+		return [raw[i:i + 16] for i in range(0, 16 * n, 16)]
+
+
+def account_seeds(master_seed: int, index: int) -> Tuple[object, int]:
+	"""Ana tohumdan hesap index'i için bağımsız tohumlar türetir
+	(numpy varsa SeedSequence.spawn ile aynı düzen). Dönen değerler:
+	kayıtlar ve posta kutusu adı için BatchRandom tohumları."""
+	if _NUMPY_AVAILABLE:
+		sequence = np.random.SeedSequence(master_seed, spawn_key=(index,))
+		return sequence, int(sequence.generate_state(1, dtype=np.uint64)[0])
+	digest = hashlib.blake2b(f"{master_seed}/{index}".encode(), digest_size=16).digest()
+	return int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big')
+
+
+class TextPool:
+	"""Locale'e özgü metin havuzları (isimler, kullanıcı adları, alan adları,
+	konu kelimeleri). Faker ile bir kez kurulup diske yazılır; sonraki
+	çalıştırmalarda faker içe aktarılmadan yüklenir. Konu ve gönderenler
+	BatchRandom ile toplu örneklenir; aynı havuz ve tohumla çıktı aynıdır."""
+
+	def __init__(self, locale: str, names: List[str], user_names: List[str], domains: List[str], words: List[str]):
+		self.locale = locale
+		self.names = names
+		self.user_names = user_names
+		self.domains = domains
+		self.words = words
+		self._capitalized = [w[:1].upper() + w[1:] for w in words]
+
+	@classmethod
+	def build(cls, locale: str) -> 'TextPool':
+		"""Havuzları Faker ile üretir (sabit tohumla: aynı faker sürümünde aynı havuz)"""
+		from faker import Faker  # type: ignore
+		faker = Faker(locale)
+		faker.seed_instance(0)
+		words = faker.get_words_list() if hasattr(faker, 'get_words_list') else faker.words(nb=1_000)
+		return cls(
+			locale=locale,
+			names=[faker.name() for _ in range(TEXT_POOL_NAMES)],
+			user_names=[faker.user_name() for _ in range(TEXT_POOL_USER_NAMES)],
+			domains=sorted({faker.safe_domain_name() for _ in range(100)}),
+			words=sorted(set(words)),
 		)
-		synthetic.append(synth)
-	return synthetic
 
+	@classmethod
+	def load(cls, path: Path) -> 'TextPool':
+		with path.open('r', encoding='utf-8') as f:
+			data = json.load(f)
+		return cls(data['locale'], data['names'], data['user_names'], data['domains'], data['words'])
 
-def write_merged(records: List[EmailRecord], out_dir: Path) -> Path:
-	out_dir.mkdir(parents=True, exist_ok=True)
-	ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-	out_csv = out_dir / f"merged_emails_{ts}.csv"
-	with out_csv.open('w', newline='', encoding='utf-8') as f:
-		writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS)
-		writer.writeheader()
-		for r in records:
-			writer.writerow(r.to_row())
-	LOGGER.info("Birleştirilmiş CSV: %s (%d kayıt)", out_csv, len(records))
-	return out_csv
+	def save(self, path: Path):
+		write_json_atomic(path, {
+			'locale': self.locale,
+			'names': self.names,
+			'user_names': self.user_names,
+			'domains': self.domains,
+			'words': self.words,
+		}, indent=None)
+
+	def subjects(self, rnd: BatchRandom, n: int, min_words: int, max_words: int) -> List[str]:
+		"""faker.sentence benzeri konular: ilk kelime büyük harfle, sonda nokta yok"""
+		counts = rnd.integers(min_words - 1, max_words - 1, n)
+		firsts = rnd.choices(len(self.words), n)
+		words = self.words
+		rest = [words[i] for i in rnd.choices(len(words), sum(counts))]
+		capitalized = self._capitalized
+		subjects = []
+		pos = 0
+		for first, k in zip(firsts, counts):
+			subjects.append(' '.join([capitalized[first], *rest[pos:pos + k]]))
+			pos += k
+		return subjects
+
+	def sender_names(self, rnd: BatchRandom, n: int) -> List[str]:
+		names = self.names
+		return [names[i] for i in rnd.choices(len(names), n)]
+
+	def emails(self, rnd: BatchRandom, n: int) -> List[str]:
+		users, domains = self.user_names, self.domains
+		return [f"{users[u]}@{domains[d]}" for u, d in zip(rnd.choices(len(users), n), rnd.choices(len(domains), n))]
+
+
+_TEXT_POOLS: Dict[str, Optional[TextPool]] = {}
+
+
+def get_text_pool(locale: str, cache_dir: Path = None) -> Optional[TextPool]:
+	"""Locale için metin havuzu: önce önbellekten yüklenir, yoksa Faker ile
+	kurulup önbelleğe yazılır. Önbellek yok ve faker yüklü değilse None
+	(basit metin moduna geçilir). Süreç başına bir kez yüklenir."""
+	path = (cache_dir or TEXT_POOL_DIR) / f"text_pool_{locale}.json"
+	key = str(path)
+	if key in _TEXT_POOLS:
+		return _TEXT_POOLS[key]
+	pool = None
+	if path.exists():
+		try:
+			pool = TextPool.load(path)
+		except (OSError, ValueError, KeyError) as e:
+			LOGGER.warning("Metin havuzu önbelleği okunamadı, yeniden kurulacak (%s): %s", path, e)
+	if pool is None and _FAKER_AVAILABLE:
+		LOGGER.info("Metin havuzu kuruluyor (%s)", locale)
+		pool = TextPool.build(locale)
+		try:
+			pool.save(path)
+			LOGGER.info("Metin havuzu önbelleğe yazıldı: %s", path)
+		except OSError as e:
+			LOGGER.warning("Metin havuzu önbelleğe yazılamadı (%s): %s", path, e)
+	_TEXT_POOLS[key] = pool
+	return pool
+
+
+def synthetic_batch(templates: EmailBatch, n: int, rnd: BatchRandom, reference: int,
+		text: TextPool = None, weights: Sequence[float] = None) -> EmailBatch:
+	"""Şablonlardan n sentetik kayıt: folder, size, attachments_count ve
+	account rastgele (weights verilirse ağırlıklı) seçilen şablondan alınır;
+	ID, teslim zamanı, konu ve gönderen kolonları toplu üretilir"""
+	batch = templates.take(rnd.choices(len(templates), n, weights))
+	if text:
+		batch.subject = text.subjects(rnd, n, 3, 9)
+		batch.sender_name = text.sender_names(rnd, n)
+		batch.sender_email = text.emails(rnd, n)
+	else:  # Basit degrade fallback
+		batch.subject = [f"{subject} #{k}" for subject, k in zip(batch.subject, rnd.integers(1, 999, n))]
+		batch.sender_name = [name or "Sender" for name in batch.sender_name]
+		batch.sender_email = [email or f"user{k}@example.com" for email, k in zip(batch.sender_email, rnd.integers(1, 999, n))]
+	batch.id = rnd.hex_ids(n)
+	batch.delivery_time = TimeColumn.from_values(rnd.times_before(reference, SYNTHETIC_MAX_AGE, n))
+	batch.account = batch.account.map_values(lambda account: account + "_synthetic")
+	batch.source_file = DictColumn.constant('synthetic', n)
+	batch.synthetic_flag = array('b', [1]) * n
+	return batch
+
+
+def account_batch(n: int, rnd: BatchRandom, reference: int, text: TextPool = None, inbox_only: bool = False,
+		start: int = 0) -> EmailBatch:
+	"""Demo hesap için n e-posta (start: hesap içindeki ilk kaydın sırası)"""
+	batch = EmailBatch()
+	if text:
+		batch.sender_name = text.sender_names(rnd, n)
+		batch.sender_email = text.emails(rnd, n)
+		batch.subject = text.subjects(rnd, n, 3, 8)
+	else:
+		batch.sender_name = [f"Sender {j+1}" for j in range(start, start + n)]
+		batch.sender_email = [f"sender{j+1}@example.com" for j in range(start, start + n)]
+		batch.subject = [f"Subject {j+1}" for j in range(start, start + n)]
+	batch.id = rnd.hex_ids(n)
+	batch.delivery_time = TimeColumn.from_values(rnd.times_before(reference, ACCOUNT_MAX_AGE, n))
+	if inbox_only:
+		batch.folder = DictColumn.constant(INBOX_FOLDER, n)
+	else:
+		# Ağırlıklı rastgele klasör seçimi
+		batch.folder = DictColumn.from_codes(DEFAULT_FOLDER_POOL,
+			rnd.choices(len(DEFAULT_FOLDER_POOL), n, DEFAULT_FOLDER_WEIGHTS))
+	batch.size = IntColumn.from_values(rnd.integers(1_000, 50_000, n))
+	batch.attachments_count = IntColumn.from_values(rnd.choices(len(ATTACHMENT_COUNT_WEIGHTS), n, ATTACHMENT_COUNT_WEIGHTS))
+	batch.account = DictColumn.constant('', n)
+	batch.source_file = DictColumn.constant('', n)
+	batch.synthetic_flag = array('b', [0]) * n
+	return batch
+
+
+def iter_synthetic_batches(templates: EmailBatch, count: int, locale: str = 'tr_TR',
+		rnd: BatchRandom = None, batch_rows: int = BATCH_ROWS, seed: int = None,
+		reference_time: datetime = None, text_cache: Path = None,
+		weights: Sequence[float] = None) -> Iterator[EmailBatch]:
+	"""Şablonlardan toplam count sentetik kaydı EmailBatch'ler halinde üretir;
+	teslim zamanları tek bir referans zamana (varsayılan: şimdi) göre
+	hesaplanır. seed verilirse çıktı tekrarlanabilir. weights: şablon seçim
+	ağırlıkları (varsayılan: eşit)."""
+	if count <= 0 or not len(templates):
+		return
+	text = get_text_pool(locale, text_cache)
+	rnd = rnd or BatchRandom(seed)
+	reference = epoch_seconds(reference_time or datetime.now())
+	for start in range(0, count, batch_rows):
+		yield synthetic_batch(templates, min(batch_rows, count - start), rnd, reference, text, weights)
+
+
+def generate_synthetic(base_records: Sequence[EmailRecord], count: int, locale: str = 'tr_TR') -> List[EmailRecord]:
+	return list(iter_generate_synthetic(base_records, count, locale))
+
+
+def iter_generate_synthetic(templates: Sequence[EmailRecord], count: int, locale: str = 'tr_TR') -> Iterator[EmailRecord]:
+	"""Şablon kayıtlardan (ör. ReservoirSample örneği) sentetik kayıtları tek tek üretir"""
+	for batch in iter_synthetic_batches(EmailBatch.from_records(templates), count, locale):
+		yield from batch
+
+
+def _bincount(indices, length: int) -> List[int]:
+	if _NUMPY_AVAILABLE:
+		return np.bincount(np.asarray(indices, dtype=np.int64), minlength=length).tolist()
+	counts = [0] * length
+	for i in indices:
+		counts[i] += 1
+	return counts
+
+
+class CorpusProfile:
+	"""Gerçek kayıtlardan tek akış geçişinde çıkarılan özet dağılımlar:
+	klasör ve hesap sıklıkları, log ölçekli boyut histogramı, ek sayısı
+	dağılımı ve teslim zamanının haftanın günü x saat şekli. Sentetik üretim
+	için tüm derlem yerine birkaç KB'lık bu profil yeterlidir."""
+
+	def __init__(self):
+		self.rows = 0
+		self.folders: Counter = Counter()
+		self.accounts: Counter = Counter()
+		self.size_counts = [0] * len(PROFILE_SIZE_EDGES)
+		self.attachments: Counter = Counter()
+		self.hour_weekday = [0] * (7 * 24)
+
+	def add_batch(self, batch: EmailBatch):
+		"""Batch'in gerçek (sentetik olmayan) satırlarını profile ekler;
+		metne çevrilemeyen boyut/zaman değerleri histogramlara girmez"""
+		if any(batch.synthetic_flag):
+			batch = batch.take([i for i, flag in enumerate(batch.synthetic_flag) if not flag])
+		if not len(batch):
+			return
+		self.rows += len(batch)
+		self.folders.update(batch.folder.counts())
+		self.accounts.update(batch.account.counts())
+		sizes = batch.size.valid()
+		if _NUMPY_AVAILABLE:
+			bins = np.searchsorted(PROFILE_SIZE_EDGES, np.frombuffer(sizes, dtype=np.int64), side='right') - 1
+			seconds = np.frombuffer(batch.delivery_time.valid(), dtype=np.int64)
+			cells = (seconds // _DAY + 3) % 7 * 24 + seconds % _DAY // 3600
+		else:
+			bins = [bisect.bisect_right(PROFILE_SIZE_EDGES, size) - 1 for size in sizes]
+			# 1970-01-01 Perşembe (Pazartesi=0 ile 3)
+			cells = [(t // _DAY + 3) % 7 * 24 + t % _DAY // 3600 for t in batch.delivery_time.valid()]
+		for i, count in enumerate(_bincount(bins, len(self.size_counts))):
+			self.size_counts[i] += count
+		for i, count in enumerate(_bincount(cells, len(self.hour_weekday))):
+			self.hour_weekday[i] += count
+		self.attachments.update(batch.attachments_count.valid())
+
+	def size_bins(self) -> List[Tuple[int, int, int]]:
+		"""Boş olmayan boyut kutuları: (alt sınır, üst sınır hariç, sayı)"""
+		edges = PROFILE_SIZE_EDGES + [PROFILE_SIZE_EDGES[-1] + 1]
+		return [(edges[i], edges[i + 1], count) for i, count in enumerate(self.size_counts) if count]
+
+	def to_dict(self) -> Dict:
+		return {
+			'version': PROFILE_VERSION,
+			'rows': self.rows,
+			'folders': dict(self.folders.most_common()),
+			'accounts': dict(self.accounts.most_common()),
+			'size_bins': [list(b) for b in self.size_bins()],
+			'attachments': {str(k): v for k, v in sorted(self.attachments.items())},
+			'hour_weekday': [self.hour_weekday[d * 24:(d + 1) * 24] for d in range(7)],
+		}
+
+	@classmethod
+	def from_dict(cls, data: Dict) -> 'CorpusProfile':
+		if data.get('version') != PROFILE_VERSION:
+			raise ValueError(f"Desteklenmeyen profil sürümü: {data.get('version')}")
+		profile = cls()
+		profile.rows = data['rows']
+		profile.folders = Counter(data['folders'])
+		profile.accounts = Counter(data['accounts'])
+		for low, _, count in data['size_bins']:
+			profile.size_counts[bisect.bisect_right(PROFILE_SIZE_EDGES, low) - 1] += count
+		profile.attachments = Counter({int(k): v for k, v in data['attachments'].items()})
+		profile.hour_weekday = [count for day in data['hour_weekday'] for count in day]
+		return profile
+
+	def save(self, path: Path, source: str = None):
+		write_json_atomic(path, {**self.to_dict(), 'source': source, 'generated_at': datetime.now().isoformat()})
+
+	@classmethod
+	def load(cls, path: Path) -> 'CorpusProfile':
+		data = load_json(path)
+		if data is None:
+			raise SystemExit(f"Profil okunamadı: {path}")
+		return cls.from_dict(data)
+
+
+def profile_batch(profile: CorpusProfile, n: int, rnd: BatchRandom, reference: int,
+		text: TextPool = None) -> EmailBatch:
+	"""Profilden n sentetik kayıt: folder, account, ek sayısı ve boyut kutusu
+	sıklıklarıyla, boyut kutu içinde eşit, teslim zamanı gün x saat hücresine
+	göre (hücre içinde eşit, SYNTHETIC_MAX_AGE penceresinde) seçilir"""
+	batch = EmailBatch()
+	batch.id = rnd.hex_ids(n)
+	folders = list(profile.folders)
+	batch.folder = DictColumn.from_codes(folders, rnd.choices(len(folders), n, list(profile.folders.values())))
+	accounts = list(profile.accounts)
+	batch.account = DictColumn.from_codes([account + "_synthetic" for account in accounts],
+		rnd.choices(len(accounts), n, list(profile.accounts.values())))
+	size_bins = profile.size_bins()
+	if size_bins:
+		picked = [size_bins[i] for i in rnd.choices(len(size_bins), n, [count for _, _, count in size_bins])]
+		offsets = rnd.below([high - low for low, high, _ in picked])
+		batch.size = IntColumn.from_values(array('q', [low + offset for (low, _, _), offset in zip(picked, offsets)]))
+	else:
+		batch.size = IntColumn.from_values(array('q', bytes(8 * n)))
+	if profile.attachments:
+		counts = list(profile.attachments)
+		batch.attachments_count = IntColumn.from_values(array('i',
+			[counts[i] for i in rnd.choices(len(counts), n, list(profile.attachments.values()))]))
+	else:
+		batch.attachments_count = IntColumn.from_values(array('i', bytes(4 * n)))
+	if any(profile.hour_weekday):
+		cells = rnd.choices(len(profile.hour_weekday), n, profile.hour_weekday)
+		weeks = rnd.integers(0, SYNTHETIC_MAX_AGE.days // 7 - 2, n)
+		seconds = rnd.integers(0, 3599, n)
+		day = reference // _DAY
+		weekday = (day + 3) % 7
+		times = array('q')
+		for cell, week, second in zip(cells, weeks, seconds):
+			t = (day - (weekday - cell // 24) % 7 - 7 * week) * _DAY + cell % 24 * 3600 + second
+			times.append(t - _WEEK if t > reference else t)
+		batch.delivery_time = TimeColumn.from_values(times)
+	else:
+		batch.delivery_time = TimeColumn.from_values(rnd.times_before(reference, SYNTHETIC_MAX_AGE, n))
+	if text:
+		batch.subject = text.subjects(rnd, n, 3, 9)
+		batch.sender_name = text.sender_names(rnd, n)
+		batch.sender_email = text.emails(rnd, n)
+	else:
+		batch.subject = [f"Subject #{k}" for k in rnd.integers(1, 999, n)]
+		batch.sender_name = ["Sender"] * n
+		batch.sender_email = [f"user{k}@example.com" for k in rnd.integers(1, 999, n)]
+	batch.source_file = DictColumn.constant('synthetic', n)
+	batch.synthetic_flag = array('b', [1]) * n
+	return batch
+
+
+def iter_profile_batches(profile: CorpusProfile, count: int, locale: str = 'tr_TR',
+		rnd: BatchRandom = None, batch_rows: int = BATCH_ROWS, seed: int = None,
+		reference_time: datetime = None, text_cache: Path = None) -> Iterator[EmailBatch]:
+	"""Profilden toplam count sentetik kaydı EmailBatch'ler halinde üretir
+	(iter_synthetic_batches'in şablonsuz karşılığı)"""
+	if count <= 0 or not profile.rows:
+		return
+	text = get_text_pool(locale, text_cache)
+	rnd = rnd or BatchRandom(seed)
+	reference = epoch_seconds(reference_time or datetime.now())
+	for start in range(0, count, batch_rows):
+		yield profile_batch(profile, min(batch_rows, count - start), rnd, reference, text)
+
+
+def iter_synthetic(n: int, batch_size: int = 10_000, seed: int = None, profile: CorpusProfile = None,
+		locale: str = 'tr_TR', reference_time: datetime = None, text_cache: Path = None) -> Iterator[List[EmailRecord]]:
+	"""Kütüphane API'si: n sentetik EmailRecord'u en fazla batch_size'lık
+	listeler halinde tembel üretir. Kayıtlar SYNTHETIC_GENERATION_ROWS'luk
+	kolon batch'leriyle üretilip listelere bölünür; bellekte en fazla bir
+	üretim batch'i ve bir liste bulunur. profile verilirse dağılımlar
+	profilden, yoksa demo hesap dağılımlarından gelir. seed verilirse
+	(varsayılan referans zamanı SEEDED_REFERENCE_TIME ile) çıktı
+	tekrarlanabilir ve batch_size'dan bağımsızdır.
+
+	Örnek:
+		for records in iter_synthetic(1_000_000, batch_size=5_000, seed=42):
+			send(records)
+	"""
+	if n < 0:
+		raise ValueError(f"n negatif olamaz: {n!r}")
+	if batch_size < 1:
+		raise ValueError(f"batch_size en az 1 olmalı: {batch_size!r}")
+	if reference_time is None:
+		reference_time = SEEDED_REFERENCE_TIME if seed is not None else datetime.now()
+	if profile is not None:
+		batches = iter_profile_batches(profile, n, locale, batch_rows=SYNTHETIC_GENERATION_ROWS, seed=seed,
+			reference_time=reference_time, text_cache=text_cache)
+	else:
+		batches = _iter_demo_synthetic_batches(n, SYNTHETIC_GENERATION_ROWS, BatchRandom(seed),
+			epoch_seconds(reference_time), get_text_pool(locale, text_cache))
+	return _iter_record_lists(batches, batch_size)
+
+
+def _iter_record_lists(batches: Iterable[EmailBatch], size: int) -> Iterator[List[EmailRecord]]:
+	"""Batch'lerin kayıtlarını en fazla size'lık listeler halinde verir"""
+	records = itertools.chain.from_iterable(batch.records() for batch in batches)
+	while True:
+		chunk = list(itertools.islice(records, size))
+		if not chunk:
+			return
+		yield chunk
+
+
+def _iter_demo_synthetic_batches(n: int, batch_size: int, rnd: BatchRandom, reference: int,
+		text: TextPool = None) -> Iterator[EmailBatch]:
+	for start in range(0, n, batch_size):
+		batch = account_batch(min(batch_size, n - start), rnd, reference, text, start=start)
+		batch.account = DictColumn.constant('synthetic', len(batch))
+		batch.source_file = DictColumn.constant('synthetic', len(batch))
+		batch.synthetic_flag = array('b', [1]) * len(batch)
+		yield batch
+
+
+class MergedCsvWriter:
+	"""Kayıtları merged_emails_<timestamp>.csv dosyasına akış halinde yazar.
+	Hata ile kapanırsa yarım dosya silinir."""
+
+	def __init__(self, out_dir: Path):
+		out_dir.mkdir(parents=True, exist_ok=True)
+		ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+		self.path = out_dir / f"merged_emails_{ts}.csv"
+		self.count = 0
+		self._file = self.path.open('w', newline='', encoding='utf-8')
+		self._writer = csv.writer(self._file)
+		self._writer.writerow(OUTPUT_COLUMNS)
+
+	def write(self, record: EmailRecord):
+		self._writer.writerow([record.to_row()[c] for c in OUTPUT_COLUMNS])
+		self.count += 1
+
+	def write_batch(self, batch: EmailBatch):
+		self._writer.writerows(batch.rows())
+		self.count += len(batch)
+
+	def close(self):
+		self._file.close()
+		LOGGER.info("Birleştirilmiş CSV: %s (%d kayıt)", self.path, self.count)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc, tb):
+		if exc_type is None:
+			self.close()
+		else:
+			self._file.close()
+			self.path.unlink(missing_ok=True)
+
+
+class _Shard:
+	"""Yazılmakta olan parça dosyası: satır/bayt sayıları ve SHA-256"""
+
+	def __init__(self, path: Path):
+		self.path = path
+		self.rows = 0
+		self.uncompressed_bytes = 0
+		self.bytes = 0
+		self._sha256 = hashlib.sha256()
+		self._file = path.open('wb')
+
+	def write(self, data: bytes):
+		self._file.write(data)
+		self._sha256.update(data)
+		self.bytes += len(data)
+
+	def close(self):
+		self._file.close()
+
+	def to_dict(self) -> Dict:
+		return {
+			'file': self.path.name,
+			'rows': self.rows,
+			'bytes': self.bytes,
+			'uncompressed_bytes': self.uncompressed_bytes,
+			'sha256': self._sha256.hexdigest(),
+		}
+
+
+class ShardedCsvWriter:
+	"""Kayıtları merged_emails_<ts>_partNNNNN.csv[.gz|.bz2|.xz] parçalarına
+	yazar; her parça başlık satırıyla başlar ve shard_rows satıra veya
+	shard_bytes (sıkıştırılmamış) bayta ulaşınca yenisine geçilir. Bloklar
+	thread havuzunda sıkıştırılır (zlib/bz2/lzma GIL'i bırakır), böylece
+	sıkıştırma üretimle örtüşür. Kapanışta parçaları, satır sayılarını ve
+	SHA-256 değerlerini listeleyen merged_manifest_<ts>.json yazılır (path).
+	Hata ile kapanırsa yazılan parçalar silinir. prefix/manifest_path ile
+	dosya adları değiştirilebilir (artımlı birleştirmede hesap başına
+	parçalar; bu durumda kapanış özeti DEBUG seviyesinde loglanır)."""
 
+	def __init__(self, out_dir: Path, shard_rows: int = None, shard_bytes: int = None,
+			compression: str = 'gzip', workers: int = 4, prefix: str = None, manifest_path: Path = None):
+		out_dir.mkdir(parents=True, exist_ok=True)
+		ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+		self.out_dir = out_dir
+		self.path = manifest_path or out_dir / f"merged_manifest_{ts}.json"
+		self.compression = compression
+		self.shard_rows = shard_rows
+		self.shard_bytes = shard_bytes
+		self.count = 0
+		self.shards: List[Dict] = []
+		self._prefix = prefix or f"merged_emails_{ts}"
+		self._quiet = prefix is not None
+		self._extension, self._compress = COMPRESSION_CODECS[compression]
+		self._executor = ThreadPoolExecutor(max_workers=workers) if self._compress else None
+		self._max_pending = max(2, 2 * workers)
+		# Sırayla yazılacak (parça, blok future'ı / bayt / parça sonu için None)
+		self._pending = deque()
+		self._shards: List[_Shard] = []
+		self._shard: Optional[_Shard] = None
+		self._text = io.StringIO()
+		self._writer = csv.writer(self._text)
+		self._chunk = bytearray()
 
-def write_stats(all_records: List[EmailRecord], out_dir: Path, merged_csv: Path, synthetic_added: int):
+	def write(self, record: EmailRecord):
+		self.write_batch(EmailBatch.from_records([record]))
+
+	def write_batch(self, batch: EmailBatch):
+		rows = batch.rows()
+		remaining = len(batch)
+		while remaining:
+			if self._shard is None:
+				self._open_shard()
+			take = remaining
+			if self.shard_rows:
+				take = min(take, self.shard_rows - self._shard.rows)
+			if self.shard_bytes:
+				take = min(take, SHARD_ROW_STEP)
+			self._writer.writerows(itertools.islice(rows, take))
+			self._encode()
+			self._shard.rows += take
+			self.count += take
+			remaining -= take
+			if ((self.shard_rows and self._shard.rows >= self.shard_rows)
+					or (self.shard_bytes and self._shard.uncompressed_bytes >= self.shard_bytes)):
+				self._finish_shard()
+
+	def _open_shard(self):
+		name = f"{self._prefix}_part{len(self._shards):05d}.csv{self._extension}"
+		self._shard = _Shard(self.out_dir / name)
+		self._shards.append(self._shard)
+		self._writer.writerow(OUTPUT_COLUMNS)
+
+	def _encode(self):
+		data = self._text.getvalue().encode('utf-8')
+		self._text.seek(0)
+		self._text.truncate()
+		self._shard.uncompressed_bytes += len(data)
+		self._chunk += data
+		if len(self._chunk) >= SHARD_CHUNK_BYTES:
+			self._submit_chunk()
+
+	def _submit_chunk(self):
+		if not self._chunk:
+			return
+		data = bytes(self._chunk)
+		self._chunk.clear()
+		item = self._executor.submit(self._compress, data) if self._compress else data
+		self._pending.append((self._shard, item))
+		self._drain()
+
+	def _finish_shard(self):
+		self._submit_chunk()
+		self._pending.append((self._shard, None))
+		self._shard = None
+		self._drain()
+
+	def _drain(self, wait_all: bool = False):
+		"""Sırası gelen blokları dosyalarına yazar; bekleyen blok sayısı
+		sınırı aşarsa (veya wait_all) en eskisini bekler"""
+		while self._pending:
+			shard, item = self._pending[0]
+			if not (wait_all or len(self._pending) > self._max_pending
+					or item is None or isinstance(item, bytes) or item.done()):
+				break
+			self._pending.popleft()
+			if item is None:
+				shard.close()
+			else:
+				shard.write(item if isinstance(item, bytes) else item.result())
+
+	def close(self):
+		if self._shard is None and not self._shards:
+			self._open_shard()
+		if self._shard is not None:
+			self._encode()
+			self._finish_shard()
+		self._drain(wait_all=True)
+		if self._executor:
+			self._executor.shutdown()
+		self.shards = [shard.to_dict() for shard in self._shards]
+		write_json_atomic(self.path, {
+			'columns': OUTPUT_COLUMNS,
+			'compression': self.compression,
+			'total_rows': self.count,
+			'shards': self.shards,
+			'generated_at': datetime.now().isoformat(),
+		})
+		LOGGER.log(logging.DEBUG if self._quiet else logging.INFO, "Birleştirilmiş çıktı: %d parça, %d kayıt (manifest: %s)",
+			len(self._shards), self.count, self.path)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc, tb):
+		if exc_type is None:
+			self.close()
+			return
+		if self._executor:
+			self._executor.shutdown(cancel_futures=True)
+		for shard in self._shards:
+			shard.close()
+			shard.path.unlink(missing_ok=True)
+
+
+class StreamWriter:
+	"""Kayıtları dosya oluşturmadan standart çıktıya (veya verilen ikili
+	akışa) CSV ya da NDJSON olarak yazar. Her batch kodlanıp tek seferde
+	yazılır ve akış boşaltılır; okuyucu yavaşsa yazma boru tamponu dolunca
+	bloklanır, böylece üretim tüketicinin hızına iner ve bellekte en fazla
+	bir batch bulunur. NDJSON satırları EmailRecord.to_row ile aynı
+	anahtarları (metin değerlerle) taşır."""
+
+	path = None
+
+	def __init__(self, fmt: str = 'ndjson', stream=None):
+		if fmt not in STREAM_FORMATS:
+			raise ValueError(f"Bilinmeyen akış biçimi: {fmt}")
+		self.format = fmt
+		self.count = 0
+		self._stream = stream if stream is not None else sys.stdout.buffer
+		if fmt == 'csv':
+			self._stream.write(self._encode([OUTPUT_COLUMNS]))
+
+	def _encode(self, rows: Iterable[Sequence[str]]) -> bytes:
+		if self.format == 'csv':
+			buffer = io.StringIO()
+			csv.writer(buffer).writerows(rows)
+			return buffer.getvalue().encode('utf-8')
+		quote = json.encoder.encode_basestring
+		return ''.join(_NDJSON_LINE % tuple(map(quote, row)) for row in rows).encode('utf-8')
+
+	def _encode_ndjson(self, batch: EmailBatch) -> bytes:
+		"""json.dumps(..., ensure_ascii=False) ile aynı satırlar; değerler kolon
+		kolon C kaçışlayıcıyla tırnaklanıp satır şablonuna yerleştirilir"""
+		quote = json.encoder.encode_basestring
+		columns = []
+		for name in OUTPUT_COLUMNS:
+			column = getattr(batch, name)
+			if isinstance(column, DictColumn):
+				# Sözlük kodlu kolonlarda her farklı değer bir kez tırnaklanır
+				quoted = list(map(quote, column.values))
+				columns.append(map(quoted.__getitem__, column.codes))
+			elif isinstance(column, IntColumn):
+				columns.append(map(quote, column.texts()))
+			elif isinstance(column, array):
+				columns.append(map(quote, map(str, column)))
+			else:
+				columns.append(map(quote, column))
+		return ''.join(map(_NDJSON_LINE.__mod__, zip(*columns))).encode('utf-8')
+
+	def write(self, record: EmailRecord):
+		row = record.to_row()
+		self._stream.write(self._encode([[row[c] for c in OUTPUT_COLUMNS]]))
+		self.count += 1
+
+	def write_batch(self, batch: EmailBatch):
+		self._stream.write(self._encode_ndjson(batch) if self.format == 'ndjson' else self._encode(batch.rows()))
+		self._stream.flush()
+		self.count += len(batch)
+
+	def close(self):
+		self._stream.flush()
+		LOGGER.info("Standart çıktıya yazıldı: %d kayıt (%s)", self.count, self.format)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc, tb):
+		if exc_type is None:
+			self.close()
+
+
+def open_merged_writer(out_dir: Path, shard_rows: int = None, shard_bytes: int = None,
+		compression: str = 'none', compress_workers: int = 4, stream_format: str = None):
+	"""stream_format verilmişse StreamWriter (standart çıktı), parçalama veya
+	sıkıştırma istenmişse ShardedCsvWriter, yoksa tek dosyalık MergedCsvWriter
+	döndürür (hepsi write/write_batch/path/count sunar)"""
+	if stream_format:
+		return StreamWriter(stream_format)
+	if shard_rows or shard_bytes or compression != 'none':
+		return ShardedCsvWriter(out_dir, shard_rows, shard_bytes, compression, compress_workers)
+	return MergedCsvWriter(out_dir)
+
+
+def write_merged(records: Iterable[EmailRecord], out_dir: Path) -> Path:
+	with MergedCsvWriter(out_dir) as writer:
+		for batch in iter_record_batches(records):
+			writer.write_batch(batch)
+	return writer.path
+
+
+def write_stats(stats: MergeStats, out_dir: Path, merged_csv: Optional[Path]):
+	if merged_csv is None:
+		# Standart çıktıya akışta diske yazılmaz
+		LOGGER.info("Toplam %d kayıt (%d sentetik), %d hesap", stats.total_records,
+			stats.synthetic_records, len(stats.accounts))
+		return
 	ts = datetime.now().strftime('%Y%m%d_%H%M%S')
 	stats_path = out_dir / f"stats_{ts}.json"
-	per_account: Dict[str, int] = {}
-	senders: Dict[str, int] = {}
-	for r in all_records:
-		per_account[r.account] = per_account.get(r.account, 0) + 1
-		if r.sender_email:
-			senders[r.sender_email] = senders.get(r.sender_email, 0) + 1
 	data = {
-		'total_records': len(all_records),
-		'synthetic_records': synthetic_added,
-		'accounts': per_account,
-		'top_senders': sorted(senders.items(), key=lambda x: x[1], reverse=True)[:10],
+		'total_records': stats.total_records,
+		'synthetic_records': stats.synthetic_records,
+		'accounts': stats.accounts,
+		'top_senders': stats.top_senders(),
+		# False ise top_senders sayımları yaklaşık (gerçek değerin üst sınırı)
+		'top_senders_exact': stats.senders.exact,
 		'output_csv': str(merged_csv),
 		'generated_at': datetime.now().isoformat(),
 	}
@@ -225,89 +1658,356 @@ def write_stats(all_records: List[EmailRecord], out_dir: Path, merged_csv: Path,
 	LOGGER.info("İstatistikler kaydedildi: %s", stats_path)
 
 
-def process(metadata_dir: Path, out_dir: Path, synthesize: int) -> None:
+def find_account_sources(metadata_dir: Path) -> List[Tuple[str, Path]]:
+	"""Hesap klasörleri (ada göre sıralı) ve en güncel emails_*.csv dosyaları"""
 	if not metadata_dir.exists():
 		raise SystemExit(f"Metadata dizini bulunamadı: {metadata_dir}")
-	account_dirs = [p for p in metadata_dir.iterdir() if p.is_dir()]
+	account_dirs = sorted(p for p in metadata_dir.iterdir() if p.is_dir())
 	if not account_dirs:
 		raise SystemExit("Hiç hesap klasörü bulunamadı")
 	LOGGER.info("%d hesap klasörü bulundu", len(account_dirs))
-	all_records: List[EmailRecord] = []
+	sources: List[Tuple[str, Path]] = []
 	for acc_dir in account_dirs:
 		latest_csv = find_latest_email_csv(acc_dir)
 		if not latest_csv:
 			LOGGER.warning("emails_*.csv bulunamadı: %s", acc_dir)
 			continue
-		records = load_emails(latest_csv, acc_dir.name)
-		LOGGER.info("%s -> %d kayıt", acc_dir.name, len(records))
-		all_records.extend(records)
-	if not all_records:
+		sources.append((acc_dir.name, latest_csv))
+	return sources
+
+
+def process(metadata_dir: Path, out_dir: Path, synthesize: int, seed: int = None,
+		reference_time: datetime = None, locale: str = 'tr_TR', text_cache: Path = None,
+		writer_options: Dict = None, workers: int = 1) -> None:
+	"""Hesap CSV'lerini EmailBatch'ler halinde birleştirilmiş dosyaya aktarır.
+	Bellekte yalnızca o anki batch, istatistikler ve sentetik üretim için
+	şablon örneği tutulur. Hesaplar ada göre sıralı işlenir; seed verilirse
+	şablon örneği ve sentetik kayıtlar tekrarlanabilir. writer_options
+	open_merged_writer'a geçirilir (parçalama/sıkıştırma). workers > 1 ise
+	hesap CSV'leri süreç havuzunda okunur (çıktı aynıdır)."""
+	sources = find_account_sources(metadata_dir)
+	stats = MergeStats()
+	templates = ReservoirSample(TEMPLATE_SAMPLE_SIZE, random.Random(seed) if seed is not None else None)
+	with open_merged_writer(out_dir, **(writer_options or {})) as writer:
+		for account, batches in iter_account_batches(sources, workers):
+			count = 0
+			for batch in batches:
+				writer.write_batch(batch)
+				stats.add_batch(batch)
+				templates.add_batch(batch)
+				count += len(batch)
+			LOGGER.info("%s -> %d kayıt", account, count)
+		if not stats.total_records:
+			raise SystemExit("Hiç kayıt yüklenemedi")
+		if synthesize:
+			synthetic = iter_synthetic_batches(EmailBatch.from_records(templates.items), synthesize, locale,
+				seed=seed, reference_time=reference_time, text_cache=text_cache)
+			for batch in synthetic:
+				writer.write_batch(batch)
+				stats.add_batch(batch)
+			LOGGER.info("Sentetik kayıt üretildi: %d", stats.synthetic_records)
+	write_stats(stats, out_dir, writer.path)
+
+
+def build_profile(metadata_dir: Path, profile_path: Path, workers: int = 1) -> CorpusProfile:
+	"""Hesap CSV'lerinden tek akış geçişinde dağılım profili çıkarıp
+	profile_path'e (JSON) yazar"""
+	profile = CorpusProfile()
+	for _, batches in iter_account_batches(find_account_sources(metadata_dir), workers):
+		for batch in batches:
+			profile.add_batch(batch)
+	if not profile.rows:
 		raise SystemExit("Hiç kayıt yüklenemedi")
-	synthetic_records: List[EmailRecord] = []
+	profile.save(profile_path, source=str(metadata_dir))
+	LOGGER.info("Profil kaydedildi: %s (%d kayıt, %d klasör, %d hesap)", profile_path, profile.rows,
+		len(profile.folders), len(profile.accounts))
+	return profile
+
+
+def process_profile(profile_path: Path, out_dir: Path, synthesize: int, seed: int = None,
+		reference_time: datetime = None, locale: str = 'tr_TR', text_cache: Path = None,
+		writer_options: Dict = None) -> None:
+	"""Derlem okumadan, yalnızca profilden synthesize sentetik kayıt üretip
+	birleştirilmiş çıktı biçiminde (parçalama/sıkıştırma dahil) yazar"""
+	if synthesize <= 0:
+		raise SystemExit("--from-profile ile üretilecek kayıt sayısı (--synthesize) verilmeli")
+	profile = CorpusProfile.load(profile_path)
+	stats = MergeStats()
+	with open_merged_writer(out_dir, **(writer_options or {})) as writer:
+		for batch in iter_profile_batches(profile, synthesize, locale, seed=seed,
+				reference_time=reference_time, text_cache=text_cache):
+			writer.write_batch(batch)
+			stats.add_batch(batch)
+	LOGGER.info("Profilden sentetik kayıt üretildi: %d", stats.synthetic_records)
+	write_stats(stats, out_dir, writer.path)
+
+
+def _source_unchanged(recorded: Dict, dir_mtime_ns: int) -> bool:
+	"""Hesap klasörü ve kayıtlı kaynak CSV değişmemiş mi (glob yapmadan)"""
+	if recorded.get('dir_mtime_ns') != dir_mtime_ns:
+		return False
+	try:
+		st = os.stat(recorded['source_file'])
+	except OSError:
+		return False
+	return st.st_size == recorded['size'] and st.st_mtime_ns == recorded['mtime_ns']
+
+
+def _generation_dir(parent: Path, generation: int) -> Path:
+	return parent / f"g{generation:06d}"
+
+
+def _prune_generations(parent: Path, keep: Optional[Path]):
+	"""parent altında keep dışındaki eski nesilleri (ve nesil öncesi düzenden
+	kalan dosyaları) siler; keep parent'ın kendisiyse dokunmaz"""
+	if keep == parent or not parent.is_dir():
+		return
+	for entry in os.scandir(parent):
+		if keep is not None and entry.name == keep.name:
+			continue
+		if entry.is_dir(follow_symlinks=False):
+			shutil.rmtree(entry.path, ignore_errors=True)
+		else:
+			os.unlink(entry.path)
+
+
+def merge_account(account: str, csv_path: Path, state_dir: Path, writer_options: Dict = None,
+		seed: int = None, generation: int = 0) -> Dict:
+	"""Tek hesabın CSV'sini accounts/<hesap>/g<nesil>/ parçalarına, gönderen
+	sayıları ile şablon örneğini aynı dizindeki aggregates.json'a yazar; hesap
+	durumunu (kaynak dosya bilgisi, satır sayısı, dizin, parçalar) döndürür.
+	Önceki neslin dosyalarına dokunulmaz."""
+	options = dict(writer_options or {})
+	account_dir = _generation_dir(state_dir / 'accounts' / account, generation)
+	# Yarım kalmış bir çalışmadan kalan (kaydedilmemiş) aynı nesil
+	shutil.rmtree(account_dir, ignore_errors=True)
+	stats = MergeStats(ACCOUNT_SENDER_CAPACITY)
+	templates = ReservoirSample(ACCOUNT_TEMPLATE_SAMPLE, random.Random(f"{seed}/{account}") if seed is not None else None)
+	st = csv_path.stat()
+	with ShardedCsvWriter(account_dir, options.get('shard_rows'), options.get('shard_bytes'),
+			options.get('compression', 'none'), options.get('compress_workers', 4),
+			prefix='emails', manifest_path=account_dir / 'manifest.json') as writer:
+		for batch in iter_email_batches(csv_path, account):
+			writer.write_batch(batch)
+			stats.add_batch(batch)
+			templates.add_batch(batch)
+	write_json_atomic(account_dir / 'aggregates.json', {
+		'senders': stats.top_sender_counts(ACCOUNT_SENDER_CAPACITY),
+		'templates': [list(row) for row in EmailBatch.from_records(templates.items).rows()],
+	}, indent=None)
+	return {
+		'source_file': str(csv_path),
+		'size': st.st_size,
+		'mtime_ns': st.st_mtime_ns,
+		'rows': stats.total_records,
+		'dir': f"{INCREMENTAL_DIR}/accounts/{account}/{account_dir.name}",
+		'shards': [
+			{**shard, 'file': f"{INCREMENTAL_DIR}/accounts/{account}/{account_dir.name}/{shard['file']}"}
+			for shard in writer.shards
+		],
+	}
+
+
+def process_incremental(metadata_dir: Path, out_dir: Path, synthesize: int, seed: int = None,
+		reference_time: datetime = None, locale: str = 'tr_TR', text_cache: Path = None,
+		writer_options: Dict = None, workers: int = 1) -> None:
+	"""Artımlı birleştirme: yalnızca yeni veya değişmiş hesap CSV'leri okunur
+	(workers > 1 ise süreç havuzunda, her hesap kendi dizinine yazılır).
+	Hesap klasörünün mtime'ı ve kayıtlı kaynak dosyanın boyutu/mtime'ı
+	değişmemişse hesap glob yapılmadan atlanır; önceki parçaları ve
+	toplamları kullanılır. Sentetik kayıtlar hesap şablon örneklerinden
+	(satır sayısıyla ağırlıklı) her çalıştırmada yeniden üretilir. Çıktı,
+	tüm parçaları listeleyen merged_manifest_<ts>.json ve stats_<ts>.json'dur.
+	Yeniden yazılan parçalar yeni nesil dizinlerine yazılır; önceki manifest ve
+	artık listelenmeyen parçalar ancak yeni manifest yazıldıktan sonra silinir,
+	böylece okunan manifestin parçaları yerinde değişmez."""
+	if not metadata_dir.exists():
+		raise SystemExit(f"Metadata dizini bulunamadı: {metadata_dir}")
+	state_dir = out_dir / INCREMENTAL_DIR
+	state_path = state_dir / INCREMENTAL_STATE_FILE
+	options = dict(writer_options or {})
+	compression = options.get('compression', 'none')
+	layout = {key: options.get(key) for key in _LAYOUT_OPTIONS}
+	state = load_json(state_path, {})
+	generation = state.get('generation', 0) + 1
+	previous_manifest = state.get('manifest')
+	if state.get('layout') != layout:
+		if state:
+			LOGGER.info("Çıktı seçenekleri değişti, tüm hesaplar yeniden birleştirilecek")
+		state = {}
+	previous: Dict[str, Dict] = state.get('accounts', {})
+	accounts: Dict[str, Dict] = {}
+	stale: List[Tuple[str, Path, int]] = []
+	for entry in sorted((e for e in os.scandir(metadata_dir) if e.is_dir()), key=lambda e: e.name):
+		account = entry.name
+		dir_mtime_ns = entry.stat().st_mtime_ns
+		recorded = previous.get(account)
+		if recorded and _source_unchanged(recorded, dir_mtime_ns):
+			accounts[account] = recorded
+			continue
+		latest_csv = find_latest_email_csv(Path(entry.path))
+		if not latest_csv:
+			LOGGER.warning("emails_*.csv bulunamadı: %s", entry.path)
+			continue
+		st = latest_csv.stat()
+		if (recorded and recorded['source_file'] == str(latest_csv)
+				and recorded['size'] == st.st_size and recorded['mtime_ns'] == st.st_mtime_ns):
+			accounts[account] = {**recorded, 'dir_mtime_ns': dir_mtime_ns}
+			continue
+		# Sıra korunur: yer tutucu, birleştirme bitince doldurulur
+		accounts[account] = None
+		stale.append((account, latest_csv, dir_mtime_ns))
+	merge = partial(merge_account, state_dir=state_dir, writer_options=options, seed=seed, generation=generation)
+	if workers > 1 and len(stale) > 1:
+		executor = ProcessPoolExecutor(max_workers=workers)
+		merged = executor.map(merge, [account for account, _, _ in stale], [csv_path for _, csv_path, _ in stale])
+	else:
+		executor = None
+		merged = (merge(account, csv_path) for account, csv_path, _ in stale)
+	try:
+		for (account, _, dir_mtime_ns), recorded in zip(stale, merged):
+			accounts[account] = {**recorded, 'dir_mtime_ns': dir_mtime_ns}
+			LOGGER.info("%s -> %d kayıt (yeniden birleştirildi)", account, recorded['rows'])
+	finally:
+		if executor:
+			executor.shutdown(cancel_futures=True)
+	changed = len(stale)
+	LOGGER.info("%d hesap, %d yeniden birleştirildi, %d değişmedi", len(accounts), changed, len(accounts) - changed)
+	if not any(recorded['rows'] for recorded in accounts.values()):
+		raise SystemExit("Hiç kayıt yüklenemedi")
+
+	stats = MergeStats()
+	templates = EmailBatch()
+	weights: List[float] = []
+	for account, recorded in accounts.items():
+		aggregates = load_json(out_dir / recorded.get('dir', f"{INCREMENTAL_DIR}/accounts/{account}") / 'aggregates.json', {})
+		stats.merge_account(account, recorded['rows'], aggregates.get('senders', {}))
+		rows = aggregates.get('templates', [])
+		for row in rows:
+			templates.append(*row[:-1], int(row[-1]))
+			weights.append(recorded['rows'] / len(rows))
+	shards = [shard for recorded in accounts.values() for shard in recorded['shards']]
+
+	synthetic_dir = _generation_dir(state_dir / 'synthetic', generation)
+	shutil.rmtree(synthetic_dir, ignore_errors=True)
 	if synthesize:
-		synthetic_records = generate_synthetic(all_records, synthesize)
-		LOGGER.info("Sentetik kayıt üretildi: %d", len(synthetic_records))
-		all_records.extend(synthetic_records)
-	merged_csv = write_merged(all_records, out_dir)
-	write_stats(all_records, out_dir, merged_csv, len(synthetic_records))
+		with ShardedCsvWriter(synthetic_dir, options.get('shard_rows'), options.get('shard_bytes'), compression,
+				options.get('compress_workers', 4), prefix='synthetic', manifest_path=synthetic_dir / 'manifest.json') as writer:
+			for batch in iter_synthetic_batches(templates, synthesize, locale, seed=seed,
+					reference_time=reference_time, text_cache=text_cache, weights=weights):
+				writer.write_batch(batch)
+				stats.add_batch(batch)
+		shards += [{**shard, 'file': f"{INCREMENTAL_DIR}/synthetic/{synthetic_dir.name}/{shard['file']}"} for shard in writer.shards]
+		LOGGER.info("Sentetik kayıt üretildi: %d", stats.synthetic_records)
+
+	ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+	manifest_path = out_dir / f"merged_manifest_{ts}.json"
+	write_json_atomic(manifest_path, {
+		'columns': OUTPUT_COLUMNS,
+		'compression': compression,
+		'total_rows': stats.total_records,
+		'shards': shards,
+		'generated_at': datetime.now().isoformat(),
+	})
+	write_json_atomic(state_path, {'layout': layout, 'generation': generation, 'manifest': manifest_path.name,
+		'accounts': accounts}, indent=None)
+	LOGGER.info("Birleştirilmiş çıktı: %d parça, %d kayıt (manifest: %s)", len(shards), stats.total_records, manifest_path)
+	write_stats(stats, out_dir, manifest_path)
+
+	# Yeni manifest yazıldı: önceki manifest ve artık listelenmeyen parçalar silinir
+	if previous_manifest and previous_manifest != manifest_path.name:
+		(out_dir / previous_manifest).unlink(missing_ok=True)
+	accounts_dir = state_dir / 'accounts'
+	if accounts_dir.is_dir():
+		for entry in os.scandir(accounts_dir):
+			recorded = accounts.get(entry.name)
+			if recorded is None:
+				shutil.rmtree(entry.path, ignore_errors=True)
+				LOGGER.info("Kaldırılan hesap çıktıdan silindi: %s", entry.name)
+			elif 'dir' in recorded:
+				_prune_generations(Path(entry.path), out_dir / recorded['dir'])
+	_prune_generations(state_dir / 'synthetic', synthetic_dir if synthesize else None)
+
+
+def account_mailboxes(account_count: int, master_seed: int, text: TextPool = None) -> List[str]:
+	"""Hesap posta kutusu adları (klasör adı olarak da kullanılır); çakışan
+	adlara hesap sırası eklenir ki iki hesap aynı klasöre yazmasın"""
+	mailboxes: List[str] = []
+	seen = set()
+	for i in range(account_count):
+		if text:
+			mailbox = text.emails(BatchRandom(account_seeds(master_seed, i)[1]), 1)[0]
+		else:
+			mailbox = f"user{i+1}@example.com"
+		if mailbox in seen:
+			local, _, domain = mailbox.partition('@')
+			mailbox = f"{local}+{i+1}@{domain}"
+		seen.add(mailbox)
+		mailboxes.append(mailbox)
+	return mailboxes
 
 
-def generate_accounts(metadata_dir: Path, account_count: int, emails_per_account: int, locale: str, inbox_only: bool = False):
+def write_account(metadata_dir: Path, mailbox: str, index: int, emails_per_account: int, locale: str,
+		inbox_only: bool, master_seed: int, reference: int, file_ts: str, text_cache: Path = None) -> Path:
+	"""Tek hesabın emails_<file_ts>.csv dosyasını yazar. Hesap yalnızca kendi
+	tohumundan türetilen RNG'leri kullanır; çıktısı hangi süreçte
+	üretildiğinden bağımsızdır (işçi süreçte de çalışır)."""
+	rnd = BatchRandom(account_seeds(master_seed, index)[0])
+	text = get_text_pool(locale, text_cache)
+	# Mailbox klasör adı e-postayı aynen kullanabiliriz (özel karakter kısıtlıysa temizle)
+	account_dir = metadata_dir / mailbox
+	account_dir.mkdir(parents=True, exist_ok=True)
+	csv_path = account_dir / f"emails_{file_ts}.csv"
+	with csv_path.open('w', newline='', encoding='utf-8') as f:
+		writer = csv.writer(f)
+		writer.writerow(EMAIL_CSV_COLUMNS)
+		for start in range(0, emails_per_account, BATCH_ROWS):
+			batch = account_batch(min(BATCH_ROWS, emails_per_account - start), rnd, reference,
+				text, inbox_only, start)
+			writer.writerows(batch.rows(EMAIL_CSV_COLUMNS))
+	return csv_path
+
+
+def generate_accounts(metadata_dir: Path, account_count: int, emails_per_account: int, locale: str,
+		inbox_only: bool = False, workers: int = 1, seed: int = None, reference_time: datetime = None,
+		text_cache: Path = None):
 	"""Yeni demo hesap klasörleri oluşturup emails_*.csv üretir.
 
 	Her hesap için:
-	  - Rastgele email adresi (userX@example.com benzeri faker ile daha gerçekçi)
+	  - Rastgele email adresi (userX@example.com; metin havuzu varsa daha gerçekçi)
 	  - emails_<timestamp>.csv dosyası
 	  - Kolon: id,folder,subject,sender_name,sender_email,delivery_time,size,attachments_count
+
+	Her hesabın RNG'leri ana tohumdan (seed) hesap sırasıyla türetilir
+	(account_seeds); workers > 1 ise hesaplar süreç havuzunda yazılır ve çıktı
+	işçi sayısından bağımsız olarak byte byte aynıdır. seed verilmezse rastgele
+	seçilir ve loglanır. seed verilip reference_time verilmezse
+	SEEDED_REFERENCE_TIME kullanılır.
 	"""
 	metadata_dir.mkdir(parents=True, exist_ok=True)
-	faker = Faker(locale) if _FAKER_AVAILABLE else None
-	now_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-	for i in range(account_count):
-		if faker:
-			mailbox = faker.email()
-		else:
-			mailbox = f"user{i+1}@example.com"
-		# Mailbox klasör adı e-postayı aynen kullanabiliriz (özel karakter kısıtlıysa temizle)
-		safe_name = mailbox
-		account_dir = metadata_dir / safe_name
-		account_dir.mkdir(parents=True, exist_ok=True)
-		csv_path = account_dir / f"emails_{now_str}.csv"
-		with csv_path.open('w', newline='', encoding='utf-8') as f:
-			writer = csv.DictWriter(f, fieldnames=EMAIL_CSV_COLUMNS)
-			writer.writeheader()
-			for j in range(emails_per_account):
-				# Sentetik tek email kaydı
-				if faker:
-					sender_name = faker.name()
-					sender_email = faker.email()
-					subject = faker.sentence(nb_words=random.randint(3, 8)).rstrip('.')
-				else:
-					sender_name = f"Sender {j+1}"
-					sender_email = f"sender{j+1}@example.com"
-					subject = f"Subject {j+1}"
-				dt = datetime.now() - timedelta(minutes=random.randint(0, 60*24*30))
-				delivery_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-				if inbox_only:
-					folder = 'Outlook veri dosyasının en üstü/Gelen Kutusu'
-				else:
-					# Ağırlıklı rastgele klasör seçimi
-					folder = random.choices(DEFAULT_FOLDER_POOL, weights=DEFAULT_FOLDER_WEIGHTS, k=1)[0]
-				base = f"{subject}{sender_email}{delivery_time}{random.random()}".encode()
-				rec_id = hashlib.md5(base).hexdigest()[:16]
-				size = random.randint(1_000, 50_000)
-				attachments_count = random.choices([0,1,2,3], weights=[0.7,0.2,0.08,0.02])[0]
-				writer.writerow({
-					'id': rec_id,
-					'folder': folder,
-					'subject': subject,
-					'sender_name': sender_name,
-					'sender_email': sender_email,
-					'delivery_time': delivery_time,
-					'size': size,
-					'attachments_count': attachments_count,
-				})
-		LOGGER.info("Hesap üretildi: %s (%d email)", safe_name, emails_per_account)
+	if seed is None:
+		seed = random.SystemRandom().getrandbits(63)
+		reference_time = reference_time or datetime.now()
+	else:
+		reference_time = reference_time or SEEDED_REFERENCE_TIME
+	LOGGER.info("Hesap üretimi tohumu: %d", seed)
+	file_ts = reference_time.strftime('%Y%m%d_%H%M%S')
+	reference = epoch_seconds(reference_time)
+	# Havuz burada kurulur/yüklenir; işçiler önbellekten yükler
+	mailboxes = account_mailboxes(account_count, seed, get_text_pool(locale, text_cache))
+	write = partial(write_account, metadata_dir, emails_per_account=emails_per_account, locale=locale,
+		inbox_only=inbox_only, master_seed=seed, reference=reference, file_ts=file_ts, text_cache=text_cache)
+	if workers > 1 and account_count > 1:
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			chunksize = max(1, account_count // (workers * 4))
+			results = executor.map(write, mailboxes, range(account_count), chunksize=chunksize)
+			for mailbox in mailboxes:
+				next(results)
+				LOGGER.info("Hesap üretildi: %s (%d email)", mailbox, emails_per_account)
+	else:
+		for i, mailbox in enumerate(mailboxes):
+			write(mailbox, i)
+			LOGGER.info("Hesap üretildi: %s (%d email)", mailbox, emails_per_account)
 
 
 def parse_args():
@@ -315,11 +2015,30 @@ def parse_args():
 	parser.add_argument('-m', '--metadata-dir', default=os.environ.get('METADATA_DIR', '../extract/metadata'), help='Metadata ana dizini')
 	parser.add_argument('-o', '--out-dir', default='./output', help='Çıktı dizini')
 	parser.add_argument('-s', '--synthesize', type=int, default=0, help='Üretilecek sentetik kayıt sayısı')
-	parser.add_argument('--locale', default='tr_TR', help='Faker locale (faker yüklüyse)')
+	parser.add_argument('--locale', default='tr_TR', help='Metin havuzu locale (havuz faker ile kurulur)')
+	parser.add_argument('--text-cache', type=Path, default=None,
+		help=f'Metin havuzu önbellek dizini (varsayılan: $DATAGEN_CACHE_DIR veya {TEXT_POOL_DIR})')
 	parser.add_argument('-v', '--verbose', action='store_true', help='Detaylı log')
 	parser.add_argument('--make-accounts', type=int, default=0, help='Yeni demo hesap sayısı (metadata dizininde üret)')
 	parser.add_argument('--emails-per-account', type=int, default=100, help='Her hesap için üretilecek email sayısı')
 	parser.add_argument('--inbox-only', action='store_true', help='Sadece Gelen Kutusu klasörü kullan (varsayılan: karışık)')
+	parser.add_argument('--incremental', action='store_true',
+		help='Artımlı birleştirme: yalnızca yeni/değişmiş hesapları oku (çıktı: hesap başına parçalar + manifest)')
+	parser.add_argument('--write-profile', type=Path, default=None,
+		help='Hesap CSV\'lerinden dağılım profili çıkarıp bu JSON dosyasına yaz (birleştirme yapılmaz)')
+	parser.add_argument('--from-profile', type=Path, default=None,
+		help='Metadata okumadan bu profilden --synthesize kadar sentetik kayıt üret')
+	parser.add_argument('--shard-rows', type=int, default=None, help='Birleştirilmiş çıktıyı bu kadar satırlık parçalara böl')
+	parser.add_argument('--shard-size-mb', type=int, default=None, help='Birleştirilmiş çıktıyı yaklaşık bu boyutta (MiB, sıkıştırılmamış) parçalara böl')
+	parser.add_argument('--compress', choices=list(COMPRESSION_CODECS), default='none', help='Parçaların sıkıştırması')
+	parser.add_argument('--compress-workers', type=int, default=min(4, os.cpu_count() or 1), help='Sıkıştırma thread sayısı')
+	parser.add_argument('--stdout', choices=STREAM_FORMATS, default=None,
+		help='Kayıtları dosya yerine standart çıktıya NDJSON veya CSV olarak akıt (istatistik dosyası yazılmaz)')
+	parser.add_argument('-w', '--workers', type=int, default=1,
+		help='İşçi süreç sayısı (hesap üretimi ve hesap CSV\'lerinin okunması)')
+	parser.add_argument('--seed', type=int, default=None, help='Ana tohum (aynı tohumla çıktı işçi sayısından bağımsız olarak aynıdır)')
+	parser.add_argument('--reference-time', type=datetime.fromisoformat, default=None,
+		help='Teslim zamanlarının referansı (ISO, ör. 2025-01-01T00:00:00; --seed ile varsayılan 2025-01-01)')
 	return parser.parse_args()
 
 
@@ -329,14 +2048,42 @@ def main():
 	LOGGER.info("Datagen başlıyor ...")
 	metadata_dir = Path(args.metadata_dir).resolve()
 	out_dir = Path(args.out_dir).resolve()
-	if args.synthesize > 0 and not _FAKER_AVAILABLE:
-		LOGGER.warning("faker bulunamadı, basit sentetik üretim moduna geçiliyor (daha sınırlı)")
+	if (args.synthesize > 0 or args.make_accounts > 0) and get_text_pool(args.locale, args.text_cache) is None:
+		LOGGER.warning("faker ve metin havuzu önbelleği bulunamadı, basit metin moduna geçiliyor (daha sınırlı)")
 	# Eğer yeni hesaplar üretilecekse önce onları oluştur
 	if args.make_accounts > 0:
-		if not _FAKER_AVAILABLE:
-			LOGGER.warning("Hesap üretimi için faker önerilir; yine de basit modda devam edilecek")
-		generate_accounts(metadata_dir, args.make_accounts, args.emails_per_account, args.locale, inbox_only=args.inbox_only)
-	process(metadata_dir, out_dir, args.synthesize)
+		generate_accounts(metadata_dir, args.make_accounts, args.emails_per_account, args.locale,
+			inbox_only=args.inbox_only, workers=args.workers, seed=args.seed, reference_time=args.reference_time,
+			text_cache=args.text_cache)
+	reference_time = args.reference_time
+	if args.seed is not None and reference_time is None:
+		reference_time = SEEDED_REFERENCE_TIME
+	writer_options = {
+		'shard_rows': args.shard_rows,
+		'shard_bytes': args.shard_size_mb * 1024 * 1024 if args.shard_size_mb else None,
+		'compression': args.compress,
+		'compress_workers': args.compress_workers,
+	}
+	if args.stdout:
+		if args.incremental or args.write_profile or args.shard_rows or args.shard_size_mb or args.compress != 'none':
+			raise SystemExit("--stdout; --incremental, --write-profile, parçalama ve sıkıştırma ile kullanılamaz")
+		writer_options['stream_format'] = args.stdout
+	try:
+		if args.write_profile:
+			build_profile(metadata_dir, args.write_profile, args.workers)
+		elif args.from_profile:
+			process_profile(args.from_profile, out_dir, args.synthesize, seed=args.seed, reference_time=reference_time,
+				locale=args.locale, text_cache=args.text_cache, writer_options=writer_options)
+		else:
+			merge = process_incremental if args.incremental else process
+			merge(metadata_dir, out_dir, args.synthesize, seed=args.seed, reference_time=reference_time,
+				locale=args.locale, text_cache=args.text_cache, writer_options=writer_options, workers=args.workers)
+	except BrokenPipeError:
+		# Okuyucu erken kapandı (ör. | head): çıkışta boşaltma yeniden hata
+		# vermesin diye stdout /dev/null'a yönlendirilir
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+		LOGGER.info("Standart çıktı okuyucusu kapandı, üretim durduruldu")
+		return
 	LOGGER.info("Tamamlandı.")
 
 
@@ -0,0 +1,143 @@
+"""
+PSTAnalyzer kıyaslama aracı
+
+Gerçek PST dosyası gerektirmez: SyntheticReader ile bellekte üretilen posta
+kutuları üzerinde extract_emails (veya akış modunda iter_emails) verimini ve
+bellek kullanımını ölçer. Her boyut ayrı bir süreçte çalışır, böylece tepe
+bellek ölçümleri birbirini etkilemez.
+
+Kullanım:
+    python benchmark.py
+    python benchmark.py --sizes 10000,100000 --mode stream --attachment-size 65536
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import extract
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def run_benchmark(messages: int, mode: str = 'list', fields: List[str] = None,
+                  **reader_options) -> Dict:
+    """
+    Tek bir boyut için kıyaslamayı çalıştırır (ayrı süreçte çağrılır)
+
+    Args:
+        messages (int): Sentetik mesaj sayısı
+        mode (str): list (extract_emails, sonuç listesi bellekte) veya
+            stream (iter_emails, kayıtlar tutulmaz)
+        fields (List[str]): Okunacak e-posta alanları (None ise tümü)
+        **reader_options: SyntheticReader parametreleri
+
+    Returns:
+        Dict: Süre, mesaj/sn, byte/sn, tepe bellek ve aşama süreleri
+    """
+    # Klasör başına INFO satırları ölçümü bozmasın
+    logging.disable(logging.INFO)
+    baseline_rss = extract.peak_rss_bytes()
+    output_dir = Path(tempfile.mkdtemp(prefix='pst_benchmark_'))
+    try:
+        reader = extract.SyntheticReader(messages=messages, **reader_options)
+        analyzer = extract.PSTAnalyzer('synthetic.pst', str(output_dir), streaming=True,
+                                       fields=fields, reader=reader)
+        if not analyzer.open_pst_file():
+            raise RuntimeError("Sentetik posta kutusu açılamadı")
+
+        started = time.perf_counter()
+        if mode == 'list':
+            emails = analyzer.extract_emails()
+            count = len(emails)
+            total_bytes = sum(email.get('size', 0) for email in emails)
+        else:
+            count = 0
+            total_bytes = 0
+            for email in analyzer.iter_emails():
+                count += 1
+                total_bytes += email.get('size', 0)
+        analyzer.close_attachment_store()
+        seconds = time.perf_counter() - started
+        analyzer.close_pst_file()
+        analyzer.close_logging()
+
+        metrics = analyzer.metrics.to_dict(seconds)
+        peak_rss = extract.peak_rss_bytes()
+        return {
+            'messages': count,
+            'mode': mode,
+            'seconds': round(seconds, 3),
+            'messages_per_sec': round(count / seconds, 1) if seconds else None,
+            'bytes_per_sec': round(total_bytes / seconds, 1) if seconds else None,
+            'peak_rss_bytes': peak_rss,
+            'rss_growth_bytes': peak_rss - baseline_rss if peak_rss and baseline_rss else None,
+            'stages': metrics['stages'],
+        }
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _format_row(result: Dict) -> str:
+    rss = result['peak_rss_bytes']
+    return (f"{result['messages']:>10,}  {result['seconds']:>9.2f}  {result['messages_per_sec']:>12,.0f}  "
+            f"{(result['bytes_per_sec'] or 0) / (1024 * 1024):>9.1f}  "
+            f"{rss / (1024 * 1024) if rss else 0:>12.1f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sentetik posta kutularıyla PSTAnalyzer kıyaslaması")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Virgülle ayrılmış mesaj sayıları')
+    parser.add_argument('--mode', choices=['list', 'stream'], default='list',
+                        help='list: extract_emails (liste bellekte), stream: iter_emails')
+    parser.add_argument('--fields', type=extract.resolve_fields, default=None,
+                        help='Okunacak e-posta alanları (profil veya liste)')
+    parser.add_argument('--folders', type=int, default=20, help='Klasör sayısı')
+    parser.add_argument('--body-size', type=int, default=2048, help='Gövde boyutu (byte)')
+    parser.add_argument('--attachment-size', type=int, default=0, help='Ek boyutu (byte, 0 ise ek yok)')
+    parser.add_argument('--attachments-every', type=int, default=10, help='Her kaçıncı mesajın eki olduğu')
+    parser.add_argument('-o', '--output', default=None, help='Sonuçların yazılacağı JSON dosyası')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    reader_options = {
+        'folders': args.folders,
+        'body_size': args.body_size,
+        'attachment_size': args.attachment_size,
+        'attachments_every': args.attachments_every,
+    }
+
+    print(f"{'mesaj':>10}  {'süre (sn)':>9}  {'mesaj/sn':>12}  {'MiB/sn':>9}  {'tepe RSS MiB':>12}")
+    results = []
+    for size in sizes:
+        # Her boyut temiz bir süreçte: tepe RSS yalnızca o çalışmayı yansıtır
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(run_benchmark, size, args.mode, args.fields, **reader_options).result()
+        results.append(result)
+        print(_format_row(result))
+
+    if args.output:
+        report = {
+            'generated_at': datetime.datetime.now().isoformat(),
+            'reader': reader_options,
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
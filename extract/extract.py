@@ -1,19 +1,1793 @@
 import os
 import sys
+import csv
+import argparse
+import array
+import bisect
+import cProfile
+import contextlib
 import json
 import datetime
 import hashlib
+import heapq
+import itertools
+import math
+import pstats
+import queue
+import re
+import shutil
+import sqlite3
+import threading
+import time
+import tracemalloc
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 import logging
+import logging.handlers
+import multiprocessing.util
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 try:
     import pypff
+    _PYPFF_AVAILABLE = True
 except ImportError:
-    print("HATA: pypff kütüphanesi bulunamadı!")
-    print("Kurulum için: pip install pypff")
-    print("Veya: conda install -c conda-forge pypff")
-    sys.exit(1)
+    pypff = None
+    _PYPFF_AVAILABLE = False
+
+
+# emails_<ts>.csv kolonları (datagen ve convert bu sırayı bekler)
+EMAIL_CSV_FIELDNAMES = [
+    'id', 'folder', 'subject', 'sender_name', 'sender_email',
+    'delivery_time', 'size', 'attachments_count'
+]
+
+# E-posta kaydındaki alanlar (JSON raporundaki sırasıyla)
+EMAIL_FIELDS = [
+    'id', 'folder', 'subject', 'sender_name', 'sender_email', 'recipients',
+    'delivery_time', 'creation_time', 'modification_time', 'size',
+    'body_plain', 'body_html', 'message_class', 'priority', 'importance',
+    'attachments', 'attachments_count', 'categories', 'read_flag'
+]
+
+# Hazır alan profilleri; "metadata" yalnızca emails_<ts>.csv kolonlarını okur
+# (gövde, alıcı ve ek verisi hiç okunmaz)
+FIELD_PROFILES = {
+    'full': EMAIL_FIELDS,
+    'metadata': EMAIL_CSV_FIELDNAMES,
+}
+
+# Gövde alanlarında saklanan en fazla karakter sayısı
+BODY_PREFIX_CHARS = 1000
+
+
+def resolve_fields(spec: str) -> List[str]:
+    """
+    Alan seçimini çözer: profil adı (full, metadata) ya da virgülle ayrılmış
+    alan listesi. id ve folder her zaman dahildir.
+    
+    Raises:
+        ValueError: Bilinmeyen alan adı
+    """
+    if spec in FIELD_PROFILES:
+        return list(FIELD_PROFILES[spec])
+    requested = {name.strip() for name in spec.split(',') if name.strip()}
+    unknown = requested - set(EMAIL_FIELDS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen alan(lar): {', '.join(sorted(unknown))}")
+    requested |= {'id', 'folder'}
+    return [name for name in EMAIL_FIELDS if name in requested]
+
+
+# Artımlı çalışma dosyaları
+MANIFEST_FILE = "extract_manifest.json"
+CHECKPOINT_FILE = "checkpoint.json"
+CHECKPOINT_INTERVAL = 5.0  # saniye
+
+# JSON raporundaki bölümlerin sırası
+RESULT_SECTIONS = ['emails', 'contacts', 'calendar', 'tasks', 'notes', 'journal', 'attachments', 'folders', 'statistics']
+
+# message_class -> rapor bölümü (eşleşmeyen tüm öğeler e-posta sayılır)
+ITEM_SECTIONS_BY_MESSAGE_CLASS = {
+    'IPM.Contact': 'contacts',
+    'IPM.DistList': 'contacts',
+    'IPM.Appointment': 'calendar',
+    'IPM.Task': 'tasks',
+    'IPM.StickyNote': 'notes',
+    'IPM.Activity': 'journal',
+}
+
+
+def _item_section(message_class) -> str:
+    """
+    Mesaj sınıfına göre öğenin ait olduğu rapor bölümünü döndürür.
+    Alt sınıflar da eşleşir (ör. IPM.Contact.Custom -> contacts).
+    """
+    if not message_class:
+        return 'emails'
+    parts = str(message_class).split('.')
+    for i in range(len(parts), 1, -1):
+        section = ITEM_SECTIONS_BY_MESSAGE_CLASS.get('.'.join(parts[:i]))
+        if section:
+            return section
+    return 'emails'
+
+
+class PSTReader(ABC):
+    """
+    PSTAnalyzer ile PST kütüphanesi arasındaki okuyucu arayüzü.
+
+    open(), pypff.file ile aynı nesne modelini sunan bir dosya nesnesi
+    döndürmelidir: root_folder, close(); klasörlerde name, sub_folders,
+    sub_messages, number_of_sub_messages (isteğe bağlı get_sub_message,
+    get_sub_folder); mesajlarda pypff mesaj özellikleri. Okuyucular bölüm
+    işçilerine aktarıldığından pickle edilebilir olmalıdır.
+    """
+
+    # False ise PST yolunun diskte bulunması gerekmez
+    requires_file = True
+
+    @abstractmethod
+    def open(self, pst_file_path: Path):
+        """PST dosyasını açar ve dosya nesnesini döndürür"""
+
+    def fingerprint(self, pst_file_path: Path) -> Dict:
+        """Kaynağın değişip değişmediğini anlamak için parmak izi (kontrol noktası)"""
+        return pst_fingerprint(pst_file_path)
+
+    def same_source(self, recorded: Optional[Dict], pst_file_path: Path) -> bool:
+        """Kayıtlı parmak izi kaynağın şu anki haliyle eşleşiyor mu?"""
+        return _same_pst(recorded, pst_file_path)
+
+
+class PypffReader(PSTReader):
+    """libpff (pypff) ile gerçek .pst dosyalarını okur"""
+
+    def open(self, pst_file_path: Path):
+        if not _PYPFF_AVAILABLE:
+            raise ImportError("pypff kütüphanesi bulunamadı (pip install pypff)")
+        pst_file = pypff.file()
+        pst_file.open(str(pst_file_path))
+        return pst_file
+
+
+class _SyntheticAttachment:
+    """Sentetik ek; veri read_buffer ile parça parça üretilir"""
+
+    def __init__(self, name: str, size: int, header: bytes, filler: bytes):
+        self.name = name
+        self.size = size
+        self.attachment_type = 1
+        self._header = header
+        self._filler = filler
+        self._offset = 0
+
+    def get_size(self) -> int:
+        return self.size
+
+    def seek_offset(self, offset: int, whence: int = os.SEEK_SET):
+        self._offset = offset
+
+    def read_buffer(self, size: int) -> bytes:
+        end = min(self._offset + size, self.size)
+        if end <= self._offset:
+            return b''
+        # İlk byte'lar mesaja özgü başlık, gerisi ortak dolgu (her ek farklı içerikli)
+        if self._offset < len(self._header):
+            data = (self._header + self._filler)[self._offset:end]
+        else:
+            data = self._filler[self._offset - len(self._header):end - len(self._header)]
+        self._offset += len(data)
+        return data
+
+
+class _SyntheticRecipient:
+    def __init__(self, name: str, email_address: str, recipient_type: int):
+        self.name = name
+        self.email_address = email_address
+        self.type = recipient_type
+
+
+class _SyntheticMessage:
+    """Sıra numarasından belirlenimli olarak üretilen sentetik e-posta"""
+
+    def __init__(self, reader: 'SyntheticReader', number: int):
+        sender = number % reader.senders
+        delivery_time = reader.start_time + datetime.timedelta(minutes=number)
+        self.subject = f"Synthetic message {number}"
+        self.sender_name = f"Sender {sender}"
+        self.sender_email_address = f"sender{sender}@example.com"
+        self.delivery_time = delivery_time
+        self.creation_time = delivery_time
+        self.modification_time = delivery_time
+        self.plain_text_body = reader._body
+        self.html_body = reader._html_body
+        self.message_class = 'IPM.Note'
+        self.priority = 1
+        self.importance = 1
+        self.categories = ''
+        self.is_read = bool(number % 2)
+        self.transport_headers = f"Message-ID: <synthetic-{number}@example.com>\r\n"
+        self.recipients = [
+            _SyntheticRecipient(f"Recipient {i}", f"recipient{(number + i) % reader.senders}@example.com", 1)
+            for i in range(reader.recipients)
+        ]
+        with_attachment = reader.attachment_size and reader.attachments_every and number % reader.attachments_every == 0
+        self.attachments = [
+            _SyntheticAttachment(f"attachment_{number}.bin", reader.attachment_size,
+                                 number.to_bytes(8, 'big'), reader._attachment_filler)
+        ] if with_attachment else []
+        self.number_of_attachments = len(self.attachments)
+        self.size = len(reader._body) + len(reader._html_body) + (reader.attachment_size if with_attachment else 0)
+
+
+class _SyntheticFolder:
+    """Sentetik klasör; mesajları istendiğinde üretir (bellekte tutulmaz)"""
+
+    def __init__(self, reader: 'SyntheticReader', name: str, first_message: int, message_count: int):
+        self._reader = reader
+        self.name = name
+        self.container_class = 'IPF.Note'
+        self.first_message = first_message
+        self.number_of_sub_messages = message_count
+        self.sub_folders: List['_SyntheticFolder'] = []
+
+    @property
+    def number_of_sub_folders(self) -> int:
+        return len(self.sub_folders)
+
+    @property
+    def sub_messages(self) -> Iterator[_SyntheticMessage]:
+        for i in range(self.number_of_sub_messages):
+            yield self.get_sub_message(i)
+
+    def get_sub_message(self, index: int) -> _SyntheticMessage:
+        if not 0 <= index < self.number_of_sub_messages:
+            raise IndexError(index)
+        return _SyntheticMessage(self._reader, self.first_message + index)
+
+    def get_sub_folder(self, index: int) -> '_SyntheticFolder':
+        return self.sub_folders[index]
+
+
+class _SyntheticFile:
+    def __init__(self, root_folder: _SyntheticFolder, size: int):
+        self.root_folder = root_folder
+        self.size = size
+
+    def close(self):
+        pass
+
+
+class SyntheticReader(PSTReader):
+    """
+    Gerçek PST dosyası gerektirmeyen, bellekte sentetik posta kutusu üreten
+    okuyucu (kıyaslama ve regresyon testi için).
+
+    Klasör ağacı her klasörün en fazla fanout alt klasörü olacak şekilde
+    genişlik öncelikli kurulur; mesajlar klasörlere eşit dağıtılır ve sıra
+    numarasından belirlenimli üretilir, bu yüzden bellek kullanımı mesaj
+    sayısından bağımsızdır.
+
+    Args:
+        messages (int): Toplam mesaj sayısı
+        folders (int): Klasör sayısı
+        fanout (int): Klasör başına en fazla alt klasör
+        body_size (int): Düz metin gövde boyutu (byte)
+        attachment_size (int): Ek boyutu (byte, 0 ise ek yok)
+        attachments_every (int): Her kaçıncı mesajın eki olduğu
+        recipients (int): Mesaj başına alıcı sayısı
+        senders (int): Farklı gönderen sayısı
+    """
+
+    requires_file = False
+
+    def __init__(self, messages: int = 10000, folders: int = 10, fanout: int = 4,
+                 body_size: int = 2048, attachment_size: int = 0, attachments_every: int = 10,
+                 recipients: int = 2, senders: int = 500):
+        self.messages = messages
+        self.folders = max(1, folders)
+        self.fanout = max(1, fanout)
+        self.body_size = body_size
+        self.attachment_size = attachment_size
+        self.attachments_every = attachments_every
+        self.recipients = recipients
+        self.senders = max(1, senders)
+        self.start_time = datetime.datetime(2020, 1, 1)
+        self._body = (b"synthetic body text " * (body_size // 20 + 1))[:body_size]
+        self._html_body = b"<html><body>" + self._body[:body_size // 4] + b"</body></html>"
+        self._attachment_filler = bytes(range(256)) * (attachment_size // 256 + 1) if attachment_size else b''
+
+    def open(self, pst_file_path: Path) -> _SyntheticFile:
+        root = _SyntheticFolder(self, '', 0, 0)
+        per_folder, remainder = divmod(self.messages, self.folders)
+        folders = []
+        first_message = 0
+        for i in range(self.folders):
+            count = per_folder + (1 if i < remainder else 0)
+            folder = _SyntheticFolder(self, f"Folder {i}", first_message, count)
+            first_message += count
+            parent = folders[(i - 1) // self.fanout] if i else root
+            parent.sub_folders.append(folder)
+            folders.append(folder)
+        size = self.messages * (len(self._body) + len(self._html_body))
+        return _SyntheticFile(root, size)
+
+    def fingerprint(self, pst_file_path: Path) -> Dict:
+        """Dosya olmadığından parmak izi okuyucu parametrelerinden türetilir"""
+        params = {name: value for name, value in vars(self).items() if not name.startswith('_')}
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        return {'size': self.messages, 'mtime_ns': 0, 'partial_sha256': digest}
+
+    def same_source(self, recorded: Optional[Dict], pst_file_path: Path) -> bool:
+        return bool(recorded) and recorded.get('partial_sha256') == self.fingerprint(pst_file_path)['partial_sha256']
+
+
+# Okuyucu adı -> sınıf (resolve_reader)
+PST_READERS = {
+    'pypff': PypffReader,
+    'synthetic': SyntheticReader,
+}
+
+
+def resolve_reader(spec: str) -> PSTReader:
+    """
+    Okuyucu tanımını çözer: "pypff" ya da
+    "synthetic:messages=100000,folders=20,attachment_size=65536"
+
+    Raises:
+        ValueError: Bilinmeyen okuyucu veya parametre
+    """
+    name, _, params = spec.partition(':')
+    if name not in PST_READERS:
+        raise ValueError(f"Bilinmeyen okuyucu: {name}")
+    options = {}
+    for param in filter(None, params.split(',')):
+        key, _, value = param.partition('=')
+        options[key.strip()] = int(value)
+    try:
+        return PST_READERS[name](**options)
+    except TypeError as e:
+        raise ValueError(f"Geçersiz okuyucu parametresi: {e}")
+
+
+class EmailSink(ABC):
+    """
+    E-posta kayıtlarını tek tek tüketen çıktı yazıcılarının temel sınıfı
+    """
+
+    @abstractmethod
+    def write(self, email: Dict):
+        """Tek bir e-posta kaydını işler"""
+
+    def close(self):
+        """Açık kaynakları kapatır"""
+        pass
+
+    def discard(self):
+        """Başarısız çalışmada kapatır ve yarım kalan çıktı dosyalarını siler"""
+        self.close()
+
+    def checkpoint(self) -> Dict:
+        """
+        Yazılanları diske aktarır ve kaldığı yerden devam için durumu döndürür
+        (sınıf, aynı durumu state parametresiyle geri yükleyebilmelidir)
+        """
+        return {}
+
+
+def _json_default(value):
+    """
+    json.dumps için dönüştürücü: bytes UTF-8 olarak çözülür, diğer
+    serileştirilemeyen nesneler (pypff değerleri vb.) metne çevrilir.
+    Kayıtların temizlenmiş bir kopyasını çıkarmaya gerek bırakmaz.
+    """
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='ignore')
+    return str(value)
+
+
+def _truncate(path: Path, offset: int):
+    """Dosyayı son kontrol noktasındaki boyutuna kırpar"""
+    with open(path, 'r+b') as f:
+        f.truncate(offset)
+
+
+class CsvEmailSink(EmailSink):
+    """
+    emails_<ts>.csv dosyasını satır satır yazar. Dosya ilk kayıtta açılır,
+    böylece e-posta yoksa boş CSV oluşmaz.
+    """
+
+    def __init__(self, csv_file: Path, write_header: bool = True, state: Dict = None):
+        self.csv_file = Path(csv_file)
+        self.write_header = write_header
+        self.count = 0
+        self._handle = None
+        self._writer = None
+        
+        if state and state.get('offset'):
+            # Kontrol noktasından devam: sonrasında yazılmış yarım satırları at
+            _truncate(self.csv_file, state['offset'])
+            self.count = state['count']
+            self._handle = open(self.csv_file, 'a', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._handle, fieldnames=EMAIL_CSV_FIELDNAMES)
+
+    def write(self, email: Dict):
+        if self._writer is None:
+            self._handle = open(self.csv_file, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._handle, fieldnames=EMAIL_CSV_FIELDNAMES)
+            if self.write_header:
+                self._writer.writeheader()
+        self._writer.writerow({
+            'id': email['id'],
+            'folder': email['folder'],
+            'subject': email.get('subject', ''),
+            'sender_name': email.get('sender_name', ''),
+            'sender_email': email.get('sender_email', ''),
+            'delivery_time': email.get('delivery_time', ''),
+            'size': email.get('size', ''),
+            'attachments_count': email['attachments_count']
+        })
+        self.count += 1
+
+    def checkpoint(self) -> Dict:
+        if not self._handle:
+            return {'offset': 0, 'count': 0}
+        self._handle.flush()
+        return {'offset': self._handle.tell(), 'count': self.count}
+
+    def close(self):
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+            self._writer = None
+
+    def discard(self):
+        self.close()
+        self.csv_file.unlink(missing_ok=True)
+
+
+class JsonResultSink(EmailSink):
+    """
+    pst_analysis_<ts>.json raporunu artımlı yazar.
+
+    E-postalar geldikçe "emails" dizisine yazılır; ek kayıtları geçici bir
+    dosyada biriktirilip finish() sırasında "attachments" bölümüne kopyalanır.
+    Çıktı, save_results() ile üretilen dosyayla aynı yapıdadır.
+
+    Kaldığı yerden devam edilecekse spool_file ile kalıcı bir ara dosya verilir.
+    """
+
+    def __init__(self, json_file: Path, spool_file: Path = None, state: Dict = None):
+        self.json_file = Path(json_file)
+        self.spool_file = Path(spool_file) if spool_file else None
+        self.count = 0
+        self._spool_count = 0
+        
+        if state:
+            _truncate(self.json_file, state['offset'])
+            _truncate(self.spool_file, state['spool_offset'])
+            self.count = state['count']
+            self._spool_count = state['spool_count']
+            self._handle = open(self.json_file, 'a', encoding='utf-8')
+            self._spool = open(self.spool_file, 'a+', encoding='utf-8')
+            return
+        
+        self._handle = open(self.json_file, 'w', encoding='utf-8')
+        self._handle.write('{\n  "emails": [')
+        if self.spool_file:
+            self._spool = open(self.spool_file, 'w+', encoding='utf-8')
+        else:
+            self._spool = tempfile.TemporaryFile('w+', encoding='utf-8', dir=self.json_file.parent)
+
+    def _dump_item(self, item, index: int) -> str:
+        text = json.dumps(item, ensure_ascii=False, indent=2, default=_json_default)
+        text = text.replace('\n', '\n    ')
+        return (',\n    ' if index else '\n    ') + text
+
+    def write(self, email: Dict):
+        self._handle.write(self._dump_item(email, self.count))
+        self.count += 1
+        for attachment in email.get('attachments', []):
+            self._spool.write(self._dump_item(attachment, self._spool_count))
+            self._spool_count += 1
+
+    def _end_list(self, count: int):
+        self._handle.write('\n  ]' if count else ']')
+
+    def checkpoint(self) -> Dict:
+        self._handle.flush()
+        self._spool.flush()
+        return {
+            'offset': self._handle.tell(),
+            'count': self.count,
+            'spool_offset': self._spool.tell(),
+            'spool_count': self._spool_count
+        }
+
+    def finish(self, sections: Dict[str, Any]):
+        """
+        Kalan bölümleri (kişiler, takvim, ..., istatistikler) yazıp dosyayı kapatır
+
+        Args:
+            sections (Dict[str, Any]): Bölüm adı -> değer
+        """
+        self._end_list(self.count)
+        for section in RESULT_SECTIONS[1:]:
+            self._handle.write(f',\n  "{section}": ')
+            if section == 'attachments':
+                self._handle.write('[')
+                self._spool.seek(0)
+                shutil.copyfileobj(self._spool, self._handle)
+                self._end_list(self._spool_count)
+                continue
+            text = json.dumps(sections.get(section, []), ensure_ascii=False, indent=2, default=_json_default)
+            self._handle.write(text.replace('\n', '\n  '))
+        self._handle.write('\n}')
+        self.close()
+        if self.spool_file:
+            self.spool_file.unlink(missing_ok=True)
+
+    def close(self):
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+        if self._spool:
+            self._spool.close()
+            self._spool = None
+
+    def discard(self):
+        self.close()
+        self.json_file.unlink(missing_ok=True)
+        if self.spool_file:
+            self.spool_file.unlink(missing_ok=True)
+
+
+class NdjsonResultSink(EmailSink):
+    """
+    Analiz raporunu kompakt NDJSON (satır başına bir kayıt) olarak yazar (pst_analysis_<ts>.ndjson).
+
+    Her satır {"section": <bölüm>, "record": <kayıt>} biçimindedir; e-postanın
+    ekleri e-postadan hemen sonra "attachments" satırları olarak gelir, son satır
+    istatistiklerdir. Girintisiz yazıldığından hızlıdır ve okunurken satır
+    satır işlenebilir.
+    """
+
+    def __init__(self, ndjson_file: Path, state: Dict = None):
+        self.json_file = Path(ndjson_file)
+        self.count = 0
+        if state:
+            _truncate(self.json_file, state['offset'])
+            self.count = state['count']
+            self._handle = open(self.json_file, 'a', encoding='utf-8')
+        else:
+            self._handle = open(self.json_file, 'w', encoding='utf-8')
+
+    def _write_line(self, section: str, record):
+        self._handle.write(json.dumps({'section': section, 'record': record},
+                                      ensure_ascii=False, separators=(',', ':'), default=_json_default))
+        self._handle.write('\n')
+
+    def write(self, email: Dict):
+        self._write_line('emails', email)
+        self.count += 1
+        for attachment in email.get('attachments', []):
+            self._write_line('attachments', attachment)
+
+    def finish(self, sections: Dict[str, Any]):
+        """
+        Kalan bölümleri yazıp dosyayı kapatır
+
+        Args:
+            sections (Dict[str, Any]): Bölüm adı -> değer
+        """
+        for section in RESULT_SECTIONS[1:]:
+            if section == 'attachments':
+                continue
+            if section == 'statistics':
+                self._write_line(section, sections.get(section, {}))
+                continue
+            for record in sections.get(section, []):
+                self._write_line(section, record)
+        self.close()
+
+    def checkpoint(self) -> Dict:
+        self._handle.flush()
+        return {'offset': self._handle.tell(), 'count': self.count}
+
+    def close(self):
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+
+    def discard(self):
+        self.close()
+        self.json_file.unlink(missing_ok=True)
+
+
+# Rapor biçimi -> (yazıcı sınıfı, dosya uzantısı)
+REPORT_FORMATS = {
+    'json': (JsonResultSink, 'json'),
+    'ndjson': (NdjsonResultSink, 'ndjson'),
+}
+
+
+# Gönderen sayacının en fazla tuttuğu farklı gönderen (sabit bellek)
+TOP_SENDERS_CAPACITY = 1000
+# Raporlanan en fazla e-posta gönderen sayısı
+TOP_SENDERS = 10
+
+# E-posta boyutu histogramının kova üst sınırları (byte): 1 KiB, 4 KiB, ... 64 MiB
+SIZE_HISTOGRAM_BOUNDS = [1024 * 4 ** i for i in range(9)]
+
+
+class TopKCounter:
+    """
+    Space-Saving algoritmasıyla en sık görülen değerleri sabit bellekte sayar.
+
+    En fazla capacity farklı değer tutulur. Yeni bir değer geldiğinde sayaç
+    doluysa en küçük sayaç bu değere devredilir (sayı + 1, hata = eski sayı).
+    Farklı değer sayısı capacity'yi aşmadıkça sayımlar kesindir; aştığında
+    her sayım gerçek değerin üst sınırıdır ve en fazla errors[değer] kadar
+    fazladır.
+    """
+
+    def __init__(self, capacity: int = TOP_SENDERS_CAPACITY, state: List = None):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        # (sayı, değer) min-heap; artışlar heap'e yazılmaz, eski girdiler
+        # yalnızca en küçük sayaç aranırken düzeltilir
+        self._heap: List[Tuple[int, str]] = []
+        for key, count, error in state or []:
+            self.counts[key] = count
+            self.errors[key] = error
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(count, key) for key, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[str, int]:
+        """En küçük sayaca sahip değeri sayaçtan çıkarır"""
+        while True:
+            count, key = heapq.heappop(self._heap)
+            current = self.counts[key]
+            if current == count:
+                del self.counts[key]
+                return key, count
+            heapq.heappush(self._heap, (current, key))
+
+    def add(self, key: str, count: int = 1, error: int = 0):
+        if key in self.counts:
+            self.counts[key] += count
+            self.errors[key] += error
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[key] = count
+            self.errors[key] = error
+        else:
+            evicted, minimum = self._pop_min()
+            del self.errors[evicted]
+            self.counts[key] = minimum + count
+            self.errors[key] = minimum + error
+        heapq.heappush(self._heap, (self.counts[key], key))
+
+    def minimum(self) -> int:
+        """Sayaç doluysa en küçük sayım (bilinmeyen bir değerin üst sınırı), değilse 0"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def merge(self, other: 'TopKCounter'):
+        """
+        Başka bir sayacı ekler. Bir tarafta bulunmayan değerler için o tarafın
+        en küçük sayımı eklenir (üst sınır korunur), sonra en büyük capacity
+        sayaç tutulur.
+        """
+        own_minimum = self.minimum()
+        other_minimum = other.minimum()
+        for key in self.counts:
+            if key not in other.counts:
+                self.counts[key] += other_minimum
+                self.errors[key] += other_minimum
+        for key, count in other.counts.items():
+            if key in self.counts:
+                self.counts[key] += count
+                self.errors[key] += other.errors[key]
+            else:
+                self.counts[key] = count + own_minimum
+                self.errors[key] = other.errors[key] + own_minimum
+        if len(self.counts) > self.capacity:
+            kept = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)[:self.capacity]
+            self.counts = dict(kept)
+            self.errors = {key: self.errors[key] for key in self.counts}
+        self._rebuild_heap()
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda x: x[1], reverse=True)[:n]
+
+    def checkpoint(self) -> List:
+        return [[key, count, self.errors[key]] for key, count in self.counts.items()]
+
+
+class StatisticsSink(EmailSink):
+    """
+    E-posta istatistiklerini kayıtları tutmadan, sabit bellekte biriktirir:
+    sayılar, tarih aralığı, klasör başına e-posta sayısı, boyut histogramı ve
+    yaklaşık en fazla e-posta gönderenler (TopKCounter).
+
+    İşçilerden ve farklı PST dosyalarından gelen istatistikler merge() ile
+    birleştirilir.
+    """
+
+    def __init__(self, state: Dict = None):
+        state = state or {}
+        self.total_emails = state.get('total_emails', 0)
+        self.total_attachments = state.get('total_attachments', 0)
+        self.total_bytes = state.get('total_bytes', 0)
+        self.earliest = state.get('earliest')
+        self.latest = state.get('latest')
+        self.folders: Dict[str, int] = dict(state.get('folders', {}))
+        self.size_histogram: List[int] = list(state.get('size_histogram', [0] * (len(SIZE_HISTOGRAM_BOUNDS) + 1)))
+        self.senders = TopKCounter(state=state.get('senders'))
+
+    def write(self, email: Dict):
+        self.total_emails += 1
+        self.total_attachments += email.get('attachments_count', 0)
+
+        delivery_time = email.get('delivery_time')
+        if delivery_time:
+            if self.earliest is None or delivery_time < self.earliest:
+                self.earliest = delivery_time
+            if self.latest is None or delivery_time > self.latest:
+                self.latest = delivery_time
+
+        folder = email.get('folder', '')
+        self.folders[folder] = self.folders.get(folder, 0) + 1
+
+        size = email.get('size')
+        if isinstance(size, int):
+            self.total_bytes += size
+            self.size_histogram[bisect.bisect_left(SIZE_HISTOGRAM_BOUNDS, size)] += 1
+
+        self.senders.add(email.get('sender_email', 'unknown'))
+
+    def merge(self, other: 'StatisticsSink'):
+        """Başka bir işçide veya PST dosyasında biriktirilmiş istatistikleri ekler"""
+        self.total_emails += other.total_emails
+        self.total_attachments += other.total_attachments
+        self.total_bytes += other.total_bytes
+        if other.earliest is not None and (self.earliest is None or other.earliest < self.earliest):
+            self.earliest = other.earliest
+        if other.latest is not None and (self.latest is None or other.latest > self.latest):
+            self.latest = other.latest
+        for folder, count in other.folders.items():
+            self.folders[folder] = self.folders.get(folder, 0) + count
+        self.size_histogram = [a + b for a, b in zip(self.size_histogram, other.size_histogram)]
+        self.senders.merge(other.senders)
+
+    def checkpoint(self) -> Dict:
+        return {
+            'total_emails': self.total_emails,
+            'total_attachments': self.total_attachments,
+            'total_bytes': self.total_bytes,
+            'earliest': self.earliest,
+            'latest': self.latest,
+            'folders': dict(self.folders),
+            'size_histogram': list(self.size_histogram),
+            'senders': self.senders.checkpoint()
+        }
+
+    def to_dict(self) -> Dict:
+        """Rapora eklenecek e-posta istatistiklerini döndürür"""
+        stats = {}
+        if self.earliest is not None:
+            stats['email_date_range'] = {
+                'earliest': self.earliest,
+                'latest': self.latest
+            }
+        if self.senders.counts:
+            stats['top_senders'] = self.senders.most_common(TOP_SENDERS)
+        if self.folders:
+            stats['emails_per_folder'] = dict(self.folders)
+        if any(self.size_histogram):
+            stats['total_email_bytes'] = self.total_bytes
+            stats['size_histogram'] = [
+                {'max_bytes': bound, 'count': count}
+                for bound, count in zip(SIZE_HISTOGRAM_BOUNDS + [None], self.size_histogram)
+            ]
+        return stats
+
+
+class JsonLinesEmailSink(EmailSink):
+    """
+    E-postaları satır başına bir JSON nesnesi olarak yazar (bölüm ara dosyaları için)
+    """
+
+    def __init__(self, jsonl_file: Path):
+        self.jsonl_file = Path(jsonl_file)
+        self.count = 0
+        self._handle = open(self.jsonl_file, 'w', encoding='utf-8')
+
+    def write(self, email: Dict):
+        self._handle.write(json.dumps(email, ensure_ascii=False, default=_json_default))
+        self._handle.write('\n')
+        self.count += 1
+
+    def close(self):
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+
+
+# SQLite çıktısı: tek işlemde eklenen e-posta sayısı
+SQLITE_BATCH_SIZE = 1000
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS emails (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    folder TEXT,
+    subject TEXT,
+    sender_name TEXT,
+    sender_email TEXT,
+    delivery_time TEXT,
+    creation_time TEXT,
+    modification_time TEXT,
+    size INTEGER,
+    message_class TEXT,
+    priority TEXT,
+    importance TEXT,
+    categories TEXT,
+    read_flag INTEGER,
+    attachments_count INTEGER,
+    body_plain TEXT,
+    body_html TEXT
+);
+CREATE TABLE IF NOT EXISTS recipients (
+    email_seq INTEGER NOT NULL REFERENCES emails(seq),
+    email_id TEXT,
+    name TEXT,
+    email TEXT,
+    type TEXT
+);
+CREATE TABLE IF NOT EXISTS attachments (
+    email_seq INTEGER NOT NULL REFERENCES emails(seq),
+    email_id TEXT,
+    idx INTEGER,
+    name TEXT,
+    size INTEGER,
+    type TEXT,
+    sha256 TEXT,
+    saved_path TEXT
+);
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT,
+    name TEXT,
+    item_count INTEGER,
+    container_class TEXT,
+    index_path TEXT
+);
+"""
+
+# İndeksler toplu yüklemeden sonra kurulur (satır başına indeks güncellemesi olmaz)
+SQLITE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_emails_sender ON emails(sender_email);
+CREATE INDEX IF NOT EXISTS idx_emails_folder ON emails(folder);
+CREATE INDEX IF NOT EXISTS idx_emails_delivery_time ON emails(delivery_time);
+CREATE INDEX IF NOT EXISTS idx_recipients_email_seq ON recipients(email_seq);
+CREATE INDEX IF NOT EXISTS idx_recipients_email ON recipients(email);
+CREATE INDEX IF NOT EXISTS idx_attachments_email_seq ON attachments(email_seq);
+CREATE INDEX IF NOT EXISTS idx_attachments_sha256 ON attachments(sha256);
+CREATE INDEX IF NOT EXISTS idx_folders_path ON folders(path);
+"""
+
+_SQLITE_EMAIL_COLUMNS = [
+    'id', 'folder', 'subject', 'sender_name', 'sender_email', 'delivery_time',
+    'creation_time', 'modification_time', 'size', 'message_class', 'priority',
+    'importance', 'categories', 'read_flag', 'attachments_count', 'body_plain', 'body_html'
+]
+
+
+def _sql_value(value):
+    """Değeri SQLite'ın saklayabileceği bir türe çevirir"""
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='ignore')
+    return str(value)
+
+
+class SqliteEmailSink(EmailSink):
+    """
+    E-postaları normalize edilmiş bir SQLite veritabanına yazar
+    (emails_<ts>.sqlite: emails, recipients, attachments, folders).
+
+    Kayıtlar SQLITE_BATCH_SIZE e-postalık gruplar halinde tek işlemde
+    executemany ile eklenir; indeksler finish() sırasında kurulur.
+    Alıcı ve ek satırları e-postaya emails.seq üzerinden bağlanır.
+    """
+
+    def __init__(self, db_file: Path, batch_size: int = SQLITE_BATCH_SIZE, state: Dict = None):
+        self.db_file = Path(db_file)
+        self.batch_size = batch_size
+        self.count = 0
+        self._emails = []
+        self._recipients = []
+        self._attachments = []
+        
+        if not state:
+            self.db_file.unlink(missing_ok=True)
+        self._conn = sqlite3.connect(self.db_file)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SQLITE_SCHEMA)
+        
+        if state:
+            # Kontrol noktasından devam: sonrasında eklenmiş satırları at
+            self.count = state['count']
+            with self._conn:
+                for table, column in (('recipients', 'email_seq'), ('attachments', 'email_seq'), ('emails', 'seq')):
+                    self._conn.execute(f"DELETE FROM {table} WHERE {column} > ?", (self.count,))
+
+    def write(self, email: Dict):
+        self.count += 1
+        seq = self.count
+        self._emails.append([seq] + [_sql_value(email.get(column)) for column in _SQLITE_EMAIL_COLUMNS])
+        for recipient in email.get('recipients', []):
+            self._recipients.append((seq, email['id'], _sql_value(recipient.get('name')),
+                                     _sql_value(recipient.get('email')), _sql_value(recipient.get('type'))))
+        for attachment in email.get('attachments', []):
+            self._attachments.append((seq, email['id'], attachment.get('index'), _sql_value(attachment.get('name')),
+                                      attachment.get('size'), _sql_value(attachment.get('type')),
+                                      attachment.get('sha256'), attachment.get('saved_path')))
+        if len(self._emails) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        """Bekleyen satırları tek işlemde ekler"""
+        if not self._emails:
+            return
+        placeholders = ', '.join('?' * (len(_SQLITE_EMAIL_COLUMNS) + 1))
+        with self._conn:
+            self._conn.executemany(f"INSERT INTO emails VALUES ({placeholders})", self._emails)
+            self._conn.executemany("INSERT INTO recipients VALUES (?, ?, ?, ?, ?)", self._recipients)
+            self._conn.executemany("INSERT INTO attachments VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._attachments)
+        self._emails = []
+        self._recipients = []
+        self._attachments = []
+
+    def finish(self, folders: List[Dict]):
+        """
+        Klasör dizinini yazar, indeksleri kurar ve veritabanını kapatır
+
+        Args:
+            folders (List[Dict]): Klasör dizini
+        """
+        self._flush()
+        with self._conn:
+            self._conn.execute("DELETE FROM folders")
+            self._conn.executemany("INSERT INTO folders VALUES (?, ?, ?, ?, ?)", [
+                (entry['path'], entry['name'], entry['item_count'], entry['container_class'],
+                 '/'.join(map(str, entry['index_path'])))
+                for entry in folders
+            ])
+        self._conn.executescript(SQLITE_INDEXES)
+        self.close()
+
+    def checkpoint(self) -> Dict:
+        self._flush()
+        return {'count': self.count}
+
+    def close(self):
+        if self._conn:
+            try:
+                self._flush()
+            finally:
+                self._close_connection()
+
+    def discard(self):
+        # Bekleyen satırlar yazılmaz; veritabanı silinir
+        self._emails = []
+        self._recipients = []
+        self._attachments = []
+        self._close_connection()
+        for suffix in ('', '-wal', '-shm'):
+            self.db_file.with_name(self.db_file.name + suffix).unlink(missing_ok=True)
+
+    def _close_connection(self):
+        """WAL dosyasını veritabanına aktarıp bağlantıyı kapatır (-wal/-shm dosyaları kalmaz)"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.rollback()
+            self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        finally:
+            self._conn.close()
+            self._conn = None
+
+
+# Yinelenen mesaj dizini: Bloom filtresi kapasitesi ve yanlış pozitif oranı
+DEDUP_CAPACITY = 10_000_000
+DEDUP_ERROR_RATE = 0.01
+# Tek işlemde kontrol edilen mesaj sayısı (dizin kilidi bu süre tutulur)
+DEDUP_BATCH_SIZE = 1_000
+
+_MESSAGE_ID_PATTERN = re.compile(r'^message-id:\s*(.+?)\s*$', re.IGNORECASE | re.MULTILINE)
+
+# duplicates_<ts>.csv kolonları
+DUPLICATE_CSV_FIELDNAMES = ['key', 'folder', 'subject', 'sender_email', 'first_pst', 'first_folder']
+
+
+def message_dedup_key(message) -> bytes:
+    """
+    Mesajın PST dosyalarından bağımsız kimliği (16 byte): transport
+    başlıklarındaki Message-ID, yoksa konu, gönderen, zaman ve boyuttan
+    oluşan içerik parmak izi
+    """
+    headers = getattr(message, 'transport_headers', None)
+    if isinstance(headers, bytes):
+        headers = headers.decode('utf-8', errors='ignore')
+    match = _MESSAGE_ID_PATTERN.search(headers) if headers else None
+    if match:
+        material = 'mid:' + match.group(1)
+    else:
+        material = 'fp:' + '\x1f'.join(str(getattr(message, name, '') or '') for name in (
+            'subject', 'sender_email_address', 'delivery_time', 'creation_time', 'size'))
+    return hashlib.blake2b(material.encode('utf-8', errors='ignore'), digest_size=16).digest()
+
+
+class BloomFilter:
+    """
+    Blok Bloom filtresi: anahtarın ilk 8 byte'ı 64 bitlik bir kelimeyi,
+    sonraki byte'ları o kelimedeki 7 biti seçer; her kontrol tek
+    bir kelimeye dokunur ve Python'da döngüsüz yapılır. Aynı boyutta klasik
+    filtreden biraz daha fazla yanlış pozitif verdiği için boyut %25 büyük
+    seçilir. count, filtreyi kullanan tarafından tutulur (kayıtlı filtrenin
+    depoyla uyumunu denetlemek için).
+    """
+
+    _MAGIC = b'PSTBLOOM2'
+
+    def __init__(self, capacity: int, error_rate: float = DEDUP_ERROR_RATE):
+        self.capacity = capacity
+        bits = -capacity * math.log(error_rate) / (math.log(2) ** 2) * 1.25
+        self.words = max(1, int(bits // 64) + 1)
+        self.count = 0
+        self._array = array.array('Q', bytes(8 * self.words))
+
+    def add(self, key: bytes) -> bool:
+        """
+        Anahtarı filtreye ekler
+
+        Returns:
+            bool: Anahtar eklenmeden önce de "belki var" durumundaysa True
+        """
+        word = int.from_bytes(key[:8], 'little') % self.words
+        h = int.from_bytes(key[8:16], 'little')
+        # 7 bit konumu, her biri 6 bit
+        mask = (1 << (h & 63)) | (1 << ((h >> 6) & 63)) | (1 << ((h >> 12) & 63)) | \
+            (1 << ((h >> 18) & 63)) | (1 << ((h >> 24) & 63)) | (1 << ((h >> 30) & 63)) | \
+            (1 << ((h >> 36) & 63))
+        old = self._array[word]
+        if old & mask == mask:
+            return True
+        self._array[word] = old | mask
+        return False
+
+    def save(self, path: Path):
+        """Filtreyi geçici dosya + rename ile yazar"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(self._MAGIC)
+            f.write(json.dumps({'capacity': self.capacity, 'words': self.words,
+                                'count': self.count}).encode() + b'\n')
+            self._array.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['BloomFilter']:
+        """Kayıtlı filtreyi okur; yoksa veya bozuksa None"""
+        try:
+            with open(path, 'rb') as f:
+                if f.read(len(cls._MAGIC)) != cls._MAGIC:
+                    return None
+                header = json.loads(f.readline())
+                bloom = cls.__new__(cls)
+                bloom.capacity = header['capacity']
+                bloom.words = header['words']
+                bloom.count = header['count']
+                bloom._array = array.array('Q')
+                bloom._array.fromfile(f, bloom.words)
+            return bloom
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+
+
+class DedupIndex:
+    """
+    PST dosyaları arasında yinelenen mesajları bulan kalıcı dizin.
+
+    Önde bellekteki Bloom filtresi, arkada kesin SQLite deposu (anahtar ->
+    ilk görüldüğü PST ve klasör) bulunur. Anahtarlar DEDUP_BATCH_SIZE'lık
+    gruplar halinde tek işlemde kontrol edilip kaydedilir; filtrenin
+    "kesinlikle yok" dediği anahtarlar depoda aranmaz. Anahtar başka bir PST
+    dosyasında görülmüşse mesaj yinelenen sayılır; aynı dosyadaki kayıtlar
+    (yeniden çalıştırma, kaldığı yerden devam) yinelenen sayılmaz.
+
+    dedup.lock üzerindeki özel kilit yalnızca bu işlemler süresince tutulur;
+    aynı dizini kullanan süreçler paralel çalışır. Başka bir süreç depoya
+    yazdığında filtre eksik kalacağından o andan sonra tüm anahtarlar depoda
+    aranır.
+    """
+
+    def __init__(self, index_dir: Path, capacity: int = DEDUP_CAPACITY,
+                 error_rate: float = DEDUP_ERROR_RATE, logger=None):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logger or logging.getLogger(__name__)
+        self._sources: Dict[Tuple[str, str], int] = {}
+        # Filtre depodaki tüm anahtarları içermiyorsa True
+        self._stale = False
+        
+        self._lock_handle = open(self.index_dir / 'dedup.lock', 'w')
+        self._conn = sqlite3.connect(self.index_dir / 'dedup.sqlite', timeout=60)
+        with self._locked():
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA cache_size=-65536')  # 64 MiB
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    id INTEGER PRIMARY KEY,
+                    pst TEXT NOT NULL,
+                    folder TEXT NOT NULL,
+                    UNIQUE (pst, folder)
+                );
+                CREATE TABLE IF NOT EXISTS messages (
+                    key BLOB PRIMARY KEY,
+                    source INTEGER NOT NULL
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER);
+            """)
+            self.count = self._stored_count()
+            
+            # Filtre depoyla aynı sayıda anahtar içermiyorsa (yarım kalmış
+            # çalışma, eşzamanlı yazan süreç) depodan yeniden kurulur
+            self._bloom_file = self.index_dir / 'dedup.bloom'
+            self.bloom = BloomFilter.load(self._bloom_file)
+            if self.bloom is None or self.bloom.count != self.count or self.count > self.bloom.capacity:
+                self.bloom = BloomFilter(max(capacity, self.count * 2), error_rate)
+                for (key,) in self._conn.execute("SELECT key FROM messages"):
+                    self.bloom.add(key)
+                self.bloom.count = self.count
+                self.logger.info(f"Yinelenen mesaj dizini filtresi kuruldu: {self.count:,} anahtar")
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """dedup.lock üzerinde özel kilit (fcntl yoksa yalnızca SQLite kilidi)"""
+        if fcntl:
+            try:
+                fcntl.flock(self._lock_handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                fcntl.flock(self._lock_handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(self._lock_handle, fcntl.LOCK_UN)
+
+    def _stored_count(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'count'").fetchone()
+        return row[0] if row else 0
+
+    def check_batch(self, entries: List[Tuple[bytes, str]], pst: str) -> Dict[bytes, Tuple[str, str]]:
+        """
+        Anahtarları tek işlemde kontrol eder ve ilk kez görülenleri kaydeder
+
+        Args:
+            entries (List[Tuple[bytes, str]]): (message_dedup_key, klasör) çiftleri
+            pst (str): Mesajların PST dosyası
+
+        Returns:
+            Dict[bytes, Tuple[str, str]]: Başka bir PST'de görülmüş anahtar -> (ilk PST, ilk klasör)
+        """
+        duplicates: Dict[bytes, Tuple[str, str]] = {}
+        if not entries:
+            return duplicates
+        with self._locked(), self._conn:
+            stored = self._stored_count()
+            if stored != self.count:
+                self._stale = True
+            new: Dict[bytes, int] = {}
+            for key, folder in entries:
+                if key in new or key in duplicates:
+                    continue
+                if self.bloom.add(key) or self._stale:
+                    row = self._conn.execute(
+                        "SELECT s.pst, s.folder FROM messages m JOIN sources s ON s.id = m.source WHERE m.key = ?",
+                        (key,)).fetchone()
+                    if row:
+                        if row[0] != pst:
+                            duplicates[key] = (row[0], row[1])
+                        continue
+                new[key] = self._source_id(pst, folder)
+            if new:
+                # Sıralı ekleme B-ağacında sayfa atlamalarını azaltır
+                inserted = self._conn.executemany("INSERT OR IGNORE INTO messages VALUES (?, ?)",
+                                                  sorted(new.items())).rowcount
+                self.count = stored + inserted
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('count', ?)", (self.count,))
+            else:
+                self.count = stored
+        return duplicates
+
+    def _source_id(self, pst: str, folder: str) -> int:
+        """PST + klasör çiftinin kaynak numarası (gerekirse oluşturulur)"""
+        source = self._sources.get((pst, folder))
+        if source is None:
+            self._conn.execute("INSERT OR IGNORE INTO sources (pst, folder) VALUES (?, ?)", (pst, folder))
+            source = self._conn.execute("SELECT id FROM sources WHERE pst = ? AND folder = ?",
+                                        (pst, folder)).fetchone()[0]
+            self._sources[(pst, folder)] = source
+        return source
+
+    def close(self):
+        """Filtre depodaki tüm anahtarları içeriyorsa kaydeder ve dizini kapatır"""
+        if self._conn is None:
+            return
+        with self._locked():
+            if not self._stale and self._stored_count() == self.count:
+                self.bloom.count = self.count
+                self.bloom.save(self._bloom_file)
+        self._conn.close()
+        self._conn = None
+        self._lock_handle.close()
+
+
+# Çıkarma aşamaları (metrics_<ts>.json içindeki sırasıyla)
+METRIC_STAGES = ['traversal', 'properties', 'decode', 'attachments', 'serialization']
+
+# Raporlanan en yavaş klasör sayısı
+SLOWEST_FOLDERS = 10
+
+# profile_<ts>.txt / tracemalloc_<ts>.txt raporlarındaki satır sayısı
+PROFILE_TOP = 50
+TRACEMALLOC_TOP = 30
+
+
+def peak_rss_bytes(who: int = None) -> Optional[int]:
+    """
+    Sürecin (veya RUSAGE_CHILDREN ile alt süreçlerin) tepe bellek kullanımı
+    (resource modülü yoksa None)
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who is None else who)
+    # Linux'ta KiB, macOS'ta byte
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+class _StageTimer:
+    """ExtractionMetrics.stage() tarafından döndürülen zamanlayıcı"""
+
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics: 'ExtractionMetrics', name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.metrics._nested.append(0.0)
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        nested = self.metrics._nested.pop()
+        # Aşama süresi iç içe aşamaların süresini içermez
+        self.metrics.stage_seconds[self.name] = self.metrics.stage_seconds.get(self.name, 0.0) + elapsed - nested
+        self.metrics.stage_calls[self.name] = self.metrics.stage_calls.get(self.name, 0) + 1
+        if self.metrics._nested:
+            self.metrics._nested[-1] += elapsed
+        return False
+
+
+class ExtractionMetrics:
+    """
+    Çıkarma sırasında aşama sürelerini ve klasör bazında verimi toplar.
+
+    Aşamalar (METRIC_STAGES) iç içe ölçülebilir; her aşamaya yalnızca kendi
+    süresi yazılır (ör. properties süresine decode ve attachments dahil değildir).
+    Bölüm işçilerinin metrikleri checkpoint()/merge() ile birleştirilir; bu
+    durumda aşama süreleri işçilerin toplam süresidir.
+    """
+
+    def __init__(self, state: Dict = None):
+        state = state or {}
+        self.stage_seconds: Dict[str, float] = dict(state.get('stage_seconds', {}))
+        self.stage_calls: Dict[str, int] = dict(state.get('stage_calls', {}))
+        # path -> [mesaj, byte, saniye]
+        self.folders: Dict[str, List] = {path: list(values) for path, values in state.get('folders', {}).items()}
+        self._nested: List[float] = []
+
+    def stage(self, name: str) -> _StageTimer:
+        """with metrics.stage('decode'): ... biçiminde kullanılır"""
+        return _StageTimer(self, name)
+
+    def record_folder(self, folder_path: str, messages: int, size: int, seconds: float):
+        """Bir klasörün (veya mesaj aralığının) işlenme sonucunu ekler"""
+        totals = self.folders.setdefault(folder_path, [0, 0, 0.0])
+        totals[0] += messages
+        totals[1] += size
+        totals[2] += seconds
+
+    def merge(self, other: 'ExtractionMetrics'):
+        """Başka bir işçinin metriklerini bu toplama ekler"""
+        for name, seconds in other.stage_seconds.items():
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+        for name, calls in other.stage_calls.items():
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + calls
+        for path, (messages, size, seconds) in other.folders.items():
+            self.record_folder(path, messages, size, seconds)
+
+    def checkpoint(self) -> Dict:
+        return {'stage_seconds': self.stage_seconds, 'stage_calls': self.stage_calls, 'folders': self.folders}
+
+    @staticmethod
+    def _rates(messages: int, size: int, seconds: float) -> Dict:
+        return {
+            'messages': messages,
+            'bytes': size,
+            'seconds': round(seconds, 6),
+            'messages_per_sec': round(messages / seconds, 2) if seconds > 0 else None,
+            'bytes_per_sec': round(size / seconds, 2) if seconds > 0 else None,
+        }
+
+    def to_dict(self, wall_seconds: float) -> Dict:
+        """
+        metrics_<ts>.json içeriği
+
+        Args:
+            wall_seconds (float): PST analizinin toplam duvar saati süresi
+        """
+        messages = sum(values[0] for values in self.folders.values())
+        size = sum(values[1] for values in self.folders.values())
+        stage_total = sum(self.stage_seconds.values())
+        stages = {}
+        for name in METRIC_STAGES + sorted(set(self.stage_seconds) - set(METRIC_STAGES)):
+            seconds = self.stage_seconds.get(name, 0.0)
+            stages[name] = {
+                'seconds': round(seconds, 6),
+                'calls': self.stage_calls.get(name, 0),
+                'share': round(seconds / stage_total, 4) if stage_total else 0.0,
+            }
+        folders = [dict(path=path, **self._rates(*values)) for path, values in self.folders.items()]
+        return {
+            'pst': self._rates(messages, size, wall_seconds),
+            'stages': stages,
+            'peak_rss_bytes': peak_rss_bytes(),
+            'peak_rss_children_bytes': peak_rss_bytes(resource.RUSAGE_CHILDREN) if resource else None,
+            'slowest_folders': sorted(folders, key=lambda folder: folder['seconds'], reverse=True)[:SLOWEST_FOLDERS],
+            'folders': folders,
+        }
+
+
+class AttachmentStore:
+    """
+    Ek dosyalarını içerik adresli bir depoya yazar: attachments/<sha[:2]>/<sha256>.
+
+    Veri pypff'den (yalnızca çağıran thread'de) sabit boyutlu parçalar halinde
+    okunur ve özeti çıkarılır; disk yazımı arka plandaki thread havuzunda
+    yapılır, böylece MAPI ayrıştırma ile dosya G/Ç'si örtüşür. Aynı içerik
+    (imza logoları, tekrar gönderilen PDF'ler) diske yalnızca bir kez yazılır.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    QUEUE_DEPTH = 4
+
+    def __init__(self, root_dir: Path, workers: int = 4, chunk_size: int = CHUNK_SIZE, logger=None):
+        self.root_dir = Path(root_dir)
+        self.chunk_size = chunk_size
+        self.logger = logger or logging.getLogger(__name__)
+        self.stored = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+        self._known = set()
+        self._pending = set()
+        self._lock = threading.Lock()
+        # Bekleyen yazım sayısı sınırlı: bellekte en fazla bu kadar ek bulunur
+        self._slots = threading.BoundedSemaphore(max(1, workers) * 2)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='attachment-writer')
+        # Süreç başına ayrı geçici dizin (paralel işçiler aynı depoyu paylaşır)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._tmp_dir = Path(tempfile.mkdtemp(prefix='.tmp_', dir=self.root_dir))
+
+    def path_for(self, digest: str) -> Path:
+        """Özet değerine karşılık gelen depo yolunu döndürür"""
+        return self.root_dir / digest[:2] / digest
+
+    def save(self, attachment) -> Optional[Dict]:
+        """
+        Ek dosyasını depoya gönderir; yazım arka planda tamamlanır
+        
+        Args:
+            attachment: pypff attachment objesi
+            
+        Returns:
+            Optional[Dict]: sha256, path, size (veri yoksa None)
+        """
+        chunks = self._read_chunks(attachment)
+        first = next(chunks, b'')
+        if not first:
+            return None
+        
+        hasher = hashlib.sha256(first)
+        chunk = next(chunks, None)
+        if chunk is None:
+            # Tek parçalık ek: önce özet, yalnızca yeni içerik yazılır
+            digest = hasher.hexdigest()
+            if self._claim(digest):
+                self._submit(self._write_blob, digest, first)
+            return {'sha256': digest, 'path': self.path_for(digest), 'size': len(first)}
+        
+        # Çok parçalı ek: parçalar sınırlı bir kuyruk üzerinden yazıcıya akar
+        pipe = queue.Queue(maxsize=self.QUEUE_DEPTH)
+        self._submit(self._write_stream, pipe)
+        size = 0
+        try:
+            while chunk is not None:
+                pipe.put(first)
+                size += len(first)
+                first = chunk
+                hasher.update(chunk)
+                chunk = next(chunks, None)
+            pipe.put(first)
+            size += len(first)
+        except BaseException:
+            pipe.put(None)
+            raise
+        
+        digest = hasher.hexdigest()
+        pipe.put((digest,))
+        return {'sha256': digest, 'path': self.path_for(digest), 'size': size}
+
+    def flush(self):
+        """O ana kadar gönderilmiş yazımların tamamlanmasını bekler"""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def close(self):
+        """Bekleyen tüm yazımların bitmesini bekler"""
+        self._executor.shutdown(wait=True)
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+        self.logger.info(f"Ek deposu: {self.stored} dosya yazıldı ({self.bytes_written:,} byte), "
+                         f"{self.deduplicated} tekrar atlandı")
+
+    def _read_chunks(self, attachment) -> Iterator[bytes]:
+        """Ek verisini chunk_size boyutlu parçalar halinde okur"""
+        if hasattr(attachment, 'read_buffer'):
+            size = attachment.get_size() if hasattr(attachment, 'get_size') else getattr(attachment, 'size', 0)
+            if hasattr(attachment, 'seek_offset'):
+                attachment.seek_offset(0, os.SEEK_SET)
+            remaining = size or 0
+            while remaining > 0:
+                chunk = attachment.read_buffer(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+            return
+        
+        data = getattr(attachment, 'data', None)
+        if data:
+            for offset in range(0, len(data), self.chunk_size):
+                yield data[offset:offset + self.chunk_size]
+
+    def _claim(self, digest: str) -> bool:
+        """İçerik ilk kez görülüyorsa True döndürür; aksi halde tekrar sayılır"""
+        with self._lock:
+            if digest in self._known or self.path_for(digest).exists():
+                self._known.add(digest)
+                self.deduplicated += 1
+                return False
+            self._known.add(digest)
+            return True
+
+    def _submit(self, fn, *args):
+        self._slots.acquire()
+        future = self._executor.submit(fn, *args)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _tmp_path(self) -> Path:
+        return self._tmp_dir / uuid.uuid4().hex
+
+    def _publish(self, tmp_path: Path, digest: str, size: int):
+        target = self.path_for(digest)
+        target.parent.mkdir(exist_ok=True)
+        os.replace(tmp_path, target)
+        with self._lock:
+            self.stored += 1
+            self.bytes_written += size
+
+    def _write_blob(self, digest: str, data: bytes):
+        tmp_path = self._tmp_path()
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            self._publish(tmp_path, digest, len(data))
+        except Exception as e:
+            self.logger.warning(f"Ek dosya kaydetme hatası: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _write_stream(self, pipe: queue.Queue):
+        tmp_path = self._tmp_path()
+        size = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                while True:
+                    item = pipe.get()
+                    if item is None:
+                        # Okuma yarıda kesildi
+                        tmp_path.unlink(missing_ok=True)
+                        return
+                    if isinstance(item, tuple):
+                        digest = item[0]
+                        break
+                    f.write(item)
+                    size += len(item)
+            if self._claim(digest):
+                self._publish(tmp_path, digest, size)
+            else:
+                tmp_path.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.warning(f"Ek dosya kaydetme hatası: {e}")
+            tmp_path.unlink(missing_ok=True)
+            # Üreticinin kuyrukta takılı kalmaması için kalan parçaları tüket
+            while not isinstance(pipe.get(), (tuple, type(None))):
+                pass
+
+
+@dataclass
+class WorkUnit:
+    """
+    Paralel çıkarımda bir işçiye verilen iş parçası.
+
+    recursive=True ise klasör tüm alt ağacıyla işlenir; aksi halde yalnızca
+    klasörün kendi mesajlarının [start, stop) aralığı işlenir.
+    """
+    index: int
+    index_path: Tuple[int, ...]
+    folder_path: str
+    recursive: bool
+    message_count: int
+    start: int = 0
+    stop: Optional[int] = None
+
+
+def _get_sub_folder(folder, index: int):
+    """Klasörün index numaralı alt klasörünü döndürür"""
+    if hasattr(folder, 'get_sub_folder'):
+        return folder.get_sub_folder(index)
+    return next(itertools.islice(folder.sub_folders, index, None))
+
+
+def _balance_units(units: List[WorkUnit], bins: int) -> List[List[WorkUnit]]:
+    """
+    İş parçalarını mesaj sayısına göre işçilere dengeli dağıtır (en büyük önce)
+    
+    Args:
+        units (List[WorkUnit]): Planlanan iş parçaları
+        bins (int): İşçi sayısı
+        
+    Returns:
+        List[List[WorkUnit]]: İşçi başına iş parçaları (boş gruplar hariç)
+    """
+    heap = [(0, i) for i in range(bins)]
+    groups: List[List[WorkUnit]] = [[] for _ in range(bins)]
+    for unit in sorted(units, key=lambda u: u.message_count, reverse=True):
+        load, i = heapq.heappop(heap)
+        groups[i].append(unit)
+        heapq.heappush(heap, (load + unit.message_count, i))
+    return [sorted(group, key=lambda u: u.index) for group in groups if group]
+
+
+def pst_fingerprint(pst_file_path: Path, sample_size: int = 1024 * 1024) -> Dict:
+    """
+    PST dosyasının değişip değişmediğini anlamak için hızlı parmak izi üretir
+    (boyut, mtime ve ilk/son sample_size byte'ın sha256 özeti)
+    """
+    path = Path(pst_file_path)
+    st = path.stat()
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        hasher.update(f.read(sample_size))
+        if st.st_size > sample_size:
+            f.seek(max(sample_size, st.st_size - sample_size))
+            hasher.update(f.read(sample_size))
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'partial_sha256': hasher.hexdigest()}
+
+
+def _same_pst(recorded: Optional[Dict], pst_file_path: Path) -> bool:
+    """
+    Kayıtlı parmak izi dosyanın şu anki haliyle eşleşiyor mu? Boyut ve mtime
+    aynıysa özet hesaplanmaz; yalnızca mtime değiştiyse kısmi özete bakılır.
+    """
+    if not recorded:
+        return False
+    st = Path(pst_file_path).stat()
+    if recorded.get('size') != st.st_size:
+        return False
+    if recorded.get('mtime_ns') == st.st_mtime_ns:
+        return True
+    return recorded.get('partial_sha256') == pst_fingerprint(pst_file_path)['partial_sha256']
+
+
+def _load_json_file(path: Path, default=None):
+    """JSON dosyasını okur; yoksa veya bozuksa default döner"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json_atomic(path: Path, data):
+    """JSON dosyasını geçici dosya + rename ile yazar (yarım dosya kalmaz)"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=_json_default)
+    os.replace(tmp_path, path)
+
+
+def _extract_partition(pst_file_path: str, output_dir: str, parts_dir: str,
+                       units: List[WorkUnit], **options) -> int:
+    """
+    İşçi süreçte çalışır: PST dosyasını kendi okuyucu handle'ı ile açar ve
+    verilen iş parçalarındaki e-postaları ara dosyalara (CSV + JSON satırları)
+    yazar. Her parça bitince part_<no>.done.json dosyasına parçanın e-posta
+    istatistikleri ile kişi, takvim vb. öğeleri yazılır; bu dosya parçanın
+    tamamlandığını da gösterir (yeniden başlatmada atlanır). Parçanın
+    çıkarma metrikleri de aynı dosyaya yazılır.
+    
+    Args:
+        **options: PSTAnalyzer seçenekleri (attachment_workers, fields, body_chars,
+            reader, dedup_keys, log_file)
+    
+    Returns:
+        int: Tamamlanan parça sayısı
+    """
+    analyzer = PSTAnalyzer(pst_file_path, output_dir, streaming=True, **options)
+    if not analyzer.open_pst_file():
+        analyzer.close_logging()
+        raise RuntimeError(f"PST dosyası açılamadı: {pst_file_path}")
+    
+    parts_dir = Path(parts_dir)
+    try:
+        for unit in units:
+            analyzer.logger.info(f"Bölüm işleniyor: #{unit.index} {unit.folder_path or '/'} ({unit.message_count} mesaj)")
+            csv_sink = CsvEmailSink(parts_dir / f"part_{unit.index:05d}.csv", write_header=False)
+            jsonl_sink = JsonLinesEmailSink(parts_dir / f"part_{unit.index:05d}.jsonl")
+            stats_sink = StatisticsSink()
+            items: Dict[str, List[Dict]] = {}
+            analyzer.metrics = ExtractionMetrics()
+            try:
+                for section, data in analyzer.iter_unit_items(unit):
+                    if section == 'emails':
+                        with analyzer.metrics.stage('serialization'):
+                            csv_sink.write(data)
+                            jsonl_sink.write(data)
+                            stats_sink.write(data)
+                    else:
+                        items.setdefault(section, []).append(data)
+            finally:
+                csv_sink.close()
+                jsonl_sink.close()
+            
+            # Parçanın ekleri diske yazılmadan tamamlandı sayılmaz
+            if analyzer.attachment_store:
+                analyzer.attachment_store.flush()
+            _write_json_atomic(parts_dir / f"part_{unit.index:05d}.done.json", {
+                'stats': stats_sink.checkpoint(),
+                'items': items,
+                'metrics': analyzer.metrics.checkpoint()
+            })
+    finally:
+        analyzer.close_attachment_store()
+        analyzer.close_pst_file()
+        analyzer.close_logging()
+    
+    return len(units)
+
+
+# Log satırı biçimi (analiz ve işçi log dosyaları)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Uyarı seli sınırı: çağrı noktası başına pencere içinde geçen uyarı sayısı;
+# sonrasında her LOG_SAMPLE_EVERY uyarıdan biri (bastırılan sayısıyla) yazılır
+LOG_RATE_BURST = 20
+LOG_RATE_WINDOW = 60.0  # saniye
+LOG_SAMPLE_EVERY = 100
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Aynı süreçteki dinleyiciye giden QueueHandler: kayıt kuyruğa olduğu gibi
+    konur, biçimlendirme (mesaj, zaman, traceback) dinleyici thread'inde yapılır
+    """
+    
+    def prepare(self, record):
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Bozuk mesaj selinde uyarıları çağrı noktası (dosya, satır) başına sınırlar:
+    her pencerede ilk `burst` uyarı geçer, sonrasında her `sample_every`
+    uyarıdan biri bastırılan kayıt sayısıyla birlikte yazılır. INFO ve altı
+    sınırlanmaz.
+    """
+    
+    def __init__(self, burst: int = LOG_RATE_BURST, window: float = LOG_RATE_WINDOW,
+                 sample_every: int = LOG_SAMPLE_EVERY):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.sample_every = max(1, sample_every)
+        # (pathname, lineno) -> [pencere başlangıcı, penceredeki uyarı, bastırılan]
+        self._sites: Dict[Tuple[str, int], List] = {}
+        self.suppressed_total = 0
+    
+    def filter(self, record) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+        
+        now = time.monotonic()
+        site = self._sites.get((record.pathname, record.lineno))
+        if site is None:
+            site = self._sites[(record.pathname, record.lineno)] = [now, 0, 0]
+        elif now - site[0] >= self.window:
+            if site[2]:
+                self._annotate(record, f"önceki pencerede {site[2]} benzer uyarı bastırıldı")
+            site[0], site[1], site[2] = now, 0, 0
+        
+        site[1] += 1
+        if site[1] <= self.burst:
+            return True
+        if (site[1] - self.burst) % self.sample_every == 0:
+            self._annotate(record, f"örnek; {site[2]} benzer uyarı bastırıldı")
+            site[2] = 0
+            return True
+        site[2] += 1
+        self.suppressed_total += 1
+        return False
+    
+    @staticmethod
+    def _annotate(record, note: str):
+        record.msg = f"{record.getMessage()} ({note})"
+        record.args = None
 
 
 class PSTAnalyzer:
@@ -21,23 +1795,75 @@ class PSTAnalyzer:
     .pst dosyalarını analiz eden ana sınıf
     """
     
-    def __init__(self, pst_file_path: str, output_dir: str = None):
+    def __init__(self, pst_file_path: str, output_dir: str = None, streaming: bool = False,
+                 partitions: int = 1, attachment_workers: int = 4, resume: bool = False,
+                 fields: List[str] = None, body_chars: int = BODY_PREFIX_CHARS,
+                 report_format: str = 'json', sqlite: bool = False,
+                 profile: bool = False, trace_memory: bool = False,
+                 reader: PSTReader = None, dedup_index: str = None, dedup_keys: bool = False,
+                 log_file: str = None):
         """
         PSTAnalyzer başlatıcı
         
         Args:
             pst_file_path (str): .pst dosyasının yolu
             output_dir (str): Çıktı dizini (varsayılan: pst dosyası yanında)
+            streaming (bool): True ise e-postalar bellekte tutulmadan doğrudan
+                çıktı dosyalarına yazılır
+            partitions (int): 1'den büyükse klasör ağacı bu kadar işçi sürece
+                bölünerek paralel çıkarılır (akış modunu içerir)
+            attachment_workers (int): Ek dosyalarını yazan arka plan thread sayısı
+            resume (bool): Klasör bazında kontrol noktası tut ve yarım kalmış
+                çalışmaya kaldığı yerden devam et (akış modunu içerir)
+            fields (List[str]): Okunacak e-posta alanları (None ise tümü);
+                seçilmeyen MAPI özellikleri hiç okunmaz
+            body_chars (int): Gövde alanlarında saklanan en fazla karakter
+            report_format (str): Analiz raporu biçimi: json (girintili) veya
+                ndjson (satır başına bir kompakt kayıt)
+            sqlite (bool): E-postaları ayrıca emails_<ts>.sqlite veritabanına yaz
+            profile (bool): Analizi cProfile ile profille (profile_<ts>.prof/.txt)
+            trace_memory (bool): Bellek ayırmalarını tracemalloc ile izle
+                (tracemalloc_<ts>.txt)
+            reader (PSTReader): PST okuyucusu (varsayılan: PypffReader)
+            dedup_index (str): Yinelenen mesaj dizini klasörü; başka bir PST
+                dosyasında görülmüş e-postalar atlanır (duplicates_<ts>.csv)
+            dedup_keys (bool): Bölüm işçileri için: e-postaları atlamak yerine
+                kayda dedup_key ekle (karar birleştirmede verilir)
+            log_file (str): Bölüm işçileri için: yeni log dosyası açmak yerine
+                ana sürecin PST log dosyasına ekle (stdout'a yazılmaz)
         """
         self.pst_file_path = Path(pst_file_path)
         self.output_dir = Path(output_dir) if output_dir else self.pst_file_path.parent / "pst_analysis"
         self.pst_file = None
+        self.partitions = max(1, partitions)
+        self.resume = resume
+        self.streaming = streaming or resume or self.partitions > 1
+        self.attachment_workers = attachment_workers
+        self.fields = set(fields or EMAIL_FIELDS)
+        self.body_chars = body_chars
+        self.report_format = report_format
+        self.sqlite = sqlite
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.reader = reader or PypffReader()
+        self.dedup_index_dir = Path(dedup_index) if dedup_index else None
+        self.dedup_keys = dedup_keys
+        self.dedup_index: Optional[DedupIndex] = None
+        self.duplicates_skipped = 0
+        self._duplicates_file = None
+        self._duplicates_writer = None
+        # Dizine kaydedilen PST yolu (open_dedup_index)
+        self._dedup_pst: Optional[str] = None
+        self.metrics = ExtractionMetrics()
+        # generate_statistics sonrası e-posta istatistikleri (dizin özeti için)
+        self.email_stats: Optional[StatisticsSink] = None
+        self.attachment_store: Optional[AttachmentStore] = None
         
         # Çıktı dizinini oluştur
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Logging yapılandırması
-        self._setup_logging()
+        self._setup_logging(log_file)
         
         # Analiz sonuçları
         self.analysis_results = {
@@ -48,22 +1874,68 @@ class PSTAnalyzer:
             'notes': [],
             'journal': [],
             'attachments': [],
+            'folders': [],
             'statistics': {}
         }
+        
+        # Klasör dizini: path, name, item_count, container_class, index_path
+        self.folder_index: List[Dict] = []
+        
+        # Kaldığı yerden devam: mesajları tamamen işlenmiş klasörler ("0/2/1")
+        self.completed_folders = set()
+        self._folder_complete_hook = None
     
-    def _setup_logging(self):
-        """Logging yapılandırması"""
-        log_file = self.output_dir / f"pst_analysis_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    def _setup_logging(self, log_file: str = None):
+        """
+        Analize özel logger kurar. Kayıtlar kuyruğa konur; biçimlendirme ve
+        dosya/stdout yazımı QueueListener thread'inde yapılır, böylece yavaş
+        stdout veya ağ diski çıkarmayı yavaşlatmaz. Her PST kendi
+        pst_analysis_<ts>.log dosyasına yazar; uyarılar RateLimitFilter ile
+        sınırlanır. Süreç genelinde logging yapılandırılmışsa (işçi süreçler,
+        gömülü kullanım) kayıtlar kök logger'a da iletilir ve stdout'a ayrıca
+        yazılmaz. log_file verilmişse (bölüm işçileri) kayıtlar o dosyaya
+        eklenir; stdout'a ana süreç yazar.
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        Args:
+            log_file (str): Eklenecek mevcut log dosyası (None ise yeni dosya)
+        """
+        if log_file:
+            self.log_file = Path(log_file)
+        else:
+            self.log_file = self.output_dir / f"pst_analysis_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        
+        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        handlers = [file_handler]
+        if not log_file and not logging.getLogger().handlers:
+            handlers.append(logging.StreamHandler(sys.stdout))
+        formatter = logging.Formatter(LOG_FORMAT)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._log_listener.start()
+        self._log_rate_filter = RateLimitFilter()
+        
+        self.logger = logging.getLogger(f"{__name__}.{self.pst_file_path.stem}.{uuid.uuid4().hex[:8]}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(_LocalQueueHandler(log_queue))
+        self.logger.addFilter(self._log_rate_filter)
+    
+    def close_logging(self):
+        """Kuyruktaki kayıtları yazar, dinleyiciyi ve log dosyasını kapatır"""
+        if self._log_listener is None:
+            return
+        if self._log_rate_filter.suppressed_total:
+            self.logger.info(f"Toplam {self._log_rate_filter.suppressed_total} uyarı hız sınırı nedeniyle bastırıldı")
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            handler.close()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        # Logger yöneticide kalmasın (dizin analizinde PST başına bir logger)
+        logging.Logger.manager.loggerDict.pop(self.logger.name, None)
+        self._log_listener = None
     
     def open_pst_file(self) -> bool:
         """
@@ -73,12 +1945,11 @@ class PSTAnalyzer:
             bool: Başarılı ise True
         """
         try:
-            if not self.pst_file_path.exists():
+            if self.reader.requires_file and not self.pst_file_path.exists():
                 self.logger.error(f"PST dosyası bulunamadı: {self.pst_file_path}")
                 return False
             
-            self.pst_file = pypff.file()
-            self.pst_file.open(str(self.pst_file_path))
+            self.pst_file = self.reader.open(self.pst_file_path)
             
             self.logger.info(f"PST dosyası başarıyla açıldı: {self.pst_file_path}")
             
@@ -99,6 +1970,12 @@ class PSTAnalyzer:
             self.logger.error(f"PST dosyası açılamadı: {e}")
             return False
     
+    def close_attachment_store(self):
+        """Bekleyen ek dosyası yazımlarını tamamlar"""
+        if self.attachment_store:
+            self.attachment_store.close()
+            self.attachment_store = None
+    
     def close_pst_file(self):
         """PST dosyasını kapatır"""
         if self.pst_file:
@@ -116,38 +1993,295 @@ class PSTAnalyzer:
         Returns:
             List[Dict]: E-posta listesi
         """
-        emails = []
+        return list(self.iter_emails(folder, parent_path))
+    
+    def iter_emails(self, folder=None, parent_path="") -> Iterator[Dict]:
+        """
+        E-postaları tek tek üretir; extract_emails ile aynı sırayı izler
+        fakat hiçbir listeyi bellekte tutmaz
         
+        Args:
+            folder: Analiz edilecek klasör (None ise root)
+            parent_path: Üst klasör yolu
+            
+        Yields:
+            Dict: E-posta verisi
+        """
+        for section, data in self.iter_items(folder, parent_path):
+            if section == 'emails':
+                yield data
+    
+    def iter_items(self, folder=None, parent_path="", index_path: Tuple[int, ...] = ()) -> Iterator[Tuple[str, Dict]]:
+        """
+        Klasör ağacını tek geçişte dolaşır; her mesaj yalnızca bir kez okunur ve
+        message_class değerine göre ilgili çıkarıcıya (e-posta, kişi, takvim,
+        görev, not, günlük) yönlendirilir. Dolaşırken klasör dizini de kurulur.
+        
+        Args:
+            folder: Analiz edilecek klasör (None ise root)
+            parent_path: Üst klasör yolu
+            index_path: Klasörün root'tan itibaren alt klasör sıra numaraları
+            
+        Yields:
+            Tuple[str, Dict]: (rapor bölümü, kayıt)
+        """
         try:
             if folder is None:
                 folder = self.pst_file.root_folder
+                self.folder_index = []
                 self.logger.info("E-posta çıkarma işlemi başlatıldı...")
             
             # Alt klasörleri işle
-            for sub_folder in folder.sub_folders:
+            for i, sub_folder in enumerate(folder.sub_folders):
                 folder_path = f"{parent_path}/{sub_folder.name}" if parent_path else sub_folder.name
+                sub_index_path = index_path + (i,)
                 self.logger.info(f"Klasör işleniyor: {folder_path}")
-                emails.extend(self.extract_emails(sub_folder, folder_path))
+                self._index_folder(sub_folder, folder_path, sub_index_path)
+                yield from self.iter_items(sub_folder, folder_path, sub_index_path)
             
-            # Mesajları işle
-            for message in folder.sub_messages:
-                try:
-                    email_data = self._extract_single_email(message, parent_path)
-                    if email_data:
-                        emails.append(email_data)
-                        
-                except Exception as e:
-                    self.logger.warning(f"E-posta işlenirken hata: {e}")
-                    continue
+            # Mesajları işle (önceki çalışmada tamamlanmış klasörler atlanır)
+            folder_key = '/'.join(str(i) for i in index_path)
+            if folder_key not in self.completed_folders:
+                yield from self._iter_folder_items(folder, parent_path)
+                # Tüketici son öğeyi işledikten sonra buraya gelinir
+                if self._folder_complete_hook:
+                    self._folder_complete_hook(folder_key)
             
         except Exception as e:
-            self.logger.error(f"E-posta çıkarma hatası: {e}")
+            self.logger.error(f"E-posta çıkarma hatası: {e}")
+    
+    def _iter_folder_items(self, folder, folder_path: str, start: int = 0,
+                           stop: Optional[int] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Klasörün kendi mesajlarını (alt klasörler hariç) işler
+        
+        Args:
+            folder: pypff klasör objesi
+            folder_path: Klasör yolu
+            start, stop: İşlenecek mesaj aralığı (stop None ise sona kadar)
+        """
+        if start == 0 and stop is None:
+            messages = folder.sub_messages
+        elif hasattr(folder, 'get_sub_message'):
+            messages = (folder.get_sub_message(i) for i in range(start, stop))
+        else:
+            messages = itertools.islice(folder.sub_messages, start, stop)
+        
+        metrics = self.metrics
+        started = time.perf_counter()
+        message_count = 0
+        message_bytes = 0
+        messages = iter(messages)
+        if self.dedup_index:
+            messages = self._iter_unique_messages(messages, folder_path)
+        while True:
+            with metrics.stage('traversal'):
+                message = next(messages, None)
+            if message is None:
+                break
+            message_count += 1
+            try:
+                with metrics.stage('properties'):
+                    section = _item_section(getattr(message, 'message_class', ''))
+                    if section == 'emails':
+                        data = self._extract_single_email(message, folder_path)
+                        if data and self.dedup_keys:
+                            data['dedup_key'] = message_dedup_key(message).hex()
+                    else:
+                        data = self._item_extractors[section](message)
+                if data:
+                    if section == 'emails':
+                        message_bytes += data.get('size') or 0
+                    yield section, data
+                    
+            except Exception as e:
+                self.logger.warning(f"E-posta işlenirken hata: {e}")
+                continue
+        
+        # Süreye tüketicinin (yazıcıların) harcadığı süre de dahildir
+        metrics.record_folder(folder_path, message_count, message_bytes, time.perf_counter() - started)
+    
+    def _iter_unique_messages(self, messages: Iterator, folder_path: str) -> Iterator:
+        """
+        Mesajları DEDUP_BATCH_SIZE'lık gruplar halinde okur; gruptaki
+        e-postaların anahtarlarını dizinde tek işlemde kontrol eder ve başka
+        bir PST dosyasında görülmüş olanları gövdeleri okunmadan atlar
+        """
+        while True:
+            batch = list(itertools.islice(messages, DEDUP_BATCH_SIZE))
+            if not batch:
+                return
+            with self.metrics.stage('properties'):
+                keys = [
+                    message_dedup_key(message)
+                    if _item_section(getattr(message, 'message_class', '')) == 'emails' else None
+                    for message in batch
+                ]
+                first_seen = self.dedup_index.check_batch(
+                    [(key, folder_path) for key in keys if key is not None], self._dedup_pst)
+            for message, key in zip(batch, keys):
+                if key in first_seen:
+                    self._record_duplicate(key, folder_path, self._decode(getattr(message, 'subject', '')),
+                                           self._decode(getattr(message, 'sender_email_address', '')),
+                                           first_seen[key])
+                    continue
+                yield message
+    
+    def _record_duplicate(self, key: bytes, folder_path: str, subject, sender_email,
+                          first_seen: Tuple[str, str]):
+        """Atlanan yinelenen mesajı duplicates_<ts>.csv dosyasına yazar"""
+        self.duplicates_skipped += 1
+        if self._duplicates_writer is None:
+            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            self._duplicates_file = open(self.output_dir / f"duplicates_{timestamp}.csv", 'w', newline='', encoding='utf-8')
+            self._duplicates_writer = csv.DictWriter(self._duplicates_file, fieldnames=DUPLICATE_CSV_FIELDNAMES)
+            self._duplicates_writer.writeheader()
+        self._duplicates_writer.writerow({
+            'key': key.hex(),
+            'folder': folder_path,
+            'subject': subject,
+            'sender_email': sender_email,
+            'first_pst': first_seen[0],
+            'first_folder': first_seen[1]
+        })
+    
+    def open_dedup_index(self):
+        """Yinelenen mesaj dizinini açar (dedup_index verilmişse)"""
+        if self.dedup_index_dir and self.dedup_index is None:
+            self.dedup_index = DedupIndex(self.dedup_index_dir, logger=self.logger)
+            self._dedup_pst = str(self.pst_file_path.resolve())
+    
+    def close_dedup_index(self):
+        """Yinelenen mesaj dizinini ve duplicates_<ts>.csv dosyasını kapatır"""
+        if self.dedup_index:
+            self.dedup_index.close()
+            self.dedup_index = None
+        if self._duplicates_file:
+            self._duplicates_file.close()
+            self._duplicates_file = None
+            self._duplicates_writer = None
+            self.logger.info(f"Yinelenen {self.duplicates_skipped} e-posta atlandı")
+    
+    @property
+    def _item_extractors(self) -> Dict[str, Any]:
+        """E-posta dışındaki bölümlerin tekil öğe çıkarıcıları"""
+        return {
+            'contacts': self._extract_contact,
+            'calendar': self._extract_calendar_event,
+            'tasks': self._extract_task,
+            'notes': self._extract_note,
+            'journal': self._extract_journal_entry,
+        }
+    
+    def iter_unit_items(self, unit: WorkUnit) -> Iterator[Tuple[str, Dict]]:
+        """
+        Bir iş parçasındaki öğeleri üretir
+        
+        Args:
+            unit (WorkUnit): plan_partitions ile üretilmiş iş parçası
+        """
+        folder = self.pst_file.root_folder
+        for index in unit.index_path:
+            folder = _get_sub_folder(folder, index)
+        
+        if unit.recursive:
+            yield from self.iter_items(folder, unit.folder_path, unit.index_path)
+        else:
+            yield from self._iter_folder_items(folder, unit.folder_path, unit.start, unit.stop)
+    
+    def _index_folder(self, folder, folder_path: str, index_path: Tuple[int, ...]) -> Dict:
+        """Klasörü klasör dizinine ekler"""
+        entry = {
+            'path': folder_path,
+            'name': getattr(folder, 'name', '') or '',
+            'item_count': getattr(folder, 'number_of_sub_messages', 0) or 0,
+            'container_class': str(getattr(folder, 'container_class', '') or ''),
+            'index_path': list(index_path)
+        }
+        self.folder_index.append(entry)
+        return entry
+    
+    def build_folder_index(self) -> List[Dict]:
+        """
+        Mesajları okumadan klasör dizinini kurar
+        
+        Returns:
+            List[Dict]: Klasör dizini
+        """
+        self.folder_index = []
+        self._scan_folder_tree(self.pst_file.root_folder)
+        return self.folder_index
+    
+    def _scan_folder_tree(self, folder, index_path: Tuple[int, ...] = (), folder_path: str = "") -> Dict:
+        """
+        Klasör ağacını bir kez dolaşıp her klasörün mesaj sayısını toplar
+        ve klasör dizinine ekler
+        
+        Returns:
+            Dict: index_path, path, own (kendi mesajları), total (alt ağaç), children
+        """
+        node = {
+            'index_path': index_path,
+            'path': folder_path,
+            'own': getattr(folder, 'number_of_sub_messages', 0) or 0,
+            'children': []
+        }
+        try:
+            for i, sub_folder in enumerate(folder.sub_folders):
+                sub_path = f"{folder_path}/{sub_folder.name}" if folder_path else sub_folder.name
+                self._index_folder(sub_folder, sub_path, index_path + (i,))
+                node['children'].append(self._scan_folder_tree(sub_folder, index_path + (i,), sub_path))
+        except Exception as e:
+            self.logger.warning(f"Klasör taranamadı ({folder_path or '/'}): {e}")
+        node['total'] = node['own'] + sum(child['total'] for child in node['children'])
+        return node
+    
+    def plan_partitions(self, partitions: int) -> List[WorkUnit]:
+        """
+        Klasör ağacını yaklaşık eşit mesaj sayılı iş parçalarına böler.
+        
+        Hedef boyutu aşan alt ağaçlar alt klasörlerine, çok büyük tekil
+        klasörler ise mesaj aralıklarına ayrılır. Parçalar iter_emails ile
+        aynı sırada (önce alt klasörler, sonra klasörün kendi mesajları) döner.
         
-        return emails
+        Args:
+            partitions (int): İşçi sayısı
+            
+        Returns:
+            List[WorkUnit]: Sıralı iş parçaları
+        """
+        self.folder_index = []
+        tree = self._scan_folder_tree(self.pst_file.root_folder)
+        # İşçi başına birkaç parça: dengesiz klasörlerde yük daha iyi dağılır
+        target = max(1, -(-tree['total'] // (partitions * 4)))
+        units: List[WorkUnit] = []
+        
+        def add_unit(node, recursive, count, start=0, stop=None):
+            units.append(WorkUnit(len(units), node['index_path'], node['path'], recursive, count, start, stop))
+        
+        def split(node):
+            if node['total'] <= target:
+                if node['total']:
+                    add_unit(node, True, node['total'])
+                return
+            for child in node['children']:
+                split(child)
+            if node['own'] <= target:
+                if node['own']:
+                    add_unit(node, False, node['own'])
+                return
+            for start in range(0, node['own'], target):
+                stop = min(start + target, node['own'])
+                add_unit(node, False, stop - start, start, stop)
+        
+        split(tree)
+        self.logger.info(f"Bölümleme planı: {tree['total']} mesaj, {len(units)} parça (hedef {target})")
+        return units
     
     def _extract_single_email(self, message, folder_path: str) -> Optional[Dict]:
         """
-        Tek bir e-postayı işler
+        Tek bir e-postayı işler. Yalnızca self.fields içindeki alanlar okunur;
+        gövde ve ek gibi pahalı özellikler seçilmediyse hiç okunmaz.
         
         Args:
             message: pypff message objesi
@@ -157,50 +2291,55 @@ class PSTAnalyzer:
             Optional[Dict]: E-posta verisi
         """
         try:
+            fields = self.fields
+            
+            # ID için gereken özellikler bir kez okunur ve alanlarda tekrar kullanılır
+            raw_subject = getattr(message, 'subject', '')
+            raw_sender_email = getattr(message, 'sender_email_address', '')
+            raw_creation_time = getattr(message, 'creation_time', '')
+            
             # E-posta ID'si oluştur
-            email_id = self._generate_email_id(message)
+            email_id = self._email_id_from(raw_subject, raw_sender_email, raw_creation_time)
+            
+            email_data = {'id': email_id, 'folder': folder_path}
             
             # E-posta verilerini güvenli şekilde al
-            subject = getattr(message, 'subject', '')
-            if isinstance(subject, bytes):
-                subject = subject.decode('utf-8', errors='ignore')
-            
-            sender_name = getattr(message, 'sender_name', '')
-            if isinstance(sender_name, bytes):
-                sender_name = sender_name.decode('utf-8', errors='ignore')
-            
-            sender_email = getattr(message, 'sender_email_address', '')
-            if isinstance(sender_email, bytes):
-                sender_email = sender_email.decode('utf-8', errors='ignore')
-            
-            body_plain = getattr(message, 'plain_text_body', '')
-            if isinstance(body_plain, bytes):
-                body_plain = body_plain.decode('utf-8', errors='ignore')
-            
-            body_html = getattr(message, 'html_body', '')
-            if isinstance(body_html, bytes):
-                body_html = body_html.decode('utf-8', errors='ignore')
-            
-            email_data = {
-                'id': email_id,
-                'folder': folder_path,
-                'subject': subject,
-                'sender_name': sender_name,
-                'sender_email': sender_email,
-                'recipients': self._extract_recipients(message),
-                'delivery_time': self._format_datetime(getattr(message, 'delivery_time', None)),
-                'creation_time': self._format_datetime(getattr(message, 'creation_time', None)),
-                'modification_time': self._format_datetime(getattr(message, 'modification_time', None)),
-                'size': getattr(message, 'size', 0),
-                'body_plain': body_plain[:1000] if body_plain else '',  # İlk 1000 karakter
-                'body_html': body_html[:1000] if body_html else '',     # İlk 1000 karakter
-                'message_class': str(getattr(message, 'message_class', '')),
-                'priority': str(getattr(message, 'priority', '')),
-                'importance': str(getattr(message, 'importance', '')),
-                'attachments': self._extract_attachments(message, email_id),
-                'categories': str(getattr(message, 'categories', '')),
-                'read_flag': getattr(message, 'is_read', False)
-            }
+            if 'subject' in fields:
+                email_data['subject'] = self._decode(raw_subject)
+            if 'sender_name' in fields:
+                email_data['sender_name'] = self._decode(getattr(message, 'sender_name', ''))
+            if 'sender_email' in fields:
+                email_data['sender_email'] = self._decode(raw_sender_email)
+            if 'recipients' in fields:
+                email_data['recipients'] = self._extract_recipients(message)
+            if 'delivery_time' in fields:
+                email_data['delivery_time'] = self._format_datetime(getattr(message, 'delivery_time', None))
+            if 'creation_time' in fields:
+                email_data['creation_time'] = self._format_datetime(raw_creation_time)
+            if 'modification_time' in fields:
+                email_data['modification_time'] = self._format_datetime(getattr(message, 'modification_time', None))
+            if 'size' in fields:
+                email_data['size'] = getattr(message, 'size', 0)
+            if 'body_plain' in fields:
+                email_data['body_plain'] = self._read_body_prefix(message, 'plain_text_body')
+            if 'body_html' in fields:
+                email_data['body_html'] = self._read_body_prefix(message, 'html_body')
+            if 'message_class' in fields:
+                email_data['message_class'] = str(getattr(message, 'message_class', ''))
+            if 'priority' in fields:
+                email_data['priority'] = str(getattr(message, 'priority', ''))
+            if 'importance' in fields:
+                email_data['importance'] = str(getattr(message, 'importance', ''))
+            if 'attachments' in fields:
+                email_data['attachments'] = self._extract_attachments(message, email_id)
+                email_data['attachments_count'] = len(email_data['attachments'])
+            else:
+                # Ek verisine dokunmadan yalnızca sayısı
+                email_data['attachments_count'] = getattr(message, 'number_of_attachments', 0) or 0
+            if 'categories' in fields:
+                email_data['categories'] = str(getattr(message, 'categories', ''))
+            if 'read_flag' in fields:
+                email_data['read_flag'] = getattr(message, 'is_read', False)
             
             return email_data
             
@@ -208,6 +2347,27 @@ class PSTAnalyzer:
             self.logger.warning(f"E-posta veri çıkarma hatası: {e}")
             return None
     
+    def _decode(self, value):
+        """bytes değerleri UTF-8 olarak çözer"""
+        if isinstance(value, bytes):
+            with self.metrics.stage('decode'):
+                return value.decode('utf-8', errors='ignore')
+        return value
+    
+    def _read_body_prefix(self, message, attribute: str) -> str:
+        """
+        Gövdenin yalnızca ilk body_chars karakterini döndürür. Ham veri bytes
+        ise tamamı yerine en fazla body_chars * 4 byte'ı çözülür (UTF-8'de
+        bir karakter en fazla 4 byte).
+        """
+        body = getattr(message, attribute, '')
+        if not body:
+            return ''
+        with self.metrics.stage('decode'):
+            if isinstance(body, bytes):
+                body = body[:self.body_chars * 4].decode('utf-8', errors='ignore')
+            return body[:self.body_chars]
+    
     def _extract_recipients(self, message) -> List[Dict]:
         """E-posta alıcılarını çıkarır"""
         recipients = []
@@ -240,43 +2400,33 @@ class PSTAnalyzer:
                         'name': getattr(attachment, 'name', f'attachment_{i}'),
                         'size': getattr(attachment, 'size', 0),
                         'type': getattr(attachment, 'attachment_type', ''),
+                        'sha256': None,
                         'saved_path': None
                     }
                     
-                    # Ek dosyayı kaydet
-                    saved_path = self._save_attachment(attachment, email_id, i)
-                    if saved_path:
-                        attachment_data['saved_path'] = str(saved_path)
+                    # Ek dosyayı içerik adresli depoya kaydet
+                    stored = self._save_attachment(attachment)
+                    if stored:
+                        attachment_data['sha256'] = stored['sha256']
+                        attachment_data['saved_path'] = str(stored['path'])
                     
                     attachments.append(attachment_data)
-                    self.analysis_results['attachments'].append(attachment_data)
+                    if not self.streaming:
+                        self.analysis_results['attachments'].append(attachment_data)
         
         except Exception as e:
             self.logger.debug(f"Ek dosya çıkarma hatası: {e}")
         
         return attachments
     
-    def _save_attachment(self, attachment, email_id: str, index: int) -> Optional[Path]:
-        """Ek dosyayı kaydeder"""
+    def _save_attachment(self, attachment) -> Optional[Dict]:
+        """Ek dosyayı kaydeder (yazım arka planda tamamlanır)"""
         try:
-            attachments_dir = self.output_dir / "attachments" / email_id
-            attachments_dir.mkdir(parents=True, exist_ok=True)
-            
-            filename = getattr(attachment, 'name', f'attachment_{index}')
-            # Güvenli dosya adı oluştur
-            safe_filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.')).rstrip()
-            if not safe_filename:
-                safe_filename = f'attachment_{index}'
-            
-            file_path = attachments_dir / safe_filename
-            
-            # Dosya verilerini al ve kaydet
-            if hasattr(attachment, 'data'):
-                data = attachment.data
-                if data:
-                    with open(file_path, 'wb') as f:
-                        f.write(data)
-                    return file_path
+            if self.attachment_store is None:
+                self.attachment_store = AttachmentStore(self.output_dir / "attachments",
+                                                        workers=self.attachment_workers, logger=self.logger)
+            with self.metrics.stage('attachments'):
+                return self.attachment_store.save(attachment)
             
         except Exception as e:
             self.logger.warning(f"Ek dosya kaydetme hatası: {e}")
@@ -285,327 +2435,633 @@ class PSTAnalyzer:
     
     def extract_contacts(self) -> List[Dict]:
         """Kişi bilgilerini çıkarır"""
-        contacts = []
-        self.logger.info("Kişi bilgileri çıkarılıyor...")
-        
+        return self._extract_folder_items("Contacts", self._extract_contact, "Kişi bilgileri çıkarılıyor...")
+    
+    def _extract_contact(self, message) -> Optional[Dict]:
+        """Tek bir kişi kaydını işler"""
         try:
-            # Contacts klasörünü bul
-            contacts_folder = self._find_folder_by_name("Contacts")
-            if not contacts_folder:
-                self.logger.warning("Contacts klasörü bulunamadı")
-                return contacts
+            contact_data = {
+                'display_name': getattr(message, 'subject', ''),
+                'email_address': getattr(message, 'sender_email_address', ''),
+                'business_phone': '',
+                'home_phone': '',
+                'mobile_phone': '',
+                'company': '',
+                'job_title': '',
+                'creation_time': self._format_datetime(getattr(message, 'creation_time', None)),
+                'modification_time': self._format_datetime(getattr(message, 'modification_time', None))
+            }
+            
+            # MAPI özelliklerinden daha fazla bilgi al
+            if hasattr(message, 'properties'):
+                for prop in message.properties:
+                    # Telefon numaraları, şirket bilgileri vb.
+                    pass  # MAPI özellik kodları ile genişletilebilir
+            
+            return contact_data
             
-            for message in contacts_folder.sub_messages:
-                try:
-                    contact_data = {
-                        'display_name': getattr(message, 'subject', ''),
-                        'email_address': getattr(message, 'sender_email_address', ''),
-                        'business_phone': '',
-                        'home_phone': '',
-                        'mobile_phone': '',
-                        'company': '',
-                        'job_title': '',
-                        'creation_time': self._format_datetime(getattr(message, 'creation_time', None)),
-                        'modification_time': self._format_datetime(getattr(message, 'modification_time', None))
-                    }
-                    
-                    # MAPI özelliklerinden daha fazla bilgi al
-                    if hasattr(message, 'properties'):
-                        for prop in message.properties:
-                            # Telefon numaraları, şirket bilgileri vb.
-                            pass  # MAPI özellik kodları ile genişletilebilir
-                    
-                    contacts.append(contact_data)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Kişi işleme hatası: {e}")
-                    continue
-        
         except Exception as e:
-            self.logger.error(f"Kişi çıkarma hatası: {e}")
-        
-        return contacts
+            self.logger.warning(f"Kişi işleme hatası: {e}")
+            return None
     
     def extract_calendar(self) -> List[Dict]:
         """Takvim kayıtlarını çıkarır"""
-        calendar_events = []
-        self.logger.info("Takvim kayıtları çıkarılıyor...")
-        
+        return self._extract_folder_items("Calendar", self._extract_calendar_event, "Takvim kayıtları çıkarılıyor...")
+    
+    def _extract_calendar_event(self, message) -> Optional[Dict]:
+        """Tek bir takvim kaydını işler"""
         try:
-            # Calendar klasörünü bul
-            calendar_folder = self._find_folder_by_name("Calendar")
-            if not calendar_folder:
-                self.logger.warning("Calendar klasörü bulunamadı")
-                return calendar_events
+            event_data = {
+                'subject': getattr(message, 'subject', ''),
+                'location': '',
+                'start_time': self._format_datetime(getattr(message, 'creation_time', None)),
+                'end_time': '',
+                'organizer': getattr(message, 'sender_name', ''),
+                'attendees': [],
+                'body': getattr(message, 'plain_text_body', ''),
+                'importance': getattr(message, 'importance', ''),
+                'creation_time': self._format_datetime(getattr(message, 'creation_time', None))
+            }
+            
+            # Takvim özel özelliklerini çıkar
+            if hasattr(message, 'properties'):
+                for prop in message.properties:
+                    # Başlangıç/bitiş zamanları, katılımcılar vb.
+                    pass  # Genişletilebilir
+            
+            return event_data
             
-            for message in calendar_folder.sub_messages:
-                try:
-                    event_data = {
-                        'subject': getattr(message, 'subject', ''),
-                        'location': '',
-                        'start_time': self._format_datetime(getattr(message, 'creation_time', None)),
-                        'end_time': '',
-                        'organizer': getattr(message, 'sender_name', ''),
-                        'attendees': [],
-                        'body': getattr(message, 'plain_text_body', ''),
-                        'importance': getattr(message, 'importance', ''),
-                        'creation_time': self._format_datetime(getattr(message, 'creation_time', None))
-                    }
-                    
-                    # Takvim özel özelliklerini çıkar
-                    if hasattr(message, 'properties'):
-                        for prop in message.properties:
-                            # Başlangıç/bitiş zamanları, katılımcılar vb.
-                            pass  # Genişletilebilir
-                    
-                    calendar_events.append(event_data)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Takvim kaydı işleme hatası: {e}")
-                    continue
-        
         except Exception as e:
-            self.logger.error(f"Takvim çıkarma hatası: {e}")
-        
-        return calendar_events
+            self.logger.warning(f"Takvim kaydı işleme hatası: {e}")
+            return None
     
     def extract_tasks(self) -> List[Dict]:
         """Görev listesini çıkarır"""
-        tasks = []
-        self.logger.info("Görevler çıkarılıyor...")
-        
+        return self._extract_folder_items("Tasks", self._extract_task, "Görevler çıkarılıyor...")
+    
+    def _extract_task(self, message) -> Optional[Dict]:
+        """Tek bir görevi işler"""
         try:
-            # Tasks klasörünü bul
-            tasks_folder = self._find_folder_by_name("Tasks")
-            if not tasks_folder:
-                self.logger.warning("Tasks klasörü bulunamadı")
-                return tasks
+            return {
+                'subject': getattr(message, 'subject', ''),
+                'body': getattr(message, 'plain_text_body', ''),
+                'status': '',
+                'priority': getattr(message, 'priority', ''),
+                'due_date': '',
+                'start_date': '',
+                'completion_date': '',
+                'percent_complete': 0,
+                'creation_time': self._format_datetime(getattr(message, 'creation_time', None))
+            }
             
-            for message in tasks_folder.sub_messages:
-                try:
-                    task_data = {
-                        'subject': getattr(message, 'subject', ''),
-                        'body': getattr(message, 'plain_text_body', ''),
-                        'status': '',
-                        'priority': getattr(message, 'priority', ''),
-                        'due_date': '',
-                        'start_date': '',
-                        'completion_date': '',
-                        'percent_complete': 0,
-                        'creation_time': self._format_datetime(getattr(message, 'creation_time', None))
-                    }
-                    
-                    tasks.append(task_data)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Görev işleme hatası: {e}")
-                    continue
-        
         except Exception as e:
-            self.logger.error(f"Görev çıkarma hatası: {e}")
-        
-        return tasks
+            self.logger.warning(f"Görev işleme hatası: {e}")
+            return None
     
     def extract_notes(self) -> List[Dict]:
         """Notları çıkarır"""
-        notes = []
-        self.logger.info("Notlar çıkarılıyor...")
-        
+        return self._extract_folder_items("Notes", self._extract_note, "Notlar çıkarılıyor...")
+    
+    def _extract_note(self, message) -> Optional[Dict]:
+        """Tek bir notu işler"""
         try:
-            # Notes klasörünü bul
-            notes_folder = self._find_folder_by_name("Notes")
-            if not notes_folder:
-                self.logger.warning("Notes klasörü bulunamadı")
-                return notes
+            return {
+                'subject': getattr(message, 'subject', ''),
+                'body': getattr(message, 'plain_text_body', ''),
+                'creation_time': self._format_datetime(getattr(message, 'creation_time', None)),
+                'modification_time': self._format_datetime(getattr(message, 'modification_time', None)),
+                'color': '',
+                'size': getattr(message, 'size', 0)
+            }
             
-            for message in notes_folder.sub_messages:
-                try:
-                    note_data = {
-                        'subject': getattr(message, 'subject', ''),
-                        'body': getattr(message, 'plain_text_body', ''),
-                        'creation_time': self._format_datetime(getattr(message, 'creation_time', None)),
-                        'modification_time': self._format_datetime(getattr(message, 'modification_time', None)),
-                        'color': '',
-                        'size': getattr(message, 'size', 0)
-                    }
-                    
-                    notes.append(note_data)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Not işleme hatası: {e}")
-                    continue
-        
         except Exception as e:
-            self.logger.error(f"Not çıkarma hatası: {e}")
-        
-        return notes
+            self.logger.warning(f"Not işleme hatası: {e}")
+            return None
     
     def extract_journal(self) -> List[Dict]:
         """Günlük kayıtlarını çıkarır"""
-        journal_entries = []
-        self.logger.info("Günlük kayıtları çıkarılıyor...")
+        return self._extract_folder_items("Journal", self._extract_journal_entry, "Günlük kayıtları çıkarılıyor...")
+    
+    def _extract_journal_entry(self, message) -> Optional[Dict]:
+        """Tek bir günlük kaydını işler"""
+        try:
+            return {
+                'subject': getattr(message, 'subject', ''),
+                'body': getattr(message, 'plain_text_body', ''),
+                'entry_type': '',
+                'start_time': self._format_datetime(getattr(message, 'creation_time', None)),
+                'duration': 0,
+                'companies': '',
+                'contacts': '',
+                'creation_time': self._format_datetime(getattr(message, 'creation_time', None))
+            }
+            
+        except Exception as e:
+            self.logger.warning(f"Günlük kaydı işleme hatası: {e}")
+            return None
+    
+    def _extract_folder_items(self, folder_name: str, extractor, start_message: str) -> List[Dict]:
+        """
+        Belirtilen isimdeki klasörün mesajlarını verilen çıkarıcıyla işler.
+        Tam analizde kullanılmaz (orada iter_items tek geçişte yönlendirir);
+        tek bir bölümün ayrıca çıkarılması için vardır.
+        """
+        items = []
+        self.logger.info(start_message)
         
         try:
-            # Journal klasörünü bul
-            journal_folder = self._find_folder_by_name("Journal")
-            if not journal_folder:
-                self.logger.warning("Journal klasörü bulunamadı")
-                return journal_entries
+            folder = self._find_folder_by_name(folder_name)
+            if not folder:
+                self.logger.warning(f"{folder_name} klasörü bulunamadı")
+                return items
             
-            for message in journal_folder.sub_messages:
-                try:
-                    journal_data = {
-                        'subject': getattr(message, 'subject', ''),
-                        'body': getattr(message, 'plain_text_body', ''),
-                        'entry_type': '',
-                        'start_time': self._format_datetime(getattr(message, 'creation_time', None)),
-                        'duration': 0,
-                        'companies': '',
-                        'contacts': '',
-                        'creation_time': self._format_datetime(getattr(message, 'creation_time', None))
-                    }
-                    
-                    journal_entries.append(journal_data)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Günlük kaydı işleme hatası: {e}")
-                    continue
+            for message in folder.sub_messages:
+                data = extractor(message)
+                if data:
+                    items.append(data)
         
         except Exception as e:
-            self.logger.error(f"Günlük çıkarma hatası: {e}")
+            self.logger.error(f"{folder_name} çıkarma hatası: {e}")
         
-        return journal_entries
+        return items
     
-    def _find_folder_by_name(self, folder_name: str, folder=None):
-        """Belirtilen isimde klasör bulur"""
-        if folder is None:
-            folder = self.pst_file.root_folder
+    def _find_folder_by_name(self, folder_name: str):
+        """
+        Belirtilen isimde klasörü klasör dizininden bulur; ağaç yeniden
+        dolaşılmaz (dizin yoksa bir kez kurulur)
+        """
+        if not self.folder_index:
+            self.build_folder_index()
         
-        # Klasör ismini güvenli şekilde kontrol et
-        try:
-            folder_name_safe = getattr(folder, 'name', '')
-            if folder_name_safe and folder_name_safe.lower() == folder_name.lower():
+        for entry in self.folder_index:
+            if entry['name'].lower() == folder_name.lower():
+                folder = self.pst_file.root_folder
+                for index in entry['index_path']:
+                    folder = _get_sub_folder(folder, index)
                 return folder
-        except (AttributeError, TypeError):
-            pass
-        
-        try:
-            for sub_folder in folder.sub_folders:
-                found = self._find_folder_by_name(folder_name, sub_folder)
-                if found:
-                    return found
-        except (AttributeError, TypeError):
-            pass
         
         return None
     
-    def generate_statistics(self):
-        """Analiz istatistiklerini oluşturur"""
+    def generate_statistics(self, email_stats: StatisticsSink = None):
+        """
+        Analiz istatistiklerini oluşturur
+        
+        Args:
+            email_stats (StatisticsSink): Çıkarma sırasında biriktirilmiş e-posta
+                istatistikleri (None ise analysis_results['emails'] kullanılır)
+        """
+        if email_stats is None:
+            email_stats = StatisticsSink()
+            for email in self.analysis_results['emails']:
+                email_stats.write(email)
+        self.email_stats = email_stats
+        
         stats = {
-            'total_emails': len(self.analysis_results['emails']),
+            'total_emails': email_stats.total_emails,
             'total_contacts': len(self.analysis_results['contacts']),
             'total_calendar_events': len(self.analysis_results['calendar']),
             'total_tasks': len(self.analysis_results['tasks']),
             'total_notes': len(self.analysis_results['notes']),
             'total_journal_entries': len(self.analysis_results['journal']),
-            'total_attachments': len(self.analysis_results['attachments']),
+            'total_attachments': len(self.analysis_results['attachments']) if not self.streaming else email_stats.total_attachments,
             'analysis_date': datetime.datetime.now().isoformat(),
             'pst_file': str(self.pst_file_path),
             'pst_file_size': self.pst_file_path.stat().st_size if self.pst_file_path.exists() else 0
         }
         
-        # E-posta istatistikleri
-        if self.analysis_results['emails']:
-            # Tarih aralığı
-            dates = [email['delivery_time'] for email in self.analysis_results['emails'] if email['delivery_time']]
-            if dates:
-                stats['email_date_range'] = {
-                    'earliest': min(dates),
-                    'latest': max(dates)
-                }
-            
-            # En fazla e-posta gönderen
-            senders = {}
-            for email in self.analysis_results['emails']:
-                sender = email.get('sender_email', 'unknown')
-                senders[sender] = senders.get(sender, 0) + 1
-            
-            if senders:
-                stats['top_senders'] = sorted(senders.items(), key=lambda x: x[1], reverse=True)[:10]
+        if self.dedup_index_dir:
+            stats['duplicates_skipped'] = self.duplicates_skipped
+        
+        # E-posta istatistikleri (tarih aralığı, en fazla e-posta gönderenler)
+        stats.update(email_stats.to_dict())
         
         self.analysis_results['statistics'] = stats
     
-    def save_results(self, format_type: str = 'json'):
-        """Analiz sonuçlarını kaydeder"""
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = None
+    def save_results(self, format_type: str = None):
+        """
+        Analiz sonuçlarını kaydeder. Rapor kayıt kayıt yazılır; sonuçların
+        temizlenmiş bir kopyası çıkarılmaz.
         
-        if format_type.lower() == 'json':
-            output_file = self.output_dir / f"pst_analysis_{timestamp}.json"
-            
-            clean_results = self._clean_for_json(self.analysis_results)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(clean_results, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info(f"JSON sonuçları kaydedildi: {output_file}")
+        Args:
+            format_type (str): json veya ndjson (None ise report_format)
+        """
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        format_type = (format_type or self.report_format).lower()
         
-        # CSV sonuçlarını kaydet
-        self._save_csv_results(timestamp)
+        with self.metrics.stage('serialization'):
+            output_file = self._save_report(timestamp, format_type)
+            self._save_csv_results(timestamp)
+            self._save_sqlite_results(timestamp)
         
         return output_file
     
+    def _save_report(self, timestamp: str, format_type: str) -> Optional[Path]:
+        """Analiz raporunu (json/ndjson) kaydeder"""
+        if format_type not in REPORT_FORMATS:
+            return None
+        
+        report_sink = self._open_report_sink(timestamp, format_type)
+        try:
+            for email in self.analysis_results['emails']:
+                report_sink.write(email)
+            report_sink.finish(self.analysis_results)
+        finally:
+            report_sink.close()
+        
+        self.logger.info(f"Rapor kaydedildi ({self.report_format}): {report_sink.json_file}")
+        return report_sink.json_file
+    
+    def _save_sqlite_results(self, timestamp: str):
+        """E-postaları SQLite veritabanına kaydeder (sqlite açıksa)"""
+        if self.sqlite:
+            sqlite_sink = self._open_sqlite_sink(timestamp)
+            try:
+                for email in self.analysis_results['emails']:
+                    sqlite_sink.write(email)
+                sqlite_sink.finish(self.analysis_results['folders'])
+            finally:
+                sqlite_sink.close()
+            self.logger.info(f"SQLite veritabanı kaydedildi: {sqlite_sink.db_file}")
+    
     def _save_csv_results(self, timestamp: str):
         """CSV formatında sonuçları kaydeder"""
-        import csv
-        
         # E-postalar CSV
         if self.analysis_results['emails']:
-            csv_file = self.output_dir / f"emails_{timestamp}.csv"
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'id', 'folder', 'subject', 'sender_name', 'sender_email',
-                    'delivery_time', 'size', 'attachments_count'
-                ])
-                writer.writeheader()
+            csv_sink = CsvEmailSink(self.output_dir / f"emails_{timestamp}.csv")
+            try:
                 for email in self.analysis_results['emails']:
-                    writer.writerow({
-                        'id': email['id'],
-                        'folder': email['folder'],
-                        'subject': email['subject'],
-                        'sender_name': email['sender_name'],
-                        'sender_email': email['sender_email'],
-                        'delivery_time': email['delivery_time'],
-                        'size': email['size'],
-                        'attachments_count': len(email['attachments'])
+                    csv_sink.write(email)
+            finally:
+                csv_sink.close()
+            
+            self.logger.info(f"E-posta CSV kaydedildi: {csv_sink.csv_file}")
+    
+    def _load_checkpoint(self, mode: str, **expected) -> Optional[Dict]:
+        """
+        Yarım kalmış çalışmanın kontrol noktasını yükler. PST dosyası veya
+        çalışma şekli değiştiyse kontrol noktası geçersizdir.
+        """
+        if not self.resume:
+            return None
+        checkpoint = _load_json_file(self.output_dir / CHECKPOINT_FILE)
+        if not checkpoint or checkpoint.get('mode') != mode:
+            return None
+        if any(checkpoint.get(key) != value for key, value in expected.items()):
+            return None
+        if not self.reader.same_source(checkpoint.get('fingerprint'), self.pst_file_path):
+            self.logger.info("PST dosyası değişmiş, kontrol noktası yok sayılıyor")
+            return None
+        return checkpoint
+    
+    def _save_checkpoint(self, checkpoint: Dict):
+        """Kontrol noktasını atomik olarak yazar"""
+        checkpoint['updated_at'] = datetime.datetime.now().isoformat()
+        _write_json_atomic(self.output_dir / CHECKPOINT_FILE, checkpoint)
+    
+    def _clear_checkpoint(self):
+        """Başarılı analiz sonrası kontrol noktasını siler"""
+        (self.output_dir / CHECKPOINT_FILE).unlink(missing_ok=True)
+    
+    def _open_report_sink(self, timestamp: str, format_type: str = None, state: Dict = None):
+        """
+        Analiz raporu yazıcısını açar (pst_analysis_<ts>.json / .ndjson)
+        
+        Args:
+            timestamp (str): Çıktı dosyası zaman damgası
+            format_type (str): json veya ndjson (None ise report_format)
+            state (Dict): Kontrol noktasından devam durumu
+        """
+        sink_class, extension = REPORT_FORMATS[format_type or self.report_format]
+        report_file = self.output_dir / f"pst_analysis_{timestamp}.{extension}"
+        if sink_class is JsonResultSink:
+            spool_file = report_file.with_suffix('.attachments.tmp') if self.resume else None
+            return JsonResultSink(report_file, spool_file=spool_file, state=state)
+        return sink_class(report_file, state=state)
+    
+    def _open_sqlite_sink(self, timestamp: str, state: Dict = None) -> Optional[SqliteEmailSink]:
+        """SQLite yazıcısını açar (sqlite kapalıysa None)"""
+        if not self.sqlite:
+            return None
+        return SqliteEmailSink(self.output_dir / f"emails_{timestamp}.sqlite", state=state)
+    
+    def _close_sinks(self, sinks: List[EmailSink], failed: bool, resumable: bool = True):
+        """
+        Yazıcıları kapatır; bir yazıcının hatası diğerlerinin kapanmasını
+        engellemez. Başarısız çalışmada, kaldığı yerden devam için kontrol
+        noktası yoksa (veya resumable False ise) yarım çıktılar silinir.
+        
+        Args:
+            sinks (List[EmailSink]): Kapatılacak yazıcılar
+            failed (bool): Çalışma hata ile mi bitti
+            resumable (bool): Çıktılar kontrol noktasından devam edilerek tamamlanabilir mi
+        """
+        keep = not failed or (resumable and self.resume and (self.output_dir / CHECKPOINT_FILE).exists())
+        error = None
+        for sink in sinks:
+            try:
+                if keep:
+                    sink.close()
+                else:
+                    sink.discard()
+            except Exception as e:
+                self.logger.warning(f"Çıktı yazıcısı kapatılamadı ({type(sink).__name__}): {e}")
+                error = error or e
+        if error and not failed:
+            raise error
+    
+    def _worker_options(self) -> Dict[str, Any]:
+        """Bölüm işçilerindeki PSTAnalyzer'a aktarılan seçenekler"""
+        return {
+            'attachment_workers': self.attachment_workers,
+            'fields': [name for name in EMAIL_FIELDS if name in self.fields],
+            'body_chars': self.body_chars,
+            'reader': self.reader,
+            # Yinelenen kontrolü birleştirmede plan sırasıyla yapılır
+            'dedup_keys': self.dedup_index_dir is not None,
+            # İşçi kayıtları PST'nin tek log dosyasına eklenir
+            'log_file': str(self.log_file),
+        }
+    
+    def _stream_results_partitioned(self) -> Path:
+        """
+        Klasör ağacını iş parçalarına bölüp işçi süreçlerde paralel çıkarır,
+        ardından ara dosyaları plan sırasıyla emails_<ts>.csv ve JSON
+        raporunda birleştirir. resume açıksa tamamlanmış parçalar atlanır.
+        
+        Returns:
+            Path: Rapor dosyası (json veya ndjson)
+        """
+        checkpoint = self._load_checkpoint('partitioned', partitions=self.partitions)
+        if checkpoint:
+            timestamp = checkpoint['timestamp']
+            self.logger.info(f"Yarım kalan bölümlü çalışmadan devam ediliyor ({timestamp})")
+        else:
+            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            if self.resume:
+                self._save_checkpoint({
+                    'mode': 'partitioned',
+                    'partitions': self.partitions,
+                    'timestamp': timestamp,
+                    'fingerprint': self.reader.fingerprint(self.pst_file_path)
+                })
+        
+        units = self.plan_partitions(self.partitions)
+        parts_dir = self.output_dir / f"parts_{timestamp}"
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        
+        pending = [unit for unit in units if not (parts_dir / f"part_{unit.index:05d}.done.json").exists()]
+        if len(pending) < len(units):
+            self.logger.info(f"{len(units) - len(pending)} parça önceki çalışmada tamamlanmış, atlanıyor")
+        groups = _balance_units(pending, self.partitions)
+        if groups:
+            try:
+                with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+                    futures = [
+                        executor.submit(_extract_partition, str(self.pst_file_path), str(self.output_dir),
+                                        str(parts_dir), group, **self._worker_options())
+                        for group in groups
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+            except BaseException:
+                # Tamamlanmış parçalar yalnızca resume ile yeniden kullanılır
+                if not self.resume:
+                    shutil.rmtree(parts_dir, ignore_errors=True)
+                raise
+        
+        # Parça istatistiklerini ve e-posta dışı öğeleri plan sırasıyla topla
+        stats_sink = StatisticsSink()
+        for unit in units:
+            done = _load_json_file(parts_dir / f"part_{unit.index:05d}.done.json")
+            stats_sink.merge(StatisticsSink(state=done['stats']))
+            self.metrics.merge(ExtractionMetrics(state=done.get('metrics')))
+            for section, items in done['items'].items():
+                self.analysis_results[section].extend(items)
+        
+        # Ara dosyaları birleştir
+        csv_file = self.output_dir / f"emails_{timestamp}.csv"
+        sinks = []
+        failed = True
+        try:
+            json_sink = self._open_report_sink(timestamp)
+            sinks.append(json_sink)
+            sqlite_sink = self._open_sqlite_sink(timestamp)
+            if sqlite_sink:
+                sinks.append(sqlite_sink)
+            if self.dedup_index:
+                # Yinelenenler birleştirmede atlandığından CSV ve istatistikler
+                # parça dosyalarından kopyalanmaz, yeniden üretilir
+                stats_sink = StatisticsSink()
+                sinks += [CsvEmailSink(csv_file), stats_sink]
+            if stats_sink.total_emails:
+                with open(csv_file, 'w', newline='', encoding='utf-8') as out:
+                    csv.DictWriter(out, fieldnames=EMAIL_CSV_FIELDNAMES).writeheader()
+                    for unit in units:
+                        part_csv = parts_dir / f"part_{unit.index:05d}.csv"
+                        if not part_csv.exists():
+                            # Parçada e-posta yoksa CSV hiç açılmamıştır
+                            continue
+                        with open(part_csv, 'r', newline='', encoding='utf-8') as part:
+                            shutil.copyfileobj(part, out)
+            
+            for unit in units:
+                with open(parts_dir / f"part_{unit.index:05d}.jsonl", 'r', encoding='utf-8') as part:
+                    while True:
+                        emails = [json.loads(line) for line in itertools.islice(part, DEDUP_BATCH_SIZE)]
+                        if not emails:
+                            break
+                        if self.dedup_index:
+                            keys = [bytes.fromhex(email.pop('dedup_key')) for email in emails]
+                            first_seen = self.dedup_index.check_batch(
+                                [(key, email['folder']) for key, email in zip(keys, emails)], self._dedup_pst)
+                            for key, email in zip(keys, emails):
+                                if key in first_seen:
+                                    self._record_duplicate(key, email['folder'], email.get('subject', ''),
+                                                           email.get('sender_email', ''), first_seen[key])
+                            emails = [email for key, email in zip(keys, emails) if key not in first_seen]
+                        with self.metrics.stage('serialization'):
+                            for email in emails:
+                                for sink in sinks:
+                                    sink.write(email)
+            
+            self.analysis_results['folders'] = self.folder_index
+            self.generate_statistics(stats_sink)
+            with self.metrics.stage('serialization'):
+                json_sink.finish(self.analysis_results)
+                if sqlite_sink:
+                    sqlite_sink.finish(self.folder_index)
+            failed = False
+        finally:
+            # Birleştirme yeniden başlatmada parça dosyalarından baştan yapılır
+            self._close_sinks(sinks, failed, resumable=False)
+            if failed:
+                csv_file.unlink(missing_ok=True)
+                if not self.resume:
+                    shutil.rmtree(parts_dir, ignore_errors=True)
+        
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        self._clear_checkpoint()
+        
+        if stats_sink.total_emails:
+            self.logger.info(f"E-posta CSV kaydedildi: {csv_file} ({stats_sink.total_emails} kayıt)")
+        if sqlite_sink:
+            self.logger.info(f"SQLite veritabanı kaydedildi: {sqlite_sink.db_file}")
+        self.logger.info(f"Rapor kaydedildi ({self.report_format}): {json_sink.json_file}")
+        return json_sink.json_file
+    
+    def _stream_results(self) -> Path:
+        """
+        E-postaları çıkarırken CSV, JSON ve istatistik yazıcılarına aktarır.
+        Bellekte yalnızca o an işlenen e-posta bulunur.
+        
+        resume açıksa her klasör tamamlandığında (en fazla CHECKPOINT_INTERVAL
+        saniyede bir) yazıcıların durumu kontrol noktasına kaydedilir; yeniden
+        başlatılan çalışma aynı dosyalara, tamamlanmış klasörleri atlayarak devam eder.
+        
+        Returns:
+            Path: Rapor dosyası (json veya ndjson)
+        """
+        checkpoint = self._load_checkpoint('streaming')
+        sink_states = checkpoint['sinks'] if checkpoint else {}
+        timestamp = checkpoint['timestamp'] if checkpoint else datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        if self.resume:
+            fingerprint = checkpoint['fingerprint'] if checkpoint else self.reader.fingerprint(self.pst_file_path)
+        sinks = []
+        failed = True
+        try:
+            csv_sink = CsvEmailSink(self.output_dir / f"emails_{timestamp}.csv", state=sink_states.get('csv'))
+            sinks.append(csv_sink)
+            json_sink = self._open_report_sink(timestamp, state=sink_states.get('json'))
+            sinks.append(json_sink)
+            stats_sink = StatisticsSink(state=sink_states.get('stats'))
+            sinks.append(stats_sink)
+            sqlite_sink = self._open_sqlite_sink(timestamp, state=sink_states.get('sqlite'))
+            if sqlite_sink:
+                sinks.append(sqlite_sink)
+            
+            if checkpoint:
+                self.completed_folders = set(checkpoint['completed_folders'])
+                self.duplicates_skipped = checkpoint.get('duplicates_skipped', 0)
+                for section, items in checkpoint['sections'].items():
+                    self.analysis_results[section] = items
+                self.logger.info(f"Yarım kalan çalışmadan devam ediliyor ({timestamp}): "
+                                 f"{len(self.completed_folders)} klasör, {csv_sink.count} e-posta tamamlanmış")
+            
+            if self.resume:
+                last_saved = [0.0]
+                
+                def save_progress(folder_key: str):
+                    self.completed_folders.add(folder_key)
+                    now = time.monotonic()
+                    if now - last_saved[0] < CHECKPOINT_INTERVAL:
+                        return
+                    last_saved[0] = now
+                    if self.attachment_store:
+                        self.attachment_store.flush()
+                    self._save_checkpoint({
+                        'mode': 'streaming',
+                        'timestamp': timestamp,
+                        'fingerprint': fingerprint,
+                        'completed_folders': sorted(self.completed_folders),
+                        'duplicates_skipped': self.duplicates_skipped,
+                        'sinks': {
+                            'csv': csv_sink.checkpoint(),
+                            'json': json_sink.checkpoint(),
+                            'stats': stats_sink.checkpoint(),
+                            'sqlite': sqlite_sink.checkpoint() if sqlite_sink else None
+                        },
+                        'sections': {
+                            section: self.analysis_results[section]
+                            for section in ('contacts', 'calendar', 'tasks', 'notes', 'journal')
+                        }
                     })
+                
+                self._folder_complete_hook = save_progress
             
-            self.logger.info(f"E-posta CSV kaydedildi: {csv_file}")
+            for section, data in self.iter_items():
+                if section == 'emails':
+                    with self.metrics.stage('serialization'):
+                        for sink in sinks:
+                            sink.write(data)
+                else:
+                    self.analysis_results[section].append(data)
+            
+            self.analysis_results['folders'] = self.folder_index
+            self.generate_statistics(stats_sink)
+            with self.metrics.stage('serialization'):
+                json_sink.finish(self.analysis_results)
+                if sqlite_sink:
+                    sqlite_sink.finish(self.folder_index)
+            failed = False
+        finally:
+            self._folder_complete_hook = None
+            self._close_sinks(sinks, failed)
+        
+        self._clear_checkpoint()
+        
+        if csv_sink.count:
+            self.logger.info(f"E-posta CSV kaydedildi: {csv_sink.csv_file} ({csv_sink.count} kayıt)")
+        if sqlite_sink:
+            self.logger.info(f"SQLite veritabanı kaydedildi: {sqlite_sink.db_file}")
+        self.logger.info(f"Rapor kaydedildi ({self.report_format}): {json_sink.json_file}")
+        return json_sink.json_file
     
     def perform_full_analysis(self) -> bool:
-        """Tam analiz gerçekleştirir"""
+        """
+        Tam analiz gerçekleştirir; ardından çıkarma metriklerini
+        metrics_<ts>.json dosyasına yazar (profile/trace_memory açıksa
+        profil ve bellek raporlarını da)
+        """
+        profiler = cProfile.Profile() if self.profile else None
+        if self.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            return self._run_full_analysis()
+        finally:
+            if profiler:
+                profiler.disable()
+            self._save_metrics(time.perf_counter() - started, profiler)
+            self.close_logging()
+    
+    def _run_full_analysis(self) -> bool:
+        """Analiz adımlarını çalıştırır"""
         try:
             self.logger.info("=== PST DOSYASI TAM ANALİZİ BAŞLATILIYOR ===")
             
             # PST dosyasını aç
             if not self.open_pst_file():
                 return False
+            self.open_dedup_index()
             
-            # Tüm verileri çıkar
-            self.analysis_results['emails'] = self.extract_emails()
-            self.analysis_results['contacts'] = self.extract_contacts()
-            self.analysis_results['calendar'] = self.extract_calendar()
-            self.analysis_results['tasks'] = self.extract_tasks()
-            self.analysis_results['notes'] = self.extract_notes()
-            self.analysis_results['journal'] = self.extract_journal()
-            
-            # İstatistikleri oluştur
-            self.generate_statistics()
+            if self.partitions > 1:
+                # Klasör ağacını işçi süreçlere bölerek çıkar
+                output_file = self._stream_results_partitioned()
+            elif self.streaming:
+                # E-postaları akış halinde çıkar ve doğrudan kaydet
+                output_file = self._stream_results()
+            else:
+                # Tüm verileri tek geçişte çıkar ve bölümlere yönlendir;
+                # istatistikler çıkarma sırasında biriktirilir
+                email_stats = StatisticsSink()
+                for section, data in self.iter_items():
+                    self.analysis_results[section].append(data)
+                    if section == 'emails':
+                        email_stats.write(data)
+                self.analysis_results['folders'] = self.folder_index
+                
+                # İstatistikleri oluştur
+                self.generate_statistics(email_stats)
+                
+                # Sonuçları kaydet
+                output_file = self.save_results()
             
-            # Sonuçları kaydet
-            output_file = self.save_results()
-            
-            # PST dosyasını kapat
+            # Bekleyen ek yazımlarını tamamla ve PST dosyasını kapat
+            with self.metrics.stage('attachments'):
+                self.close_attachment_store()
+            self.close_dedup_index()
             self.close_pst_file()
             
             # Başarı mesajı
@@ -616,16 +3072,70 @@ class PSTAnalyzer:
             
         except Exception as e:
             self.logger.error(f"Analiz hatası: {e}")
+            self.close_attachment_store()
+            self.close_dedup_index()
             if self.pst_file:
                 self.close_pst_file()
             return False
     
+    def _save_metrics(self, wall_seconds: float, profiler: cProfile.Profile = None):
+        """
+        metrics_<ts>.json dosyasını yazar: PST ve klasör bazında mesaj/sn ve
+        byte/sn, aşama süreleri, tepe bellek ve en yavaş klasörler
+        
+        Args:
+            wall_seconds (float): Analizin toplam süresi
+            profiler (cProfile.Profile): profile açıksa toplanmış profil
+        """
+        try:
+            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            metrics = self.metrics.to_dict(wall_seconds)
+            metrics['pst_file'] = str(self.pst_file_path)
+            
+            if profiler:
+                profile_file = self.output_dir / f"profile_{timestamp}.prof"
+                profiler.dump_stats(str(profile_file))
+                with open(self.output_dir / f"profile_{timestamp}.txt", 'w', encoding='utf-8') as f:
+                    pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(PROFILE_TOP)
+                metrics['profile_file'] = str(profile_file)
+            
+            if self.trace_memory and tracemalloc.is_tracing():
+                snapshot = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                report_file = self.output_dir / f"tracemalloc_{timestamp}.txt"
+                with open(report_file, 'w', encoding='utf-8') as f:
+                    f.write(f"Anlık: {current:,} byte, tepe: {peak:,} byte\n\n")
+                    for stat in snapshot.statistics('lineno')[:TRACEMALLOC_TOP]:
+                        f.write(f"{stat}\n")
+                metrics['tracemalloc'] = {'current_bytes': current, 'peak_bytes': peak, 'report_file': str(report_file)}
+            
+            metrics_file = self.output_dir / f"metrics_{timestamp}.json"
+            with open(metrics_file, 'w', encoding='utf-8') as f:
+                json.dump(metrics, f, ensure_ascii=False, indent=2)
+            
+            pst = metrics['pst']
+            peak_rss = metrics['peak_rss_bytes']
+            self.logger.info(f"Metrikler kaydedildi: {metrics_file} "
+                             f"({pst['messages']} mesaj, {pst['seconds']:.2f} sn, "
+                             f"{pst['messages_per_sec'] or 0:.1f} mesaj/sn, "
+                             f"{(pst['bytes_per_sec'] or 0) / (1024 * 1024):.2f} MiB/sn"
+                             + (f", tepe bellek {peak_rss / (1024 * 1024):.1f} MiB)" if peak_rss else ")"))
+        except Exception as e:
+            self.logger.warning(f"Metrikler kaydedilemedi: {e}")
+    
     # Yardımcı metodlar
     def _generate_email_id(self, message) -> str:
         """E-posta için benzersiz ID oluşturur"""
+        return self._email_id_from(getattr(message, 'subject', ''),
+                                   getattr(message, 'sender_email_address', ''),
+                                   getattr(message, 'creation_time', ''))
+    
+    def _email_id_from(self, subject, sender_email, creation_time) -> str:
+        """Önceden okunmuş ham özelliklerden e-posta ID'si oluşturur"""
         try:
             # Subject, sender ve creation time'dan hash oluştur
-            content = f"{getattr(message, 'subject', '')}{getattr(message, 'sender_email_address', '')}{getattr(message, 'creation_time', '')}"
+            content = f"{subject}{sender_email}{creation_time}"
             return hashlib.md5(content.encode()).hexdigest()[:16]
         except:
             return f"email_{datetime.datetime.now().timestamp()}"
@@ -640,52 +3150,123 @@ class PSTAnalyzer:
             return str(dt)
         except:
             return str(dt)
-    
-    def _clean_for_json(self, data):
-        """JSON serileştirme için veriyi temizler"""
-        if isinstance(data, bytes):
-            try:
-                return data.decode('utf-8', errors='ignore')
-            except:
-                return str(data)
-        elif isinstance(data, dict):
-            return {key: self._clean_for_json(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._clean_for_json(item) for item in data]
-        elif hasattr(data, '__dict__'):
-            return str(data)
-        else:
-            return data
 
 
-def analyze_pst_file(pst_file_path: str, output_dir: str = None) -> bool:
+def analyze_pst_file(pst_file_path: str, output_dir: str = None, **options) -> bool:
     """
     PST dosyasını analiz eden ana fonksiyon
     
     Args:
         pst_file_path (str): .pst dosyasının yolu
         output_dir (str): Çıktı dizini
+        **options: PSTAnalyzer seçenekleri (streaming, partitions, ...)
         
     Returns:
         bool: Başarılı ise True
     """
-    analyzer = PSTAnalyzer(pst_file_path, output_dir)
-    return analyzer.perform_full_analysis()
+    return _analyze_pst(pst_file_path, output_dir, **options)[0]
+
+
+def _analyze_pst(pst_file_path: str, output_dir: str = None, **options) -> Tuple[bool, Optional[Dict]]:
+    """
+    analyze_pst_file gibi; ayrıca dizin özeti için dosyanın e-posta
+    istatistiklerini (StatisticsSink durumu) döndürür
+    """
+    analyzer = PSTAnalyzer(pst_file_path, output_dir, **options)
+    success = analyzer.perform_full_analysis()
+    email_stats = analyzer.email_stats.checkpoint() if success and analyzer.email_stats else None
+    return success, email_stats
+
+
+def _init_worker(log_dir: str):
+    """
+    Süreç havuzundaki her işçi için ayrı log dosyası yapılandırır; dosyaya
+    yazım kuyruk dinleyicisinin thread'inde yapılır
+    
+    Args:
+        log_dir (str): Log dosyalarının yazılacağı dizin
+    """
+    log_file = Path(log_dir) / f"extract_worker_{os.getpid()}.log"
+    handler = logging.FileHandler(log_file, encoding='utf-8')
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    # İşçi süreç kapanırken kuyrukta kalan kayıtlar da yazılsın
+    # (havuz süreçlerinde atexit çalışmaz)
+    multiprocessing.util.Finalize(None, listener.stop, exitpriority=10)
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+
+def _file_output_dir(pst_file: Path, output_dir: str = None) -> Path:
+    """Her .pst dosyası için ayrı çıktı dizinini döndürür"""
+    return Path(output_dir) / pst_file.stem if output_dir else pst_file.parent / f"{pst_file.stem}_analysis"
+
+
+def _write_directory_summary(output_root: Path, directory: Path, pst_stats: Dict[str, Dict]) -> Path:
+    """
+    PST dosyalarının e-posta istatistiklerini birleştirip
+    directory_summary_<ts>.json dosyasına yazar
+    
+    Args:
+        output_root (Path): Çıktı kök dizini
+        directory (Path): Analiz edilen dizin
+        pst_stats (Dict[str, Dict]): PST yolu -> StatisticsSink durumu
+    
+    Returns:
+        Path: Özet dosyası
+    """
+    merged = StatisticsSink()
+    pst_files = {}
+    for pst_path, state in sorted(pst_stats.items()):
+        stats = StatisticsSink(state=state)
+        merged.merge(stats)
+        pst_files[pst_path] = {
+            'total_emails': stats.total_emails,
+            'total_attachments': stats.total_attachments,
+            'total_email_bytes': stats.total_bytes
+        }
+    
+    summary = {
+        'directory': str(directory),
+        'generated_at': datetime.datetime.now().isoformat(),
+        'pst_count': len(pst_files),
+        'total_emails': merged.total_emails,
+        'total_attachments': merged.total_attachments,
+        'pst_files': pst_files
+    }
+    summary.update(merged.to_dict())
+    
+    output_root.mkdir(parents=True, exist_ok=True)
+    summary_file = output_root / f"directory_summary_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary_file
 
 
-def analyze_directory(directory_path: str, output_dir: str = None) -> List[str]:
+def analyze_directory(directory_path: str, output_dir: str = None, workers: int = 1,
+                      incremental: bool = False, **options) -> List[str]:
     """
     Dizindeki tüm .pst dosyalarını analiz eder
     
     Args:
         directory_path (str): .pst dosyalarının bulunduğu dizin
         output_dir (str): Çıktı dizini
+        workers (int): Paralel işçi süreç sayısı (1 ise sıralı işlenir)
+        incremental (bool): Manifestteki haliyle değişmemiş dosyaları atla,
+            yarım kalmış dosyalara kaldığı yerden devam et
+        **options: Her dosya için PSTAnalyzer seçenekleri (streaming, partitions, ...)
         
     Returns:
         List[str]: İşlenen dosya listesi
     """
     directory = Path(directory_path)
     processed_files = []
+    failed_files = []
     
     if not directory.exists():
         print(f"Dizin bulunamadı: {directory}")
@@ -700,24 +3281,127 @@ def analyze_directory(directory_path: str, output_dir: str = None) -> List[str]:
     
     print(f"{len(pst_files)} adet .pst dosyası bulundu")
     
-    for pst_file in pst_files:
-        print(f"\nİşleniyor: {pst_file.name}")
-        
-        # Her dosya için ayrı çıktı dizini
-        file_output_dir = Path(output_dir) / pst_file.stem if output_dir else pst_file.parent / f"{pst_file.stem}_analysis"
-        
-        success = analyze_pst_file(str(pst_file), str(file_output_dir))
-        
+    output_root = Path(output_dir) if output_dir else directory
+    manifest_path = output_root / MANIFEST_FILE
+    manifest = {}
+    # PST yolu -> e-posta istatistikleri (dizin özeti için)
+    pst_stats: Dict[str, Dict] = {}
+    if incremental:
+        options['resume'] = True
+        manifest = _load_json_file(manifest_path, {})
+        unchanged = [
+            pst_file for pst_file in pst_files
+            if _same_pst(manifest.get(str(pst_file.resolve()), {}).get('fingerprint'), pst_file)
+            and _file_output_dir(pst_file, output_dir).exists()
+        ]
+        for pst_file in unchanged:
+            print(f"- Değişmemiş, atlanıyor: {pst_file.name}")
+            recorded_stats = manifest[str(pst_file.resolve())].get('stats')
+            if recorded_stats:
+                pst_stats[str(pst_file.resolve())] = recorded_stats
+        pst_files = [pst_file for pst_file in pst_files if pst_file not in unchanged]
+    
+    def record_result(pst_file: Path, success: bool, email_stats: Optional[Dict]):
         if success:
             processed_files.append(str(pst_file))
             print(f"✓ Başarıyla işlendi: {pst_file.name}")
+            if email_stats:
+                pst_stats[str(pst_file.resolve())] = email_stats
+            if incremental:
+                manifest[str(pst_file.resolve())] = {
+                    'fingerprint': pst_fingerprint(pst_file),
+                    'output_dir': str(_file_output_dir(pst_file, output_dir)),
+                    'completed_at': datetime.datetime.now().isoformat(),
+                    'stats': email_stats
+                }
+                manifest_path.parent.mkdir(parents=True, exist_ok=True)
+                _write_json_atomic(manifest_path, manifest)
         else:
+            failed_files.append(str(pst_file))
             print(f"✗ İşlenemedi: {pst_file.name}")
     
+    if workers > 1 and pst_files:
+        # En büyük dosyalar önce: uzun süren işler sona kalıp havuzu bekletmesin
+        pst_files.sort(key=lambda p: p.stat().st_size, reverse=True)
+        log_dir = Path(output_dir) if output_dir else directory
+        log_dir.mkdir(parents=True, exist_ok=True)
+        print(f"{workers} işçi süreç ile paralel işleniyor (işçi logları: {log_dir})")
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(log_dir),)) as executor:
+            futures = {
+                executor.submit(_analyze_pst, str(pst_file),
+                                str(_file_output_dir(pst_file, output_dir)), **options): pst_file
+                for pst_file in pst_files
+            }
+            for future in as_completed(futures):
+                pst_file = futures[future]
+                try:
+                    success, email_stats = future.result()
+                except Exception as e:
+                    print(f"İşçi hatası ({pst_file.name}): {e}")
+                    success, email_stats = False, None
+                
+                record_result(pst_file, success, email_stats)
+    else:
+        for pst_file in pst_files:
+            print(f"\nİşleniyor: {pst_file.name}")
+            
+            # Her dosya için ayrı çıktı dizini
+            file_output_dir = _file_output_dir(pst_file, output_dir)
+            
+            success, email_stats = _analyze_pst(str(pst_file), str(file_output_dir), **options)
+            
+            record_result(pst_file, success, email_stats)
+    
+    if pst_stats:
+        summary_file = _write_directory_summary(output_root, directory, pst_stats)
+        print(f"Dizin özeti: {summary_file}")
+    
+    print(f"\nToplam: {len(processed_files)} başarılı, {len(failed_files)} başarısız")
+    for failed in failed_files:
+        print(f"  ✗ {failed}")
+    
     return processed_files
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="PST dosyalarından e-posta metadata çıkarımı")
+    parser.add_argument('-d', '--data-dir', default='data', help='.pst dosyalarının bulunduğu dizin')
+    parser.add_argument('-o', '--output-dir', default='metadata', help='Çıktı dizini')
+    parser.add_argument('--streaming', action='store_true', help='E-postaları bellekte tutmadan doğrudan CSV/JSON dosyalarına yaz')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Paralel işlenecek .pst dosyası sayısı (süreç havuzu)')
+    parser.add_argument('-p', '--pst-workers', type=int, default=1, help='Tek bir .pst dosyasının klasör ağacını bölüp paralel işleyen süreç sayısı')
+    parser.add_argument('--attachment-workers', type=int, default=4, help='Ek dosyalarını diske yazan arka plan thread sayısı')
+    parser.add_argument('--incremental', action='store_true', help='Değişmemiş .pst dosyalarını atla, yarım kalanlara kaldığı yerden devam et')
+    parser.add_argument('--fields', type=resolve_fields, default=None,
+                        help="Okunacak e-posta alanları: profil (full, metadata) veya virgülle ayrılmış liste, ör. id,folder,subject,size")
+    parser.add_argument('--body-chars', type=int, default=BODY_PREFIX_CHARS, help='Gövde alanlarında saklanacak en fazla karakter')
+    parser.add_argument('--report-format', choices=sorted(REPORT_FORMATS), default='json',
+                        help='Analiz raporu biçimi: json (girintili) veya ndjson (satır başına bir kayıt)')
+    parser.add_argument('--sqlite', action='store_true',
+                        help='E-postaları alıcı, ek ve klasör tablolarıyla emails_<ts>.sqlite veritabanına da yaz')
+    parser.add_argument('--profile', action='store_true',
+                        help='Her PST analizini cProfile ile profille (profile_<ts>.prof ve .txt)')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='Bellek ayırmalarını tracemalloc ile izle (tracemalloc_<ts>.txt)')
+    parser.add_argument('--dedup-index', default=None,
+                        help='Yinelenen mesaj dizini klasörü: başka bir PST dosyasında görülmüş e-postaları atla')
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    data_directory = "data"
-    output_directory = "metadata"
-    processed = analyze_directory(data_directory, output_directory)
+    args = parse_args()
+    if not _PYPFF_AVAILABLE:
+        print("HATA: pypff kütüphanesi bulunamadı!")
+        print("Kurulum için: pip install pypff")
+        print("Veya: conda install -c conda-forge pypff")
+        sys.exit(1)
+    processed = analyze_directory(args.data_dir, args.output_dir, workers=args.workers,
+                                  incremental=args.incremental,
+                                  streaming=args.streaming, partitions=args.pst_workers,
+                                  attachment_workers=args.attachment_workers,
+                                  fields=args.fields, body_chars=args.body_chars,
+                                  report_format=args.report_format, sqlite=args.sqlite,
+                                  profile=args.profile, trace_memory=args.tracemalloc,
+                                  dedup_index=args.dedup_index)